@@ -11,35 +11,54 @@ Following Tufte's principles:
 - Show the data
 """
 
-from components.stack import StackElement, Stack, AnimatedStack
-from components.hash import HashMachine, DataBox, HashVisualization, AvalancheEffect
-from components.tree import HashNode, MerkleTree, MerkleProofVisualization, BinaryTreeGeneric
-from components.signature import KeyPair, SignatureProcess, VerificationProcess, EllipticCurve, PointAddition
+import importlib
 
-__all__ = [
+# Public name -> module that defines it. Nothing is imported until a name is
+# first used, so `from components import KeyPair` loads signature.py only
+# (deps.py reads this table too)
+_EXPORTS = {
     # Stack components
-    'StackElement',
-    'Stack',
-    'AnimatedStack',
+    'StackElement': 'stack',
+    'Stack': 'stack',
+    'AnimatedStack': 'stack',
 
     # Hash components
-    'HashMachine',
-    'DataBox',
-    'HashVisualization',
-    'AvalancheEffect',
+    'HashMachine': 'hash',
+    'DataBox': 'hash',
+    'HashVisualization': 'hash',
+    'AvalancheEffect': 'hash',
 
     # Tree components
-    'HashNode',
-    'MerkleTree',
-    'MerkleProofVisualization',
-    'BinaryTreeGeneric',
+    'HashNode': 'tree',
+    'MerkleTree': 'tree',
+    'MerkleProofVisualization': 'tree',
+    'BinaryTreeGeneric': 'tree',
 
     # Signature components
-    'KeyPair',
-    'SignatureProcess',
-    'VerificationProcess',
-    'EllipticCurve',
-    'PointAddition',
-]
+    'KeyPair': 'signature',
+    'SignatureProcess': 'signature',
+    'VerificationProcess': 'signature',
+    'EllipticCurve': 'signature',
+    'PointAddition': 'signature',
+
+    # Text components
+    'HexString': 'hexstring',
+    'BulletList': 'bullets',
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = '0.1.0'
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'components' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"components.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,222 @@
+"""
+Render benchmark suite with a stored baseline
+
+Renders a fixed, representative set of scenes at a fixed quality several
+times, each run from an empty media directory so no cache is reused, and
+records wall time, CPU time (of the manim subprocess), frames per second
+and output size. Results are compared with benchmarks/baseline.json and
+the run fails when a scene regresses beyond the tolerance.
+
+Timings are machine-dependent: refresh the baseline with --update-baseline
+on the machine that gates (and commit it) whenever that machine changes.
+Until a baseline is recorded nothing is compared and the run only fails
+on broken renders; once it has entries, a scene missing from it fails.
+
+Usage:
+    python -m components.benchmark
+    python -m components.benchmark --runs 5 --tolerance 0.10
+    python -m components.benchmark --only BuildingMerkleTree
+    python -m components.benchmark --update-baseline
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from components.cache import manim_version
+from components.render import RenderJob, render_job
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+BASELINE_PATH = os.path.join('benchmarks', 'baseline.json')
+BENCH_MEDIA_ROOT = os.path.join('media', 'benchmark')
+
+# (scene file, scene): a component example, a tree build, curve math and
+# a text-heavy encoding slide
+BENCHMARKS = [
+    ("components/stack.py", "StackExample"),
+    ("scenes/phase1/04_merkle_trees_intro.py", "BuildingMerkleTree"),
+    ("scenes/phase1/08_elliptic_curves_math.py", "VisualizingScalarMultiplication"),
+    ("scenes/phase1/14_encoding.py", "Bech32Format"),
+]
+
+QUALITY = "l"
+FORMAT = "mp4"
+RUNS = 3
+TOLERANCE = 0.15
+SIZE_TOLERANCE = 0.10
+
+
+def count_frames(path):
+    """Number of video frames in path, via ffprobe (None if unavailable)"""
+    if not shutil.which("ffprobe"):
+        return None
+    proc = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", "-count_packets",
+         "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", path],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        return int(proc.stdout.strip())
+    except ValueError:
+        return None
+
+
+def _children_cpu():
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_benchmark(scene_file, scene, runs=RUNS, quality=QUALITY, fmt=FORMAT):
+    """Render one scene runs times from a cold media dir; returns its metrics"""
+    job = RenderJob(scene_file, scene, f"{scene}.{fmt}", quality, fmt)
+    output_dir = os.path.join(BENCH_MEDIA_ROOT, "output")
+    walls, cpus = [], []
+    result = None
+
+    for _ in range(runs):
+        shutil.rmtree(job.media_dir(BENCH_MEDIA_ROOT), ignore_errors=True)
+        cpu_before = _children_cpu()
+        result = render_job(job, output_dir, BENCH_MEDIA_ROOT, checkpoint=False, prewarm=False)
+        if not result.ok:
+            return {"ok": False, "error": result.error, "log": result.log[-2000:]}
+        walls.append(result.seconds)
+        cpus.append(_children_cpu() - cpu_before)
+
+    wall = statistics.median(walls)
+    frames = count_frames(result.path)
+    return {
+        "ok": True,
+        "runs": runs,
+        "wall": round(wall, 3),
+        "wall_min": round(min(walls), 3),
+        "cpu": round(statistics.median(cpus), 3),
+        "frames": frames,
+        "fps": round(frames / wall, 2) if frames else None,
+        "size": result.size,
+    }
+
+
+def environment():
+    """What the numbers depend on, stored next to them"""
+    return {
+        "manim": manim_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "quality": QUALITY,
+        "format": FORMAT,
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(os.path.join(REPO_ROOT, path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"environment": {}, "benchmarks": {}}
+
+
+def compare(name, current, baseline, tolerance=TOLERANCE, size_tolerance=SIZE_TOLERANCE):
+    """Regression messages for one benchmark (empty when within tolerance)"""
+    problems = []
+    for metric in ("wall", "cpu"):
+        before, after = baseline.get(metric), current.get(metric)
+        if before and after and after > before * (1 + tolerance):
+            problems.append(f"{name}: {metric} {before:.2f}s -> {after:.2f}s "
+                            f"(+{(after / before - 1) * 100:.0f}%, tolerance {tolerance * 100:.0f}%)")
+    before, after = baseline.get("size"), current.get("size")
+    if before and after and abs(after - before) > before * size_tolerance:
+        problems.append(f"{name}: size {before / 1024:.0f} KB -> {after / 1024:.0f} KB "
+                        f"(tolerance {size_tolerance * 100:.0f}%)")
+    return problems
+
+
+def _delta(after, before):
+    if not before or after is None:
+        return ""
+    return f"{(after / before - 1) * 100:+5.0f}%"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark representative renders against a baseline")
+    parser.add_argument("--runs", type=int, default=RUNS, help=f"Renders per scene (default: {RUNS})")
+    parser.add_argument("--only", nargs="+", default=[], help="Only these scene classes")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"Allowed slowdown as a fraction (default: {TOLERANCE})")
+    parser.add_argument("--size-tolerance", type=float, default=SIZE_TOLERANCE,
+                        help=f"Allowed output size change as a fraction (default: {SIZE_TOLERANCE})")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help=f"Baseline JSON (default: {BASELINE_PATH})")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the baseline")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results to PATH")
+    args = parser.parse_args(argv)
+
+    benchmarks = [(f, s) for f, s in BENCHMARKS if not args.only or s in args.only]
+    baseline = load_baseline(args.baseline)
+    env = environment()
+
+    print("=========================================")
+    print(f"Benchmarking {len(benchmarks)} scenes x {args.runs} runs (-q{QUALITY}, {FORMAT})")
+    print("=========================================")
+
+    results, problems = {}, []
+    for scene_file, scene in benchmarks:
+        start = time.time()
+        current = run_benchmark(scene_file, scene, args.runs)
+        results[scene] = current
+        if not current["ok"]:
+            problems.append(f"{scene}: render failed - {current['error']}")
+            print(f"  ✗ {scene:<34} {current['error']}")
+            continue
+
+        before = baseline["benchmarks"].get(scene, {})
+        fps = f"{current['fps']:6.1f} fps" if current["fps"] else "     - fps"
+        print(f"  {scene:<36} wall {current['wall']:7.2f}s {_delta(current['wall'], before.get('wall')):>6}"
+              f"  cpu {current['cpu']:7.2f}s {_delta(current['cpu'], before.get('cpu')):>6}"
+              f"  {fps}  {current['size'] / 1024:8.1f} KB  ({time.time() - start:.0f}s)")
+        if before:
+            problems += compare(scene, current, before, args.tolerance, args.size_tolerance)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"environment": env, "benchmarks": results}, f, indent=2)
+
+    if args.update_baseline:
+        ok = {scene: metrics for scene, metrics in results.items() if metrics["ok"]}
+        baseline = {"environment": env, "benchmarks": dict(baseline["benchmarks"], **ok)}
+        path = os.path.join(REPO_ROOT, args.baseline)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"✓ Updated {args.baseline}")
+        return 0 if len(ok) == len(results) else 1
+
+    print("")
+    differing = {k: (baseline["environment"].get(k), v) for k, v in env.items()
+                 if baseline["environment"].get(k) not in (None, v)}
+    for key, (before, after) in differing.items():
+        print(f"! Baseline was recorded with {key}={before}, this run has {after}")
+    missing = [scene for scene, current in results.items()
+               if current["ok"] and scene not in baseline["benchmarks"]]
+    if missing and baseline["benchmarks"]:
+        problems.append(f"No baseline for {', '.join(missing)}; record one with --update-baseline")
+    elif missing:
+        print("! No baseline recorded yet, nothing compared; record one with --update-baseline")
+
+    for problem in problems:
+        print(f"✗ {problem}")
+    if not problems:
+        print("✓ No regressions")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
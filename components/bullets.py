@@ -0,0 +1,42 @@
+"""
+Bullet lists revealed in a single animation
+
+Summary slides used to reveal their points one play() at a time:
+
+    for point in summary:
+        self.play(FadeIn(point), run_time=0.8)
+        self.wait(0.8)
+
+Every play() and wait() is its own partial movie file and ffmpeg run.
+BulletList.show() plays the same reveal as one LaggedStart, each line
+starting run_time + wait after the previous one, and merges the last
+line's wait into the pause that follows. The slide keeps its pacing but
+renders as two segments instead of 2N.
+"""
+from manim import *
+
+
+def lagged_reveal(mobjects, animation=FadeIn, run_time=0.8, wait=0.8):
+    """One animation revealing mobjects in turn, timed like a play(run_time) + wait(wait) per mobject"""
+    return LaggedStart(
+        *[animation(mobject, run_time=run_time) for mobject in mobjects],
+        lag_ratio=(run_time + wait) / run_time,
+    )
+
+
+class BulletList(VGroup):
+    """Lines stacked top to bottom and left aligned, revealed together by show()"""
+
+    def __init__(self, *lines, buff=0.4, aligned_edge=LEFT, **kwargs):
+        super().__init__(*lines, **kwargs)
+        self.arrange(DOWN, aligned_edge=aligned_edge, buff=buff)
+
+    def reveal(self, animation=FadeIn, run_time=0.8, wait=0.8):
+        """The reveal as a single animation, for playing alongside others"""
+        return lagged_reveal(self.submobjects, animation, run_time, wait)
+
+    def show(self, scene, animation=FadeIn, run_time=0.8, wait=0.8, hold=0):
+        """Play the reveal, then the last line's wait and hold as one wait"""
+        scene.play(self.reveal(animation, run_time, wait))
+        if wait + hold:
+            scene.wait(wait + hold)
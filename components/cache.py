@@ -0,0 +1,178 @@
+"""
+Content-addressed render cache
+
+A render is keyed by everything that can change its output: the scene
+source, the components modules the scene class uses (see deps.py), the manim
+version, the output-affecting manim.cfg settings and the job parameters.
+Artifacts are stored on disk under that key and evicted least-recently-used
+once the cache exceeds its size or entry budget.
+"""
+import configparser
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from components.deps import DependencyGraph
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Persistent cache root, mounted into the build container by CI
+CACHE_ROOT = os.environ.get("RENDER_CACHE_DIR", os.path.join(REPO_ROOT, '.render-cache'))
+CACHE_DIR = os.path.join(CACHE_ROOT, 'renders')
+MAX_BYTES = 500 * 1024 * 1024
+MAX_ENTRIES = 500
+
+# manim.cfg keys that never change the rendered pixels
+IGNORED_CFG_KEYS = {
+    "media_dir", "preview", "verbosity", "disable_caching", "flush_cache", "max_files_cached", "tex_dir",
+}
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def manim_version():
+    """Installed manim version, without importing manim"""
+    try:
+        from importlib.metadata import version
+        return version("manim")
+    except Exception:
+        return "unknown"
+
+
+def manim_cfg_settings(cfg_path=os.path.join(REPO_ROOT, 'manim.cfg')):
+    """Output-affecting [CLI] settings from manim.cfg"""
+    parser = configparser.ConfigParser()
+    parser.read(cfg_path)
+    if not parser.has_section("CLI"):
+        return {}
+    return {
+        key: value
+        for key, value in sorted(parser.items("CLI"))
+        if key not in IGNORED_CFG_KEYS
+    }
+
+
+def render_key(scene_file, scene, output, quality="l", fmt="gif", graph=None, reproducible=False):
+    """Cache key for rendering scene from scene_file"""
+    graph = graph or DependencyGraph()
+    h = hashlib.sha256()
+
+    params = {
+        "scene": scene,
+        "output": output,
+        "quality": quality,
+        "format": fmt,
+        "manim": manim_version(),
+        "cfg": manim_cfg_settings(),
+    }
+    # Only added when set, so existing keys stay valid
+    if reproducible:
+        params["reproducible"] = True
+    h.update(json.dumps(params, sort_keys=True).encode())
+
+    sources = [os.path.join(REPO_ROOT, scene_file)] + graph.component_sources(scene_file, scene)
+    for path in sources:
+        h.update(os.path.relpath(path, REPO_ROOT).encode())
+        h.update(_sha256_file(path).encode())
+
+    return h.hexdigest()
+
+
+class RenderCache:
+    """On-disk artifact store with LRU eviction"""
+
+    def __init__(self, root=CACHE_DIR, max_bytes=MAX_BYTES, max_entries=MAX_ENTRIES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def _entry_dir(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def _read_meta(self, entry_dir):
+        try:
+            with open(os.path.join(entry_dir, "meta.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, entry_dir, meta):
+        tmp = os.path.join(entry_dir, "meta.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, os.path.join(entry_dir, "meta.json"))
+
+    def fetch(self, key, destination):
+        """Copy a cached artifact to destination. Returns True on a hit"""
+        entry_dir = self._entry_dir(key)
+        meta = self._read_meta(entry_dir)
+        if meta is None:
+            return False
+
+        artifact = os.path.join(entry_dir, meta["artifact"])
+        if not os.path.exists(artifact) or os.path.getsize(artifact) != meta["size"]:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return False
+
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+        shutil.copyfile(artifact, destination)
+
+        meta["last_used"] = time.time()
+        self._write_meta(entry_dir, meta)
+        return True
+
+    def store(self, key, path, **info):
+        """Store a rendered artifact under key, then enforce the budget"""
+        entry_dir = self._entry_dir(key)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        artifact = os.path.basename(path)
+        shutil.copyfile(path, os.path.join(entry_dir, artifact))
+
+        now = time.time()
+        meta = dict(info, key=key, artifact=artifact, size=os.path.getsize(path),
+                    created=now, last_used=now)
+        self._write_meta(entry_dir, meta)
+
+        self.evict()
+
+    def entries(self):
+        """All (entry_dir, meta) pairs currently in the cache"""
+        if not os.path.isdir(self.root):
+            return []
+
+        found = []
+        for prefix in os.listdir(self.root):
+            prefix_dir = os.path.join(self.root, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for key in os.listdir(prefix_dir):
+                entry_dir = os.path.join(prefix_dir, key)
+                meta = self._read_meta(entry_dir)
+                if meta is None:
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                    continue
+                found.append((entry_dir, meta))
+        return found
+
+    def evict(self):
+        """Drop least-recently-used entries until within budget"""
+        entries = sorted(self.entries(), key=lambda e: e[1]["last_used"])
+        total = sum(meta["size"] for _, meta in entries)
+
+        evicted = 0
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            entry_dir, meta = entries.pop(0)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= meta["size"]
+            evicted += 1
+        return evicted
@@ -0,0 +1,192 @@
+"""
+Checkpoint and resume for long scene renders
+
+manim writes one partial movie per play() and, with caching enabled, skips
+any play() whose partial already exists, fast-forwarding construct() over
+it. A killed or failed render therefore only needs two things to resume
+where it stopped: the job's media directory kept as it was, and certainty
+about which partials are complete. A partial that was being written when
+the process died has a valid-looking name but truncated contents, and
+manim would happily reuse it.
+
+This module runs manim's CLI in-process with hooks on the scene file
+writer. Every partial is recorded in <media_dir>/checkpoint.json as
+"writing" when its stream opens and moved to "completed" (with its size)
+when it closes. Before a rerun, prepare() deletes the partial that was
+mid-write and any completed one whose size no longer matches. Everything
+else is reused by manim's own cache.
+
+Python-side scene state is not serialized. Updaters, closures and
+generators in construct() aren't picklable, and replaying construct() over
+cached partials costs about the same as a dry run.
+
+Usage (render.py does this for every job):
+    python -m components.checkpoint --checkpoint media/render/x/checkpoint.json -- -ql scene.py Scene
+    python -m components.checkpoint --status media/render/04_merkle_tree
+    python -m components.checkpoint --seed 0 -- -ql scene.py Scene   # seeded, no checkpoint
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from components.hooks import wrap_method
+from components.reproducible import seeded_scenes
+
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+def checkpoint_path(media_dir):
+    return os.path.join(media_dir, CHECKPOINT_FILE)
+
+
+def load(media_dir):
+    """Checkpoint state for a job media dir ({} if there is none)"""
+    try:
+        with open(checkpoint_path(media_dir)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class Checkpoint:
+    """Record partial movie files as they are opened and completed"""
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {}
+        self.state.setdefault("completed", {})
+        self.state["writing"] = None
+
+    def _save(self):
+        self.state["updated"] = time.time()
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def begin(self, path, index):
+        self.state["writing"] = {"file": path, "index": index}
+        self._save()
+
+    def end(self, path, index):
+        self.state["writing"] = None
+        if os.path.exists(path):
+            self.state["completed"][path] = {"index": index, "size": os.path.getsize(path)}
+        self._save()
+
+
+def completed_files(media_dir):
+    """Basenames of partials known to be fully written"""
+    return {os.path.basename(path) for path in load(media_dir).get("completed", {})}
+
+
+def resume_point(media_dir):
+    """Number of animations a rerun in media_dir can reuse"""
+    return len(load(media_dir).get("completed", {}))
+
+
+def prepare(media_dir):
+    """Remove partials a previous run left incomplete. Returns the removed paths"""
+    state = load(media_dir)
+    removed = []
+
+    writing = state.get("writing")
+    if writing and os.path.exists(writing["file"]):
+        os.remove(writing["file"])
+        removed.append(writing["file"])
+
+    for path, entry in state.get("completed", {}).items():
+        if os.path.exists(path) and os.path.getsize(path) != entry["size"]:
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+def clear(media_dir):
+    """Forget the checkpoint after a successful render"""
+    path = checkpoint_path(media_dir)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+@contextlib.contextmanager
+def checkpointing(path):
+    """Record every partial movie written inside the block to the checkpoint at path"""
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    checkpoint = Checkpoint(path)
+
+    def current(writer):
+        index = writer.renderer.num_plays
+        return writer.partial_movie_files[index], index
+
+    def on_begin(begin_animation):
+        def wrapper(writer, allow_write=False, *args, **kwargs):
+            if allow_write:
+                checkpoint.begin(*current(writer))
+            return begin_animation(writer, allow_write, *args, **kwargs)
+        return wrapper
+
+    def on_end(end_animation):
+        def wrapper(writer, allow_write=False, *args, **kwargs):
+            outcome = end_animation(writer, allow_write, *args, **kwargs)
+            if allow_write:
+                checkpoint.end(*current(writer))
+            return outcome
+        return wrapper
+
+    with wrap_method(SceneFileWriter, "begin_animation", on_begin), \
+            wrap_method(SceneFileWriter, "end_animation", on_end):
+        yield checkpoint
+
+
+def run_manim(args, path=None, seed=None):
+    """
+    Run the manim CLI in this process, checkpointing every partial movie to
+    path (if given). With seed, every scene starts from seeded RNGs.
+    """
+    from manim.__main__ import main as manim_main
+
+    with contextlib.ExitStack() as stack:
+        if path:
+            stack.enter_context(checkpointing(path))
+        if seed is not None:
+            stack.enter_context(seeded_scenes(seed))
+        return manim_main.main(args=args, prog_name="manim")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run manim with checkpointing, or inspect a checkpoint")
+    parser.add_argument("--checkpoint", help="Checkpoint file to maintain while rendering")
+    parser.add_argument("--status", metavar="MEDIA_DIR", help="Show the checkpoint for a job media dir")
+    parser.add_argument("--seed", type=int, help="Seed random and numpy before every scene (reproducible.py)")
+    parser.add_argument("manim_args", nargs=argparse.REMAINDER, help="Arguments for manim (after --)")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        state = load(args.status)
+        if not state:
+            print(f"No checkpoint in {args.status}")
+            return 0
+        print(f"{len(state['completed'])} animations complete, last update "
+              f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(state.get('updated', 0)))}")
+        if state.get("writing"):
+            print(f"Interrupted while writing animation {state['writing']['index']}: {state['writing']['file']}")
+        return 0
+
+    manim_args = args.manim_args[1:] if args.manim_args[:1] == ["--"] else args.manim_args
+    if not (args.checkpoint or args.seed is not None) or not manim_args:
+        parser.error("--checkpoint or --seed, and manim arguments are required")
+    return run_manim(manim_args, args.checkpoint, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Geometric complexity budget analyzer
+
+Cairo's per-frame cost grows with what is on screen: bezier points,
+submobjects, stroked and filled paths, and text glyphs (each one a filled
+path). This analyzer dry-runs a scene (see dryrun.py) and measures the
+full scene at the start of every animation, i.e. everything that is drawn
+on each of that animation's frames. Animations over budget are flagged
+before anyone waits for a render.
+
+Usage:
+    python -m components.complexity scenes/phase1/04_merkle_trees_intro.py
+    python -m components.complexity --budget points=50000 glyphs=800 --strict
+    python -m components.complexity scenes/phase1/14_encoding.py --details --top 10
+"""
+import argparse
+import json
+import os
+import sys
+
+from components.dryrun import dry_run_scene
+from components.hooks import caller_location
+from components.manifest import discover
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Per-frame limits; a 1024-leaf MerkleTree is several times over each
+BUDGET = {
+    "points": 100000,
+    "submobjects": 4000,
+    "paths": 2000,
+    "glyphs": 1500,
+}
+
+TOP = 5
+
+
+def _is_text(mobject):
+    from manim import MarkupText, SingleStringMathTex, Text
+
+    return isinstance(mobject, (Text, MarkupText, SingleStringMathTex))
+
+
+def _glyphs(mobject):
+    """Glyph paths in text mobjects under mobject (not counting nested text twice)"""
+    if _is_text(mobject):
+        return sum(1 for m in mobject.get_family() if len(m.points))
+    return sum(_glyphs(sub) for sub in mobject.submobjects)
+
+
+def measure(mobjects):
+    """Complexity numbers for a list of top-level mobjects"""
+    family = [m for top in mobjects for m in top.get_family()]
+    stroke = fill = 0
+    for m in family:
+        if not len(m.points) or not hasattr(m, "get_stroke_width"):
+            continue
+        if m.get_stroke_width() > 0 and m.get_stroke_opacity() > 0:
+            stroke += 1
+        if m.get_fill_opacity() > 0:
+            fill += 1
+    return {
+        "points": sum(len(m.points) for m in family),
+        "submobjects": len(family),
+        "stroke_paths": stroke,
+        "fill_paths": fill,
+        "paths": stroke + fill,
+        "glyphs": sum(_glyphs(top) for top in mobjects),
+    }
+
+
+def over_budget(numbers, budget):
+    """Budget keys that numbers exceed"""
+    return [key for key, limit in budget.items() if numbers.get(key, 0) > limit]
+
+
+def analyze_scene(scene_file, scene, budget=BUDGET):
+    """Dry-run scene and measure every animation. Returns a report dict"""
+    from manim import Scene
+
+    animations = []
+
+    def measuring(begin_animations):
+        def wrapper(instance, *args, **kwargs):
+            outcome = begin_animations(instance, *args, **kwargs)
+            # Animation mobjects are in scene.mobjects by now
+            numbers = measure(instance.mobjects)
+            numbers.update({
+                "index": len(animations),
+                "animations": [type(a).__name__ for a in instance.animations],
+                "line": caller_location(),
+                "over": over_budget(numbers, budget),
+            })
+            animations.append(numbers)
+            return outcome
+        return wrapper
+
+    result = dry_run_scene(scene_file, scene, hooks=[(Scene, "begin_animations", measuring)])
+    peak = {key: max((a[key] for a in animations), default=0)
+            for key in ("points", "submobjects", "stroke_paths", "fill_paths", "paths", "glyphs")}
+    return {
+        "file": scene_file,
+        "scene": scene,
+        "error": result.error,
+        "location": result.location,
+        "peak": peak,
+        "over_budget": [a["index"] for a in animations if a["over"]],
+        "animations": animations,
+    }
+
+
+def parse_budget(items):
+    """BUDGET updated from ["points=50000", ...]"""
+    budget = dict(BUDGET)
+    for item in items:
+        key, _, value = item.partition("=")
+        if key not in budget or not value.isdigit():
+            raise argparse.ArgumentTypeError(f"bad budget {item!r} (keys: {', '.join(BUDGET)})")
+        budget[key] = int(value)
+    return budget
+
+
+def print_report(report, top=TOP, details=False):
+    peak = report["peak"]
+    over = report["over_budget"]
+    mark = "✗" if report["error"] else ("!" if over else "✓")
+    print(f"  {mark} {report['scene']:<34} {peak['points']:8d} pts {peak['submobjects']:6d} mobj "
+          f"{peak['paths']:6d} paths {peak['glyphs']:6d} glyphs"
+          + (f"  {len(over)} animations over budget" if over else ""))
+    if report["error"]:
+        print(f"      ✗ {report['error']} ({report['location'] or report['file']})")
+
+    if not (over or details):
+        return
+    heaviest = sorted(report["animations"], key=lambda a: a["points"], reverse=True)[:top]
+    for a in heaviest:
+        flag = f"  over: {', '.join(a['over'])}" if a["over"] else ""
+        names = ", ".join(a["animations"]) or "-"
+        print(f"      #{a['index']:<4} {a['points']:8d} pts {a['submobjects']:6d} mobj "
+              f"{a['stroke_paths']:5d}s/{a['fill_paths']:<5d}f {a['glyphs']:6d} glyphs  "
+              f"{names[:32]:<32} {a['line'] or ''}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure per-animation geometric complexity from a dry run")
+    parser.add_argument("files", nargs="*", help="Scene files (default: every file under scenes/)")
+    parser.add_argument("--scene", action="append", default=[], help="Only these scene classes")
+    parser.add_argument("--budget", nargs="+", default=[], metavar="KEY=N",
+                        help=f"Override limits ({', '.join(f'{k}={v}' for k, v in BUDGET.items())})")
+    parser.add_argument("--top", type=int, default=TOP, help="Heaviest animations listed per scene")
+    parser.add_argument("--details", action="store_true",
+                        help="List the heaviest animations of every scene, not just those over budget")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if anything is over budget")
+    args = parser.parse_args(argv)
+
+    try:
+        budget = parse_budget(args.budget)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    files = [os.path.relpath(os.path.abspath(path), REPO_ROOT) for path in args.files] or None
+    scenes = [(info.file, info.name) for info in discover(files)
+              if not args.scene or info.name in args.scene]
+
+    reports = []
+    for scene_file, scene in scenes:
+        report = analyze_scene(scene_file, scene, budget)
+        reports.append(report)
+        if not args.json:
+            print_report(report, args.top, args.details)
+
+    flagged = [r for r in reports if r["over_budget"]]
+    if args.json:
+        print(json.dumps({"budget": budget, "scenes": reports}, indent=2))
+    else:
+        print("")
+        print(f"Budget: {', '.join(f'{k} {v}' for k, v in budget.items())}")
+        print(f"Analyzed {len(reports)} scenes: {len(flagged)} over budget, "
+              f"{sum(1 for r in reports if r['error'])} failed")
+    return 1 if args.strict and flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
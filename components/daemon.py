@@ -0,0 +1,282 @@
+"""
+Warm render daemon
+
+A fresh manim process spends most of a short preview render importing
+manim, initialising Pango/Cairo fonts and parsing config. The daemon pays
+that once: it imports manim and the components package, lays out some
+text to load the fonts, then listens on a Unix socket. Each job is handled
+in a child forked from the warm parent, so renders are isolated from each
+other (and from the parent's config) but start in milliseconds.
+
+Protocol: the client sends one JSON line describing the job, the daemon
+answers with JSON lines: "start", one "progress" per play()/wait(), then
+"done" (with the output path) or "error".
+
+Usage:
+    python -m components.daemon serve &
+    python -m components.daemon submit scenes/phase1/01_hash_intro.py HashIntroduction
+    python -m components.render --daemon         # orchestrator renders through it
+    python -m components.daemon stop
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+import traceback
+
+from components.checkpoint import checkpointing
+from components.manifest import load_scene_class
+from components.reproducible import seeded_scenes
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SOCKET_PATH = os.environ.get("RENDER_DAEMON_SOCKET", os.path.join(REPO_ROOT, '.render-daemon.sock'))
+
+
+def prewarm():
+    """Import manim and load fonts once, in the parent, before any fork"""
+    start = time.time()
+    import manim
+    import components
+
+    # The package loads lazily; import every component module now so
+    # children inherit them instead of importing them per job
+    for module in sorted(set(components._EXPORTS.values())):
+        importlib.import_module(f"components.{module}")
+
+    # First Text() initialises Pango and the font map
+    manim.Text("warm", font_size=12)
+    return time.time() - start
+
+
+def _send(stream, event, **fields):
+    stream.write((json.dumps(dict(fields, event=event)) + "\n").encode())
+    stream.flush()
+
+
+def _render_in_child(request, stream):
+    """Render one job in this (forked) process, streaming progress to stream"""
+    from manim import Scene, tempconfig
+
+    from components.render import RenderJob, find_output, quality_name
+
+    job = RenderJob(request["scene_file"], request["scene"], request["output"],
+                    request.get("quality", "l"), request.get("format", "gif"))
+    media_dir = request.get("media_dir") or job.media_dir()
+    os.makedirs(media_dir, exist_ok=True)
+
+    # manim logs to stdout/stderr; keep it out of the daemon's console
+    log_path = os.path.join(media_dir, "render.log")
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(log_fd, 1)
+    os.dup2(log_fd, 2)
+
+    start = time.time()
+    original_play = Scene.play
+
+    # Scene.wait() plays a Wait animation, so this sees waits too
+    def play(scene, *args, **kwargs):
+        result = original_play(scene, *args, **kwargs)
+        _send(stream, "progress", animation=scene.renderer.num_plays,
+              seconds=round(time.time() - start, 3))
+        return result
+
+    Scene.play = play
+
+    settings = {
+        "quality": quality_name(job.quality),
+        "format": job.fmt,
+        "media_dir": media_dir,
+        "output_file": job.output,
+    }
+    if request.get("tex_dir"):
+        settings["tex_dir"] = request["tex_dir"]
+    animations = request.get("animations")
+    if animations:
+        settings["from_animation_number"] = animations[0]
+        if len(animations) > 1 and animations[1] is not None:
+            settings["upto_animation_number"] = animations[1]
+    _send(stream, "start", pid=os.getpid(), log=log_path)
+    with tempconfig(settings), contextlib.ExitStack() as stack:
+        if request.get("seed") is not None:
+            stack.enter_context(seeded_scenes(request["seed"]))
+        # Same checkpoint as render.py's subprocess path: a rerun reuses the
+        # completed partials through manim's cache
+        if request.get("checkpoint"):
+            stack.enter_context(checkpointing(request["checkpoint"]))
+        scene_class = load_scene_class(job.scene_file, job.scene)
+        scene_class().render()
+
+    path = find_output("", media_dir, job.output)
+    if path is None:
+        raise RuntimeError("render succeeded but output not found")
+    return path, time.time() - start
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    """Handle one client connection (runs in a forked child)"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            _send(self.wfile, "error", error="malformed request")
+            return
+
+        command = request.get("command", "render")
+        if command == "ping":
+            _send(self.wfile, "pong", pid=os.getppid(), warmup=self.server.warmup)
+            return
+        if command == "stop":
+            _send(self.wfile, "stopping")
+            os.kill(os.getppid(), signal.SIGTERM)
+            return
+
+        try:
+            path, seconds = _render_in_child(request, self.wfile)
+        except Exception as e:
+            _send(self.wfile, "error", error=f"{type(e).__name__}: {e}",
+                  traceback=traceback.format_exc())
+            return
+        _send(self.wfile, "done", ok=True, path=path, seconds=round(seconds, 3))
+
+
+class RenderDaemon(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server forking one pre-warmed child per job"""
+
+    def __init__(self, socket_path=SOCKET_PATH):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.socket_path = socket_path
+        self.warmup = prewarm()
+        super().__init__(socket_path, RenderHandler)
+
+
+def serve(socket_path=SOCKET_PATH):
+    """Run the daemon until SIGTERM/SIGINT"""
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    daemon = RenderDaemon(socket_path)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    print(f"✓ Render daemon ready on {socket_path} (warmed up in {daemon.warmup:.1f}s)")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+    return 0
+
+
+def request(message, socket_path=SOCKET_PATH, on_event=None):
+    """Send one request to the daemon, returning its final event"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        stream = sock.makefile("rwb")
+        stream.write((json.dumps(message) + "\n").encode())
+        stream.flush()
+
+        event = None
+        for line in stream:
+            event = json.loads(line)
+            if on_event is not None:
+                on_event(event)
+            if event["event"] in ("done", "error", "pong", "stopping"):
+                break
+        if event is None:
+            raise ConnectionError("render daemon closed the connection")
+        return event
+
+
+def submit(scene_file, scene, output, quality="l", fmt="gif", media_dir=None, animations=None,
+           socket_path=SOCKET_PATH, on_event=None, seed=None, tex_dir=None, checkpoint=None):
+    """Render a scene through the daemon. Returns the "done" or "error" event"""
+    return request({
+        "scene_file": scene_file,
+        "scene": scene,
+        "output": output,
+        "quality": quality,
+        "format": fmt,
+        "media_dir": media_dir,
+        "animations": animations,
+        "seed": seed,
+        "tex_dir": tex_dir,
+        "checkpoint": checkpoint,
+    }, socket_path, on_event)
+
+
+def is_running(socket_path=SOCKET_PATH):
+    """True if a daemon answers on socket_path"""
+    try:
+        return request({"command": "ping"}, socket_path)["event"] == "pong"
+    except OSError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm manim render daemon")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("serve", help="Start the daemon in the foreground")
+    commands.add_parser("ping", help="Check the daemon is running")
+    commands.add_parser("stop", help="Stop the daemon")
+
+    submit_parser = commands.add_parser("submit", help="Render a scene through the daemon")
+    submit_parser.add_argument("scene_file", help="Scene file, relative to the repository root")
+    submit_parser.add_argument("scene", help="Scene class to render")
+    submit_parser.add_argument("-q", "--quality", default="l", choices="lmhpk")
+    submit_parser.add_argument("--format", dest="fmt", default="gif")
+    submit_parser.add_argument("--output", default=None, help="Output file name (default: <Scene>.<format>)")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return serve(args.socket)
+
+    try:
+        if args.command == "ping":
+            event = request({"command": "ping"}, args.socket)
+            print(f"✓ Render daemon running (pid {event['pid']}, warmed up in {event['warmup']:.1f}s)")
+            return 0
+        if args.command == "stop":
+            request({"command": "stop"}, args.socket)
+            print("✓ Render daemon stopped")
+            return 0
+    except OSError:
+        print(f"✗ No render daemon on {args.socket}")
+        return 1
+
+    def show(event):
+        if event["event"] == "progress":
+            print(f"  animation {event['animation']:4d}  {event['seconds']:7.1f}s")
+
+    output = args.output or f"{args.scene}.{args.fmt}"
+    try:
+        event = submit(args.scene_file, args.scene, output, args.quality, args.fmt,
+                       socket_path=args.socket, on_event=show)
+    except OSError:
+        print(f"✗ No render daemon on {args.socket}. Start one with: python -m components.daemon serve")
+        return 1
+
+    if event["event"] == "done":
+        print(f"✓ Created: {event['path']} ({event['seconds']:.1f}s)")
+        return 0
+    print(f"✗ Render failed: {event['error']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
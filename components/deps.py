@@ -0,0 +1,312 @@
+"""
+Static scene -> component class -> module dependency graph
+
+Parses scene files and the components package with ``ast`` (nothing is
+imported) to work out which components modules each scene class actually
+uses. Given a list of changed files, or a git revision to diff against,
+prints the minimal set of scenes that need re-rendering.
+
+Usage:
+    python -m components.deps components/stack.py
+    python -m components.deps --since origin/main
+    git diff origin/main | python -m components.deps --diff -
+    python -m components.deps --graph
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+from components.manifest import scene_classes, scene_files
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Files whose change invalidates every render
+GLOBAL_INPUTS = {"manim.cfg", "requirements.txt"}
+
+
+def _parse(path):
+    with open(path, encoding="utf-8") as f:
+        return ast.parse(f.read(), filename=path)
+
+
+def _rel(path):
+    return os.path.relpath(os.path.join(REPO_ROOT, path), REPO_ROOT)
+
+
+def _component_imports(tree):
+    """
+    Map local names to what they refer to in the components package:
+    name -> ("class", ClassName), ("module", module) or ("package", None)
+    """
+    imports = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            if node.module == "components":
+                for alias in node.names:
+                    if alias.name == "*":
+                        imports["*"] = ("package", None)
+                    else:
+                        imports[alias.asname or alias.name] = ("class", alias.name)
+            elif node.module.startswith("components."):
+                module = node.module.split(".", 1)[1]
+                for alias in node.names:
+                    imports[alias.asname or alias.name] = ("module_class", (module, alias.name))
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "components":
+                    imports[alias.asname or "components"] = ("package", None)
+                elif alias.name.startswith("components."):
+                    module = alias.name.split(".", 1)[1]
+                    imports[alias.asname or alias.name] = ("module", module)
+    return imports
+
+
+def _lazy_exports(tree):
+    """The _EXPORTS table (public name -> module) of components/__init__.py"""
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "_EXPORTS"):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+def _names_used(node):
+    """Bare names and package attribute accesses used inside a node"""
+    names = set()
+    attributes = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.Attribute) and isinstance(child.value, ast.Name):
+            attributes.add((child.value.id, child.attr))
+    return names, attributes
+
+
+class DependencyGraph:
+    """Dependency graph between scene classes and components modules"""
+
+    def __init__(self, root=REPO_ROOT):
+        self.root = root
+        self.components_dir = os.path.join(root, 'components')
+
+        # Public name -> module, from components/__init__.py
+        self.exports = {}
+        # Module -> components modules it imports
+        self.module_imports = {}
+        # Module -> classes it defines
+        self.module_classes = {}
+
+        self._load_components()
+
+    def _load_components(self):
+        filenames = sorted(name for name in os.listdir(self.components_dir) if name.endswith(".py"))
+        modules = {filename[:-3] for filename in filenames}
+        for filename in filenames:
+            module = filename[:-3]
+            tree = _parse(os.path.join(self.components_dir, filename))
+
+            self.module_classes[module] = {
+                node.name for node in tree.body if isinstance(node, ast.ClassDef)
+            }
+            imported = set()
+            for kind, target in _component_imports(tree).values():
+                if kind == "module_class":
+                    imported.add(target[0])
+                elif kind == "module":
+                    imported.add(target)
+                elif kind == "class" and target in modules:
+                    imported.add(target)  # from components import prototypes
+            self.module_imports[module] = imported
+
+            if module == "__init__":
+                self.exports = _lazy_exports(tree)
+                self.module_imports[module] = set(self.exports.values())
+
+    def module_closure(self, modules):
+        """Modules plus every components module they import, transitively"""
+        seen = set()
+        pending = list(modules)
+        while pending:
+            module = pending.pop()
+            if module in seen or module not in self.module_imports:
+                continue
+            seen.add(module)
+            # __init__ only re-exports; names are already resolved to their modules
+            if module != "__init__":
+                pending.extend(self.module_imports[module])
+        return seen
+
+    def scene_dependencies(self, scene_file):
+        """
+        Dependencies of every scene class in scene_file:
+        {scene: {"classes": [...], "modules": [...]}}
+        """
+        tree = _parse(os.path.join(self.root, scene_file))
+        imports = _component_imports(tree)
+        definitions = {
+            node.name: node for node in tree.body
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+
+        # Module-level statements (constants, helpers calls) affect every scene
+        shared_names, shared_attrs = set(), set()
+        for node in tree.body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef,
+                                 ast.Import, ast.ImportFrom)):
+                continue
+            names, attrs = _names_used(node)
+            shared_names |= names
+            shared_attrs |= attrs
+
+        dependencies = {}
+        for scene in (node.name for node in scene_classes(tree)):
+            names, attrs = set(shared_names), set(shared_attrs)
+
+            # Follow references to other top-level classes/functions in the file
+            pending, visited = [scene], set()
+            while pending:
+                name = pending.pop()
+                if name in visited or name not in definitions:
+                    continue
+                visited.add(name)
+                used, used_attrs = _names_used(definitions[name])
+                names |= used
+                attrs |= used_attrs
+                pending.extend(used & set(definitions))
+
+            classes, modules = self._resolve(imports, names, attrs)
+            dependencies[scene] = {
+                "classes": sorted(classes),
+                "modules": sorted(self.module_closure(modules)),
+            }
+        return dependencies
+
+    def _resolve(self, imports, names, attrs):
+        """Turn names used by a scene into component classes and modules"""
+        classes, modules = set(), set()
+
+        for name in names:
+            kind, target = imports.get(name, (None, None))
+            if kind == "class" and target in self.exports:
+                classes.add(target)
+                modules.update(("__init__", self.exports[target]))
+            elif kind == "module_class":
+                classes.add(target[1])
+                modules.add(target[0])
+
+        for value, attr in attrs:
+            kind, target = imports.get(value, (None, None))
+            if kind == "package" and attr in self.exports:
+                classes.add(attr)
+                modules.update(("__init__", self.exports[attr]))
+            elif kind == "module" or (kind == "class" and target in self.module_classes):
+                classes.add(attr)
+                modules.add(target)
+
+        # A star import can reach anything the package exports
+        if "*" in imports:
+            used = names & set(self.exports)
+            classes |= used
+            modules.add("__init__")
+            modules.update(self.exports[name] for name in used)
+
+        return classes, modules
+
+    def component_sources(self, scene_file, scene=None):
+        """components/*.py files a scene (or every scene in a file) depends on"""
+        dependencies = self.scene_dependencies(scene_file)
+        modules = set()
+        for name, deps in dependencies.items():
+            if scene is None or name == scene:
+                modules.update(deps["modules"])
+        return sorted(os.path.join(self.components_dir, module + ".py") for module in modules)
+
+    def affected_scenes(self, changed_files, scene_files):
+        """Minimal list of (scene_file, scene) needing a re-render"""
+        changed = {_rel(path) for path in changed_files}
+
+        everything = bool(changed & GLOBAL_INPUTS)
+
+        changed_modules = set()
+        for path in changed:
+            directory, filename = os.path.split(path)
+            if directory == "components" and filename.endswith(".py"):
+                changed_modules.add(filename[:-3])
+
+        affected = []
+        for scene_file in scene_files:
+            for scene, deps in self.scene_dependencies(scene_file).items():
+                if (everything or _rel(scene_file) in changed
+                        or changed_modules & set(deps["modules"])):
+                    affected.append((_rel(scene_file), scene))
+        return affected
+
+
+def changed_since(revision):
+    """Files changed between revision and the working tree"""
+    output = subprocess.run(
+        ["git", "diff", "--name-only", revision],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        check=True,
+        text=True,
+    ).stdout
+    return [line for line in output.splitlines() if line]
+
+
+def changed_in_diff(diff_text):
+    """Files touched by a unified diff"""
+    files = set()
+    for line in diff_text.splitlines():
+        for prefix in ("+++ b/", "--- a/"):
+            if line.startswith(prefix):
+                files.add(line[len(prefix):].strip())
+    return sorted(files)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List scenes affected by changed files")
+    parser.add_argument("files", nargs="*", help="Changed files, relative to the repository root")
+    parser.add_argument("--since", help="Use files changed since this git revision")
+    parser.add_argument("--diff", help="Read a unified diff from this file ('-' for stdin)")
+    parser.add_argument("--graph", action="store_true", help="Print the full dependency graph")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    graph = DependencyGraph()
+    files = scene_files()
+
+    if args.graph:
+        full = {scene_file: graph.scene_dependencies(scene_file) for scene_file in files}
+        if args.json:
+            print(json.dumps(full, indent=2))
+        else:
+            for scene_file, scenes in full.items():
+                print(scene_file)
+                for scene, deps in scenes.items():
+                    print(f"  {scene}: {', '.join(deps['classes']) or '-'}"
+                          f"  [{', '.join(deps['modules']) or '-'}]")
+        return 0
+
+    changed = list(args.files)
+    if args.since:
+        changed += changed_since(args.since)
+    if args.diff:
+        diff_text = sys.stdin.read() if args.diff == "-" else open(args.diff).read()
+        changed += changed_in_diff(diff_text)
+
+    affected = graph.affected_scenes(changed, files)
+    if args.json:
+        print(json.dumps([{"file": f, "scene": s} for f, s in affected], indent=2))
+    else:
+        for scene_file, scene in affected:
+            print(f"{scene_file} {scene}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Headless dry run of scenes
+
+Executes each scene's construct() with manim in dry-run, skip-everything
+mode: play() and wait() jump straight to their end state, nothing is drawn
+with Cairo and ffmpeg is never started. Component errors, missing
+attributes and bad arguments surface in well under a second per scene,
+together with animation and mobject counts.
+
+Usage:
+    python -m components.dryrun                              # every scene
+    python -m components.dryrun scenes/phase1/04_merkle_trees_intro.py
+    python -m components.dryrun scenes/phase1/14_encoding.py --scene Bech32Format --json
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import traceback
+
+from components.hooks import caller_location, wrap_method
+from components.manifest import discover, load_scene_class
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+# Speaking rate used to estimate voiceover length without calling a TTS service
+VOICEOVER_WORDS_PER_MINUTE = 150
+
+
+class DryRunResult:
+    """Outcome of dry-running one scene"""
+
+    def __init__(self, scene_file, scene):
+        self.scene_file = scene_file
+        self.scene = scene
+        self.animations = 0
+        # play() calls on the scene's own renderer, which is what manim -n counts
+        self.plays = 0
+        self.waits = 0
+        # Seconds of video the scene itself produces (nested scenes excluded)
+        self.run_time = 0.0
+        self.mobjects = 0
+        self.peak_mobjects = 0
+        self.seconds = 0.0
+        self.error = None
+        self.location = None
+        self.traceback = None
+        # One dict per play()/wait() and per voiceover block, in call order
+        self.events = []
+        self.voiceovers = []
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def to_dict(self):
+        return {
+            "file": self.scene_file,
+            "scene": self.scene,
+            "ok": self.ok,
+            "animations": self.animations,
+            "plays": self.plays,
+            "waits": self.waits,
+            "run_time": round(self.run_time, 3),
+            "mobjects": self.mobjects,
+            "peak_mobjects": self.peak_mobjects,
+            "seconds": round(self.seconds, 3),
+            "error": self.error,
+            "location": self.location,
+        }
+
+
+def family_size(scene):
+    """Number of mobjects on screen, counting submobjects"""
+    return sum(len(mobject.get_family()) for mobject in scene.mobjects)
+
+
+def _error_location(tb):
+    """Innermost file:line inside the repository for a traceback"""
+    location = None
+    for frame in traceback.extract_tb(tb):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(REPO_ROOT + os.sep):
+            location = f"{os.path.relpath(path, REPO_ROOT)}:{frame.lineno}"
+    return location
+
+
+class EstimatedTracker:
+    """Stands in for manim_voiceover's tracker, timed from the word count"""
+
+    def __init__(self, text, start):
+        self.text = text
+        self.start = start
+        self.duration = len(text.split()) * 60.0 / VOICEOVER_WORDS_PER_MINUTE
+
+    @property
+    def end(self):
+        return self.start + self.duration
+
+    def get_remaining_duration(self, buff=0.0):
+        return max(self.end - _scene_time[0] + buff, 0.0)
+
+    def time_until_bookmark(self, mark, buff=0, limit=None):
+        return 0.0
+
+
+# Running time of the scene being dry-run, read by EstimatedTracker
+_scene_time = [0.0]
+
+
+def _voiceover_hooks(result):
+    """Time voiceover blocks from their text instead of synthesizing speech"""
+    stack = contextlib.ExitStack()
+    try:
+        from manim_voiceover import VoiceoverScene
+    except ImportError:
+        return stack
+
+    def no_speech_service(set_speech_service):
+        def wrapper(scene, *args, **kwargs):
+            scene.speech_service = None
+        return wrapper
+
+    def estimated_voiceover(voiceover):
+        @contextlib.contextmanager
+        def wrapper(scene, text=None, ssml=None, **kwargs):
+            tracker = EstimatedTracker(text or ssml or "", _scene_time[0])
+            yield tracker
+            # Like manim_voiceover, hold the scene until the speech ends
+            remaining = tracker.get_remaining_duration()
+            if remaining > 0:
+                scene.wait(remaining)
+            result.voiceovers.append({
+                "start": round(tracker.start, 3),
+                "end": round(_scene_time[0], 3),
+                "speech": round(tracker.duration, 3),
+                "text": tracker.text,
+            })
+        return wrapper
+
+    stack.enter_context(wrap_method(VoiceoverScene, "set_speech_service", no_speech_service))
+    stack.enter_context(wrap_method(VoiceoverScene, "voiceover", estimated_voiceover))
+    return stack
+
+
+def dry_run_scene(scene_file, scene, hooks=(), settings=None):
+    """
+    Run one scene's construct() without rendering. Never raises.
+    hooks are extra (cls, method name, wrapper factory) patches for the run,
+    settings extra manim config (e.g. a small pixel size for snapshots).
+    """
+    from manim import Scene, Wait, tempconfig
+
+    result = DryRunResult(scene_file, scene)
+    start = time.time()
+    top = []
+    _scene_time[0] = 0.0
+
+    def counting(play):
+        def wrapper(instance, *args, **kwargs):
+            outcome = play(instance, *args, **kwargs)
+            # Nested scenes (built inside another construct) count too, but
+            # don't add to this scene's video
+            nested = instance is not top[0]
+            run_time = getattr(instance, "duration", 0.0) or 0.0
+            animations = getattr(instance, "animations", None) or []
+            is_wait = bool(animations) and all(isinstance(a, Wait) for a in animations)
+
+            result.animations += 1
+            result.waits += is_wait
+            result.events.append({
+                "index": len(result.events),
+                "start": round(result.run_time, 3),
+                "run_time": round(run_time, 3),
+                "kind": "wait" if is_wait else "play",
+                "animations": [type(a).__name__ for a in animations],
+                "line": caller_location(),
+                "nested": nested,
+            })
+            if not nested:
+                result.run_time += run_time
+                _scene_time[0] = result.run_time
+            result.peak_mobjects = max(result.peak_mobjects, family_size(instance))
+            return outcome
+        return wrapper
+
+    def remember_top(init):
+        def wrapper(instance, *args, **kwargs):
+            if not top:
+                top.append(instance)
+            return init(instance, *args, **kwargs)
+        return wrapper
+
+    # Skip every animation and write nothing: play() only updates state
+    settings = dict(settings or {}, dry_run=True, from_animation_number=sys.maxsize)
+    try:
+        with tempconfig(settings), wrap_method(Scene, "play", counting), \
+                wrap_method(Scene, "__init__", remember_top), _voiceover_hooks(result), \
+                contextlib.ExitStack() as extra:
+            for cls, name, wrapper in hooks:
+                extra.enter_context(wrap_method(cls, name, wrapper))
+            load_scene_class(scene_file, scene)().render()
+    except Exception as e:
+        _, _, tb = sys.exc_info()
+        result.error = f"{type(e).__name__}: {e}"
+        result.location = _error_location(tb)
+        result.traceback = traceback.format_exc()
+
+    if top:
+        result.plays = top[0].renderer.num_plays
+        result.mobjects = family_size(top[0])
+        result.peak_mobjects = max(result.peak_mobjects, result.mobjects)
+    result.seconds = time.time() - start
+    return result
+
+
+def dry_run_all(scenes):
+    """Dry-run (scene_file, scene) pairs in order, yielding results"""
+    for scene_file, scene in scenes:
+        yield dry_run_scene(scene_file, scene)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run scenes' construct() without rendering")
+    parser.add_argument("files", nargs="*", help="Scene files (default: every file under scenes/)")
+    parser.add_argument("--scene", action="append", default=[], help="Only these scene classes")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    parser.add_argument("-x", "--fail-fast", action="store_true", help="Stop at the first failure")
+    parser.add_argument("--traceback", action="store_true", help="Show full tracebacks for failures")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    files = [os.path.relpath(os.path.abspath(path), REPO_ROOT) for path in args.files] or None
+    scenes = [(info.file, info.name) for info in discover(files)
+              if not args.scene or info.name in args.scene]
+
+    results = []
+    for result in dry_run_all(scenes):
+        results.append(result)
+        if not args.json:
+            if result.ok:
+                print(f"  ✓ {result.scene:<34} {result.animations:4d} animations "
+                      f"{result.peak_mobjects:6d} mobjects  {result.seconds:5.2f}s")
+            else:
+                print(f"  ✗ {result.scene:<34} {result.error} ({result.location or result.scene_file})")
+                if args.traceback:
+                    print(result.traceback)
+        if args.fail_fast and not result.ok:
+            break
+
+    failed = [r for r in results if not r.ok]
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        print("")
+        print(f"Dry-ran {len(results)} scenes: {len(results) - len(failed)} ok, {len(failed)} failed "
+              f"({sum(r.seconds for r in results):.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+"""
+Local render farm backed by a SQLite job queue
+
+Jobs (scene, quality, format, priority) live in one SQLite file. Any
+number of workers, on this machine or in containers sharing the repo
+volume, claim jobs atomically (BEGIN IMMEDIATE), heartbeat while they
+render and record the outcome. A failed job is retried after a delay
+until it runs out of attempts; a job whose worker stops heartbeating
+(killed container, OOM) is put back on the queue.
+
+Workers render with components.render.render_job, so they share the
+render cache, partial movie store and checkpoints with normal builds.
+The queue uses SQLite's WAL mode, which needs every worker on the same
+host (a Docker volume is fine, NFS is not).
+
+Usage:
+    python -m components.farm enqueue                 # every Phase 1 preview
+    python -m components.farm enqueue --module 04 05 --priority 10
+    python -m components.farm worker --processes 4    # or one per container:
+    docker run --rm -v "$PWD:/opt/build/repo" <image> python3 -m components.farm worker
+    python -m components.farm watch
+    python -m components.farm status
+    python -m components.farm retry                   # requeue failed jobs
+"""
+import argparse
+import contextlib
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+
+from components.cache import CACHE_DIR, RenderCache
+from components.deps import DependencyGraph
+from components.manifest import module_number
+from components.partials import PARTIALS_DIR, PartialMovieStore
+from components.render import MEDIA_ROOT, PREVIEW_DIR, RenderJob, RenderResult, preview_jobs, render_job
+from components.timeline import load_durations
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DB_PATH = os.environ.get("RENDER_FARM_DB", os.path.join(REPO_ROOT, '.render-farm', 'queue.sqlite'))
+
+MAX_ATTEMPTS = 3
+# Seconds before a failed job is retried, multiplied by its attempt number
+RETRY_DELAY = 30
+HEARTBEAT = 10
+# A running job whose worker hasn't heartbeated for this long is requeued
+STALE_AFTER = 6 * HEARTBEAT
+# How long an idle worker sleeps before polling the queue again
+POLL = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    scene_file TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    output TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    format TEXT NOT NULL,
+    reproducible INTEGER NOT NULL DEFAULT 1,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    available_at REAL NOT NULL DEFAULT 0,
+    worker TEXT,
+    heartbeat REAL,
+    enqueued REAL,
+    started REAL,
+    finished REAL,
+    seconds REAL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    UNIQUE (scene_file, scene, output, quality, format)
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, priority DESC, id);
+"""
+
+STATUSES = ("queued", "running", "done", "failed")
+
+
+def connect(path=DB_PATH):
+    """Open (and create) the queue database"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Autocommit mode: transactions are explicit BEGIN IMMEDIATE blocks
+    db = sqlite3.connect(path, timeout=30, isolation_level=None)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA busy_timeout=30000")
+    db.executescript(SCHEMA)
+    # Queues created before jobs carried the reproducible flag
+    columns = {row["name"] for row in db.execute("PRAGMA table_info(jobs)")}
+    if "reproducible" not in columns:
+        db.execute("ALTER TABLE jobs ADD COLUMN reproducible INTEGER NOT NULL DEFAULT 1")
+    return db
+
+
+@contextlib.contextmanager
+def transaction(db):
+    """BEGIN IMMEDIATE ... COMMIT, so only one worker writes at a time"""
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    db.execute("COMMIT")
+
+
+def enqueue(db, jobs, priority=0, priorities=None, max_attempts=MAX_ATTEMPTS):
+    """
+    Queue RenderJobs. A job already in the queue is reset to queued unless
+    it is running. priorities maps (scene_file, scene) to a priority that
+    overrides priority. Returns the number of jobs queued.
+    """
+    now = time.time()
+    queued = 0
+    with transaction(db):
+        for job in jobs:
+            p = (priorities or {}).get((job.scene_file, job.scene), priority)
+            cursor = db.execute(
+                """
+                INSERT INTO jobs (scene_file, scene, output, quality, format, reproducible, priority,
+                                  max_attempts, enqueued)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (scene_file, scene, output, quality, format) DO UPDATE SET
+                    reproducible = excluded.reproducible,
+                    priority = excluded.priority, max_attempts = excluded.max_attempts,
+                    enqueued = excluded.enqueued, status = 'queued', attempts = 0,
+                    available_at = 0, worker = NULL, error = NULL, cached = 0
+                WHERE status != 'running'
+                """,
+                (job.scene_file, job.scene, job.output, job.quality, job.fmt, int(job.reproducible), p,
+                 max_attempts, now),
+            )
+            queued += cursor.rowcount
+    return queued
+
+
+def requeue_stale(db, now=None, stale_after=STALE_AFTER):
+    """Put running jobs whose worker went quiet back on the queue (call inside a transaction)"""
+    now = now or time.time()
+    cutoff = now - stale_after
+    db.execute(
+        "UPDATE jobs SET status = 'failed', worker = NULL, finished = ?, "
+        "error = 'worker stopped heartbeating' "
+        "WHERE status = 'running' AND heartbeat < ? AND attempts >= max_attempts",
+        (now, cutoff),
+    )
+    return db.execute(
+        "UPDATE jobs SET status = 'queued', worker = NULL, error = 'worker stopped heartbeating' "
+        "WHERE status = 'running' AND heartbeat < ?",
+        (cutoff,),
+    ).rowcount
+
+
+def claim(db, worker):
+    """Atomically take the highest-priority available job. Returns its row or None"""
+    now = time.time()
+    with transaction(db):
+        requeue_stale(db, now)
+        row = db.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' AND available_at <= ? "
+            "ORDER BY priority DESC, id LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            return None
+        db.execute(
+            "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?, "
+            "heartbeat = ?, started = ? WHERE id = ?",
+            (worker, now, now, row["id"]),
+        )
+    return row
+
+
+def heartbeat(db, job_id, worker):
+    """Mark job_id as still being rendered by worker. False if it was taken away"""
+    cursor = db.execute(
+        "UPDATE jobs SET heartbeat = ? WHERE id = ? AND worker = ? AND status = 'running'",
+        (time.time(), job_id, worker),
+    )
+    return cursor.rowcount == 1
+
+
+def finish(db, job_id, worker, result, retry_delay=RETRY_DELAY):
+    """Record a RenderResult; failed jobs with attempts left are queued again"""
+    now = time.time()
+    with transaction(db):
+        row = db.execute("SELECT attempts, max_attempts, worker FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None or row["worker"] != worker:
+            return  # requeued as stale and claimed by someone else meanwhile
+        if result.ok:
+            db.execute(
+                "UPDATE jobs SET status = 'done', finished = ?, seconds = ?, cached = ?, error = NULL "
+                "WHERE id = ?",
+                (now, result.seconds, int(result.cached), job_id),
+            )
+        elif row["attempts"] < row["max_attempts"]:
+            db.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, available_at = ?, seconds = ?, error = ? "
+                "WHERE id = ?",
+                (now + retry_delay * row["attempts"], result.seconds, result.error, job_id),
+            )
+        else:
+            db.execute(
+                "UPDATE jobs SET status = 'failed', finished = ?, seconds = ?, error = ? WHERE id = ?",
+                (now, result.seconds, result.error, job_id),
+            )
+
+
+def retry_failed(db):
+    """Queue every failed job again with fresh attempts"""
+    with transaction(db):
+        return db.execute(
+            "UPDATE jobs SET status = 'queued', attempts = 0, available_at = 0, worker = NULL "
+            "WHERE status = 'failed'"
+        ).rowcount
+
+
+def counts(db):
+    """Jobs per status"""
+    found = dict.fromkeys(STATUSES, 0)
+    for row in db.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+        found[row["status"]] = row["n"]
+    return found
+
+
+class _Heartbeat(threading.Thread):
+    """Heartbeats a claimed job from a background thread until stopped"""
+
+    def __init__(self, path, job_id, worker, interval=HEARTBEAT):
+        super().__init__(daemon=True)
+        self.path = path
+        self.job_id = job_id
+        self.worker = worker
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        db = connect(self.path)
+        try:
+            while not self.stopped.wait(self.interval):
+                if not heartbeat(db, self.job_id, self.worker):
+                    break
+        finally:
+            db.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _render(row, output_dir, media_root, cache, partials, graph):
+    """Render one claimed job, serving it from the cache when possible"""
+    job = RenderJob(row["scene_file"], row["scene"], row["output"], row["quality"], row["format"],
+                    reproducible=bool(row["reproducible"]))
+    start = time.time()
+    key = None
+    if cache is not None:
+        key = job.cache_key(graph)
+        destination = os.path.join(REPO_ROOT, output_dir, job.output)
+        if cache.fetch(key, destination):
+            return RenderResult(job, True, time.time() - start, path=destination, cached=True)
+
+    try:
+        result = render_job(job, output_dir, media_root, partials)
+    except Exception as e:
+        return RenderResult(job, False, time.time() - start, error=f"{type(e).__name__}: {e}")
+    if key is not None and result.ok:
+        cache.store(key, result.path, scene_file=job.scene_file, scene=job.scene, output=job.output)
+    return result
+
+
+def work(path=DB_PATH, output_dir=PREVIEW_DIR, media_root=MEDIA_ROOT, cache_dir=CACHE_DIR,
+         partials_dir=PARTIALS_DIR, exit_when_empty=False):
+    """Claim and render jobs until stopped (or the queue is drained)"""
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    name = worker_id()
+    db = connect(path)
+    cache = RenderCache(cache_dir) if cache_dir else None
+    partials = PartialMovieStore(partials_dir) if partials_dir else None
+    graph = DependencyGraph() if cache is not None else None
+
+    print(f"  Worker {name} waiting for jobs in {os.path.relpath(path, REPO_ROOT)}", flush=True)
+    while True:
+        row = claim(db, name)
+        if row is None:
+            active = db.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')").fetchone()[0]
+            if exit_when_empty and not active:
+                break
+            time.sleep(POLL)
+            continue
+
+        beat = _Heartbeat(path, row["id"], name)
+        beat.start()
+        try:
+            result = _render(row, output_dir, media_root, cache, partials, graph)
+        finally:
+            beat.stop()
+        finish(db, row["id"], name, result)
+
+        if result.cached:
+            print(f"  ✓ [{name}] Cached: {row['output']}", flush=True)
+        elif result.ok:
+            print(f"  ✓ [{name}] Created: {row['output']} ({result.seconds:.1f}s)", flush=True)
+        else:
+            print(f"  ✗ [{name}] {row['scene']} (attempt {row['attempts'] + 1}) - {result.error}", flush=True)
+    db.close()
+
+
+def print_status(db, verbose=True):
+    found = counts(db)
+    total = sum(found.values())
+    print(f"  {found['done']}/{total} done, {found['running']} running, "
+          f"{found['queued']} queued, {found['failed']} failed")
+    if not verbose:
+        return
+    now = time.time()
+    for row in db.execute("SELECT * FROM jobs WHERE status = 'running' ORDER BY started"):
+        print(f"    ▸ {row['scene']:<34} {row['worker']:<24} {now - row['started']:6.0f}s "
+              f"(heartbeat {now - row['heartbeat']:.0f}s ago, attempt {row['attempts']})")
+    for row in db.execute("SELECT * FROM jobs WHERE status = 'failed' ORDER BY id"):
+        print(f"    ✗ {row['scene']:<34} {row['attempts']} attempts  {row['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLite-backed render farm")
+    parser.add_argument("--db", default=DB_PATH, help=f"Queue database (default: {os.path.relpath(DB_PATH, REPO_ROOT)})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = commands.add_parser("enqueue", help="Queue preview renders")
+    enqueue_parser.add_argument("-m", "--module", nargs="+", default=[], help="Only these module numbers")
+    enqueue_parser.add_argument("-q", "--quality", default="l", choices="lmhpk", help="Manim quality flag")
+    enqueue_parser.add_argument("--format", dest="fmt", default="gif", help="Output format (default: gif)")
+    enqueue_parser.add_argument("--priority", type=int, default=0, help="Higher priorities are claimed first")
+    enqueue_parser.add_argument("--longest-first", action="store_true",
+                                help="Prioritise by scene duration from the timeline (see timeline.py)")
+    enqueue_parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS,
+                                help=f"Renders tried before a job fails (default: {MAX_ATTEMPTS})")
+    enqueue_parser.add_argument("--reproducible", action=argparse.BooleanOptionalAction, default=True,
+                                help="Seed and normalize renders like CI, sharing its cache entries (default: on)")
+
+    worker_parser = commands.add_parser("worker", help="Render queued jobs")
+    worker_parser.add_argument("-p", "--processes", type=int, default=1, help="Worker processes to start")
+    worker_parser.add_argument("--exit-when-empty", action="store_true",
+                               help="Stop once nothing is queued or running")
+    worker_parser.add_argument("-o", "--output-dir", default=PREVIEW_DIR, help="Where finished files are copied")
+    worker_parser.add_argument("--media-root", default=MEDIA_ROOT, help="Parent of per-job media dirs")
+    worker_parser.add_argument("--no-cache", action="store_true", help="Don't use the render cache")
+    worker_parser.add_argument("--no-partials", action="store_true", help="Don't reuse partial movie files")
+
+    commands.add_parser("status", help="Show queue progress and failures")
+    watch_parser = commands.add_parser("watch", help="Show progress until the queue is drained")
+    watch_parser.add_argument("--interval", type=float, default=5.0, help="Seconds between updates")
+    commands.add_parser("retry", help="Queue failed jobs again")
+    args = parser.parse_args(argv)
+
+    if args.command == "worker":
+        options = dict(path=args.db, output_dir=args.output_dir, media_root=args.media_root,
+                       cache_dir=None if args.no_cache else CACHE_DIR,
+                       partials_dir=None if args.no_partials else PARTIALS_DIR,
+                       exit_when_empty=args.exit_when_empty)
+        if args.processes == 1:
+            work(**options)
+            return 0
+        processes = [multiprocessing.Process(target=work, kwargs=options) for _ in range(args.processes)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return 0 if all(p.exitcode == 0 for p in processes) else 1
+
+    db = connect(args.db)
+    if args.command == "enqueue":
+        jobs = preview_jobs(args.quality, args.fmt, reproducible=args.reproducible)
+        if args.module:
+            jobs = [job for job in jobs if module_number(job.scene_file) in args.module]
+        priorities = None
+        if args.longest_first:
+            # Whole seconds of scene duration, so long scenes start first
+            priorities = {key: args.priority + int(seconds) for key, seconds in load_durations().items()}
+        queued = enqueue(db, jobs, args.priority, priorities, args.max_attempts)
+        print(f"✓ Queued {queued} of {len(jobs)} jobs ({len(jobs) - queued} already running)")
+        return 0
+
+    if args.command == "retry":
+        print(f"✓ Requeued {retry_failed(db)} failed jobs")
+        return 0
+
+    if args.command == "status":
+        print_status(db)
+        return 1 if counts(db)["failed"] else 0
+
+    # watch
+    while True:
+        print(time.strftime("%H:%M:%S"), end="")
+        print_status(db, verbose=False)
+        found = counts(db)
+        if not found["queued"] and not found["running"]:
+            break
+        time.sleep(args.interval)
+    print_status(db)
+    return 1 if counts(db)["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Key-frame golden tests
+
+Instead of rendering whole GIFs, each scene is dry-run (see dryrun.py) and
+only the last frame of every animation is rasterized, at low resolution,
+and compared with a stored golden PNG. Nothing is encoded, so a scene is
+checked in a fraction of its render time.
+
+Comparison is deliberately tolerant: both images are blurred slightly
+(anti-aliasing and font hinting jitter) and a frame fails only if more
+than --tolerance of its pixels differ by more than --threshold.
+
+Goldens depend on installed fonts, so record them in the build image and
+commit golden/ (CI checks the copy baked into the image). A scene with
+no goldens yet is skipped without rendering; changed frames fail:
+    docker run --rm -v "$PWD/golden:/opt/build/repo/golden" <image> \
+        python3 -m components.golden --update
+
+Usage:
+    python -m components.golden                       # phase 1 + component examples
+    python -m components.golden scenes/phase1/04_merkle_trees_intro.py
+    python -m components.golden --scene StackExample --update
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+
+from components.dryrun import dry_run_scene
+from components.manifest import discover
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+GOLDEN_DIR = 'golden'
+FAILURES_DIR = os.path.join('media', 'golden')
+
+# Small 16:9 frames: enough to catch layout, color and missing-object changes
+PIXEL_WIDTH = 320
+PIXEL_HEIGHT = 180
+
+# Per-channel difference (0-255) above which a pixel counts as changed...
+THRESHOLD = 24
+# ...and the fraction of changed pixels that fails a frame
+TOLERANCE = 0.005
+
+# Component example scenes covered alongside scenes/phase1
+COMPONENT_EXAMPLES = [
+    ("components/stack.py", "StackExample"),
+    ("components/hash.py", "HashExample"),
+    ("components/tree.py", "MerkleTreeExample"),
+    ("components/signature.py", "SignatureExample"),
+]
+
+
+def default_scenes():
+    """Every phase 1 scene plus the component examples"""
+    phase1 = [(info.file, info.name) for info in discover()
+              if info.file.startswith(os.path.join("scenes", "phase1") + os.sep)]
+    return phase1 + COMPONENT_EXAMPLES
+
+
+def golden_dir(scene_file, scene, root=GOLDEN_DIR):
+    module = os.path.splitext(os.path.basename(scene_file))[0]
+    return os.path.join(REPO_ROOT, root, module, scene)
+
+
+def capture_frames(scene_file, scene, width=PIXEL_WIDTH, height=PIXEL_HEIGHT):
+    """Last frame of every animation as RGBA arrays. Returns (frames, error)"""
+    import numpy as np
+    from manim import Scene
+
+    frames = []
+
+    def capturing(play):
+        def wrapper(instance, *args, **kwargs):
+            outcome = play(instance, *args, **kwargs)
+            renderer = instance.renderer
+            # Draw every mobject fresh instead of over the animation's static layer
+            renderer.static_image = None
+            renderer.update_frame(instance, ignore_skipping=True)
+            frames.append(np.array(renderer.get_frame()))
+            return outcome
+        return wrapper
+
+    # Scenes that use randomness must draw the same thing every run
+    random.seed(0)
+    np.random.seed(0)
+    settings = {"pixel_width": width, "pixel_height": height}
+    result = dry_run_scene(scene_file, scene, hooks=[(Scene, "play", capturing)], settings=settings)
+    return frames, result.error
+
+
+def _prepare(image):
+    from PIL import ImageFilter
+
+    return image.convert("RGB").filter(ImageFilter.GaussianBlur(1))
+
+
+def compare(actual, expected, threshold=THRESHOLD):
+    """(fraction of changed pixels, diff image) for two PIL images"""
+    import numpy as np
+    from PIL import Image
+
+    if actual.size != expected.size:
+        return 1.0, None
+    a = np.asarray(_prepare(actual), dtype=np.int16)
+    b = np.asarray(_prepare(expected), dtype=np.int16)
+    changed = np.abs(a - b).max(axis=2) > threshold
+    diff = np.zeros(a.shape, dtype=np.uint8)
+    diff[..., 0] = changed * 255
+    diff[..., 1] = (np.asarray(expected.convert("L")) // 3)
+    return float(changed.mean()), Image.fromarray(diff)
+
+
+def check_scene(scene_file, scene, update=False, threshold=THRESHOLD, tolerance=TOLERANCE):
+    """Capture and compare (or store) one scene's key frames"""
+    from PIL import Image
+
+    directory = golden_dir(scene_file, scene)
+    if not update and not os.path.isdir(directory):
+        return {"file": scene_file, "scene": scene, "frames": 0, "error": None,
+                "failed": [], "status": "new"}
+
+    frames, error = capture_frames(scene_file, scene)
+    report = {"file": scene_file, "scene": scene, "frames": len(frames), "error": error,
+              "failed": [], "status": "ok"}
+    if error:
+        report["status"] = "error"
+        return report
+
+    if update:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        for i, frame in enumerate(frames):
+            Image.fromarray(frame).save(os.path.join(directory, f"frame_{i:03d}.png"))
+        report["status"] = "updated"
+        return report
+
+    expected = sorted(name for name in os.listdir(directory) if name.endswith(".png"))
+    if len(expected) != len(frames):
+        report["failed"].append(f"{len(frames)} animations, golden has {len(expected)}")
+
+    failures = golden_dir(scene_file, scene, FAILURES_DIR)
+    shutil.rmtree(failures, ignore_errors=True)
+    for i, frame in enumerate(frames[:len(expected)]):
+        actual = Image.fromarray(frame)
+        with Image.open(os.path.join(directory, expected[i])) as golden:
+            golden.load()
+            changed, diff = compare(actual, golden, threshold)
+        if changed > tolerance:
+            report["failed"].append(f"frame {i:03d}: {changed * 100:.2f}% of pixels changed")
+            os.makedirs(failures, exist_ok=True)
+            actual.save(os.path.join(failures, f"frame_{i:03d}.actual.png"))
+            if diff is not None:
+                diff.save(os.path.join(failures, f"frame_{i:03d}.diff.png"))
+
+    if report["failed"]:
+        report["status"] = "failed"
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare animation key frames with golden PNGs")
+    parser.add_argument("files", nargs="*", help="Scene files (default: phase 1 and component examples)")
+    parser.add_argument("--scene", action="append", default=[], help="Only these scene classes")
+    parser.add_argument("--update", action="store_true", help="Record new goldens instead of comparing")
+    parser.add_argument("--threshold", type=int, default=THRESHOLD,
+                        help=f"Per-channel difference counted as a change (default: {THRESHOLD})")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"Fraction of changed pixels allowed per frame (default: {TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    if args.files:
+        files = [os.path.relpath(os.path.abspath(path), REPO_ROOT) for path in args.files]
+        scenes = [(info.file, info.name) for info in discover(files)]
+    else:
+        scenes = default_scenes()
+    scenes = [(f, s) for f, s in scenes if not args.scene or s in args.scene]
+
+    counts = {}
+    for scene_file, scene in scenes:
+        report = check_scene(scene_file, scene, args.update, args.threshold, args.tolerance)
+        counts[report["status"]] = counts.get(report["status"], 0) + 1
+        mark = {"ok": "✓", "updated": "✓", "new": "·", "failed": "✗", "error": "✗"}[report["status"]]
+        print(f"  {mark} {scene:<34} {report['frames']:4d} frames  {report['status']}")
+        if report["error"]:
+            print(f"      {report['error']}")
+        for failure in report["failed"]:
+            print(f"      {failure}")
+
+    print("")
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    if counts.get("new"):
+        print("! Scenes without goldens are not checked; record them in the build image with --update")
+    if counts.get("failed"):
+        print(f"✗ Actual and diff frames written to {FAILURES_DIR}/")
+    return 1 if counts.get("failed") or counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,9 @@ Hash function visualization components
 from manim import *
 import hashlib
 
+from components.hexstring import HexString, hex_or_text
+from components.text import cached_text
+
 
 class HashMachine(VGroup):
     """Visual representation of a hash function"""
@@ -28,7 +31,7 @@ class HashMachine(VGroup):
         )
 
         # Label
-        self.label = Text(label, color=WHITE).scale(0.7)
+        self.label = cached_text(label, color=WHITE).scale(0.7)
         self.label.move_to(self.machine.get_center())
 
         # Input port
@@ -60,8 +63,8 @@ class DataBox(VGroup):
         # Truncate if too long
         display_data = data if len(data) <= 16 else data[:13] + "..."
 
-        # Text
-        self.text = Text(display_data, color=WHITE).scale(0.5)
+        # Text (digests come from the shared hex glyph atlas)
+        self.text = hex_or_text(display_data, color=WHITE).scale(0.5)
 
         # Box
         self.box = SurroundingRectangle(
@@ -172,10 +175,10 @@ class AvalancheEffect(VGroup):
         self.viz2.to_edge(DOWN, buff=0.5)
 
         # Highlight differences
-        self.diff_label = Text("One character difference", color=RED).scale(0.6)
+        self.diff_label = cached_text("One character difference", color=RED).scale(0.6)
         self.diff_label.move_to(ORIGIN + LEFT * 3)
 
-        self.hash_diff_label = Text("Completely different hashes!", color=YELLOW).scale(0.6)
+        self.hash_diff_label = cached_text("Completely different hashes!", color=YELLOW).scale(0.6)
         self.hash_diff_label.move_to(ORIGIN + RIGHT * 3)
 
         self.add(self.viz1, self.viz2, self.diff_label, self.hash_diff_label)
@@ -185,7 +188,7 @@ class AvalancheEffect(VGroup):
 class HashExample(Scene):
     def construct(self):
         # Title
-        title = Text("Hash Function Visualization").to_edge(UP)
+        title = cached_text("Hash Function Visualization").to_edge(UP)
         self.play(Write(title))
 
         # Simple hash visualization
@@ -223,7 +226,7 @@ class HashComparison(Scene):
     """Compare multiple hash functions"""
 
     def construct(self):
-        title = Text("Hash Function Comparison").scale(0.8).to_edge(UP)
+        title = cached_text("Hash Function Comparison").scale(0.8).to_edge(UP)
         self.play(Write(title))
 
         # Create multiple hash visualizations
@@ -231,18 +234,18 @@ class HashComparison(Scene):
 
         # SHA-256
         sha256_hash = hashlib.sha256(input_data.encode()).hexdigest()
-        sha256_label = Text("SHA-256:", color=BLUE).scale(0.6)
-        sha256_output = Text(sha256_hash[:32] + "...", color=WHITE).scale(0.4)
+        sha256_label = cached_text("SHA-256:", color=BLUE).scale(0.6)
+        sha256_output = HexString(sha256_hash[:32] + "...", color=WHITE).scale(0.4)
 
         # SHA-1 (for comparison, though insecure)
         sha1_hash = hashlib.sha1(input_data.encode()).hexdigest()
-        sha1_label = Text("SHA-1:", color=YELLOW).scale(0.6)
-        sha1_output = Text(sha1_hash, color=WHITE).scale(0.4)
+        sha1_label = cached_text("SHA-1:", color=YELLOW).scale(0.6)
+        sha1_output = HexString(sha1_hash, color=WHITE).scale(0.4)
 
         # MD5 (for comparison, though insecure)
         md5_hash = hashlib.md5(input_data.encode()).hexdigest()
-        md5_label = Text("MD5:", color=RED).scale(0.6)
-        md5_output = Text(md5_hash, color=WHITE).scale(0.4)
+        md5_label = cached_text("MD5:", color=RED).scale(0.6)
+        md5_output = HexString(md5_hash, color=WHITE).scale(0.4)
 
         # Arrange vertically
         sha256_group = VGroup(sha256_label, sha256_output).arrange(RIGHT, buff=0.3)
@@ -262,7 +265,7 @@ class HashComparison(Scene):
         self.wait(3)
 
         # Add security notes
-        note = Text(
+        note = cached_text(
             "Note: SHA-256 is secure, SHA-1 and MD5 are broken!",
             color=RED
         ).scale(0.5).to_edge(DOWN)
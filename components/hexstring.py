@@ -0,0 +1,111 @@
+"""
+Monospace hex strings assembled from a shared glyph atlas
+
+Digests, keys and signatures are drawn everywhere, and every Text() of a
+64-character digest is a Pango layout plus 64 parsed glyph paths. A
+HexString lays out the hex alphabet once per (font, weight) into an
+atlas, then builds any string by copying glyphs to fixed monospace
+advances. Each character is its own submobject, so single characters can
+be recolored, e.g. to highlight where two digests differ.
+"""
+from manim import *
+import functools
+import re
+
+from components.text import cached_text
+
+
+HEX_FONT = "Monospace"
+
+# Everything a HexString can draw: hex digits, "0x" and truncation dots
+HEX_GLYPHS = "0123456789abcdefABCDEFx.…"
+
+# Optional 0x, hex digits (space-separated groups allowed), optional truncation
+HEX_VALUE = re.compile(r"(0x)?[0-9a-fA-F]+( [0-9a-fA-F]+)*(\.\.\.|…)?")
+
+
+class GlyphAtlas:
+    """Glyphs of HEX_GLYPHS for one font and weight, positioned in a unit cell"""
+
+    def __init__(self, font=HEX_FONT, weight=NORMAL):
+        # Two leading zeros measure the advance; every glyph keeps its
+        # offset within its cell and its height relative to the baseline
+        reference = Text("00" + HEX_GLYPHS, font=font, weight=weight, disable_ligatures=True)
+        glyphs = reference.submobjects
+        if len(glyphs) != len(HEX_GLYPHS) + 2:
+            raise ValueError(f"font {font!r} doesn't draw one glyph per hex character")
+
+        self.advance = glyphs[1].get_x() - glyphs[0].get_x()
+        origin = glyphs[0].get_x()
+        self.glyphs = {}
+        for i, char in enumerate(HEX_GLYPHS, start=2):
+            self.glyphs[char] = glyphs[i].copy().shift(LEFT * (origin + i * self.advance))
+
+    def glyph(self, char):
+        """A fresh copy of char's glyph, centered on x=0"""
+        if char not in self.glyphs:
+            raise ValueError(f"{char!r} is not a hex glyph")
+        return self.glyphs[char].copy()
+
+
+@functools.lru_cache(maxsize=None)
+def glyph_atlas(font=HEX_FONT, weight=NORMAL):
+    return GlyphAtlas(font, weight)
+
+
+def is_hex_text(text):
+    """
+    True for hex values such as "0x1a2b..." or "3fa9". Words like "cafe"
+    (no digit) and decimals like "256" or "1.5" (no 0x, no a-f) stay Text.
+    """
+    match = HEX_VALUE.fullmatch(text)
+    if match is None or not any(char.isdigit() for char in text):
+        return False
+    return match.group(1) is not None or any(char in "abcdefABCDEF" for char in text)
+
+
+def hex_or_text(text, color=WHITE):
+    """A HexString for hex values, cached_text for anything else"""
+    if is_hex_text(text):
+        return HexString(text, color=color)
+    return cached_text(text, color=color)
+
+
+class HexString(VGroup):
+    """A hex string in monospace glyphs; chars[i] is character i (None for spaces)"""
+
+    def __init__(self, text, color=WHITE, font=HEX_FONT, weight=NORMAL, font_size=DEFAULT_FONT_SIZE, **kwargs):
+        super().__init__(**kwargs)
+        atlas = glyph_atlas(font, weight)
+
+        self.text = text
+        self.chars = []
+        for i, char in enumerate(text):
+            if char == " ":
+                self.chars.append(None)
+                continue
+            glyph = atlas.glyph(char).shift(RIGHT * i * atlas.advance)
+            self.chars.append(glyph)
+            self.add(glyph)
+
+        self.set_color(color)
+        if self.submobjects:
+            self.scale(font_size / DEFAULT_FONT_SIZE).center()
+
+    def set_char_color(self, indices, color):
+        """Recolor the characters at indices (an int, slice or iterable)"""
+        if isinstance(indices, int):
+            indices = [indices]
+        elif isinstance(indices, slice):
+            indices = range(*indices.indices(len(self.chars)))
+        for i in indices:
+            if self.chars[i] is not None:
+                self.chars[i].set_color(color)
+        return self
+
+    def highlight_diff(self, other, color=RED):
+        """Recolor characters that differ from other (a string or HexString). Returns their indices"""
+        other = other.text if isinstance(other, HexString) else other
+        changed = [i for i, char in enumerate(self.text) if i >= len(other) or other[i] != char]
+        self.set_char_color(changed, color)
+        return changed
@@ -0,0 +1,40 @@
+"""
+Temporary instrumentation hooks on manim classes
+
+Patches are applied at class level, so they also cover scenes that build
+other scenes (e.g. HashFunctionsBasicsComplete calling construct() on its
+parts), and are always undone when the with block exits.
+"""
+import contextlib
+import os
+import sys
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+COMPONENTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@contextlib.contextmanager
+def wrap_method(cls, name, wrapper):
+    """Replace cls.name with wrapper(original) for the duration of the block"""
+    had_own = name in cls.__dict__
+    original = cls.__dict__[name] if had_own else getattr(cls, name)
+    setattr(cls, name, wrapper(getattr(cls, name)))
+    try:
+        yield original
+    finally:
+        if had_own:
+            setattr(cls, name, original)
+        else:
+            delattr(cls, name)
+
+
+def caller_location():
+    """file:line of the innermost scene code on the stack (outside components/)"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        path = os.path.abspath(frame.f_code.co_filename)
+        if path.startswith(REPO_ROOT + os.sep) and not path.startswith(COMPONENTS_DIR + os.sep):
+            return f"{os.path.relpath(path, REPO_ROOT)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
@@ -0,0 +1,128 @@
+"""
+Import-time report for the components package
+
+Imports each target in a fresh interpreter under `python -X importtime`
+and summarizes what it cost: the total, each components module, and the
+heaviest third-party packages underneath (manim itself is usually most of
+it). A scene file can be a target too, to see what its imports pull in.
+
+Times come from CPython's own per-module report. Interpreter startup
+imports (site, encodings, ...) are left out, and every target gets its own
+interpreter so none of them is credited with modules another one loaded.
+
+Usage:
+    python -m components.importtime
+    python -m components.importtime components.tree scenes/phase1/12_schnorr_aggregation.py
+    python -m components.importtime --top 20 --json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# The package alone, then every module scenes load through it
+DEFAULT_TARGETS = ["components", "components.stack", "components.hash",
+                   "components.tree", "components.signature", "components.text",
+                   "components.hexstring", "components.prototypes", "components.bullets"]
+
+TOP = 10
+
+
+def parse_importtime(stderr):
+    """[(module, self_us, cumulative_us, depth)] from -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return rows
+
+
+def _statement(target):
+    if target.endswith(".py"):
+        path = os.path.abspath(target)
+        return f"import runpy; runpy.run_path({path!r})"
+    return f"import {target}"
+
+
+def _run(statement):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                          cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True)
+
+
+def startup_modules():
+    """Modules the interpreter imports before running anything (site, encodings, ...)"""
+    return {name for name, _, _, _ in parse_importtime(_run("pass").stderr)}
+
+
+def measure(target, startup=frozenset()):
+    """Import target in a fresh interpreter; returns a report dict"""
+    proc = _run(_statement(target))
+    rows = [row for row in parse_importtime(proc.stderr) if row[0] not in startup]
+    error = None
+    if proc.returncode:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"
+
+    # Top-level packages (numpy, manim, ...) with their cumulative time
+    packages = {}
+    for name, _, cumulative, _ in rows:
+        root = name.split(".")[0]
+        if root != "components" and "." not in name:
+            packages[root] = max(packages.get(root, 0), cumulative)
+    return {
+        "target": target,
+        "error": error,
+        "total": sum(self_us for _, self_us, _, _ in rows),
+        "modules": len(rows),
+        "components": {name: cumulative for name, _, cumulative, _ in rows
+                       if name == "components" or name.startswith("components.")},
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def _ms(us):
+    return f"{us / 1000:8.1f}ms"
+
+
+def print_report(report, top=TOP):
+    mark = "✗" if report["error"] else "✓"
+    print(f"  {mark} {report['target']:<48} {_ms(report['total'])}  {report['modules']:5d} modules")
+    if report["error"]:
+        print(f"      {report['error']}")
+    for name, cumulative in report["components"].items():
+        print(f"      {name:<44} {_ms(cumulative)}")
+    for name, cumulative in list(report["packages"].items())[:top]:
+        print(f"        {name:<42} {_ms(cumulative)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report import time of components modules and scene files")
+    parser.add_argument("targets", nargs="*", help="Modules or scene files (default: components modules)")
+    parser.add_argument("--top", type=int, default=TOP, help="Heaviest packages listed per target")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    startup = startup_modules()
+    reports = [measure(target, startup) for target in args.targets or DEFAULT_TARGETS]
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for report in reports:
+            print_report(report, args.top)
+    return 1 if any(r["error"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
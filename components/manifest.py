@@ -0,0 +1,217 @@
+"""
+Scene discovery and the preview render manifest
+
+Scenes are found by parsing scenes/**/*.py with ``ast``, so listing every
+Scene subclass takes milliseconds and never imports manim. PREVIEWS is the
+single list of which scene represents each module in the gallery. The
+orchestrator and the shell scripts read it from here, and
+public/previews/manifest.json carries it to the site.
+
+Usage:
+    python -m components.manifest                 # list every scene
+    python -m components.manifest --check         # validate PREVIEWS
+    python -m components.manifest --write public/previews/manifest.json
+"""
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import sys
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SCENES_DIR = os.path.join(REPO_ROOT, 'scenes')
+MANIFEST_PATH = os.path.join('public', 'previews', 'manifest.json')
+
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene", "VoiceoverScene"}
+
+# Scene file -> (scene class, output file) shown for each module in the gallery
+PREVIEWS = [
+    ("scenes/phase1/01_hash_intro.py", "HashIntroduction", "01_hash_intro.gif"),
+    ("scenes/phase1/02_sha256.py", "SHA256Overview", "02_sha256.gif"),
+    ("scenes/phase1/03_ripemd160.py", "Hash160Visualization", "03_ripemd160.gif"),
+    ("scenes/phase1/04_merkle_trees_intro.py", "BuildingMerkleTree", "04_merkle_tree.gif"),
+    ("scenes/phase1/05_merkle_proofs.py", "ProofExample", "05_merkle_proof.gif"),
+    ("scenes/phase1/06_public_key_intro.py", "PublicKeyIntroduction", "06_public_key.gif"),
+    ("scenes/phase1/07_elliptic_curves_intro.py", "EllipticCurveIntroduction", "07_elliptic_curve.gif"),
+    ("scenes/phase1/08_elliptic_curves_math.py", "VisualizingScalarMultiplication", "08_ec_math.gif"),
+    ("scenes/phase1/09_ecdsa_signing.py", "SigningVisualization", "09_ecdsa_sign.gif"),
+    ("scenes/phase1/10_ecdsa_verification.py", "VerificationVisualization", "10_ecdsa_verify.gif"),
+    ("scenes/phase1/11_schnorr_intro.py", "ECDSAvsSchnorr", "11_schnorr.gif"),
+    ("scenes/phase1/12_schnorr_aggregation.py", "MuSigProtocol", "12_schnorr_agg.gif"),
+    ("scenes/phase1/13_signatures_practice.py", "NonceReuseDeepDive", "13_sig_practice.gif"),
+    ("scenes/phase1/14_encoding.py", "Base58CheckEncoding", "14_encoding.gif"),
+]
+
+
+def module_number(path):
+    """Module number from a scene file name, e.g. '04' for 04_merkle_trees_intro.py"""
+    prefix = os.path.basename(path).split("_", 1)[0]
+    return prefix if prefix.isdigit() else None
+
+
+class SceneInfo:
+    """A Scene subclass found by static analysis"""
+
+    def __init__(self, file, name, line, doc=None):
+        self.file = file
+        self.name = name
+        self.line = line
+        self.doc = doc
+
+    @property
+    def module(self):
+        return module_number(self.file)
+
+    def to_dict(self):
+        return {"file": self.file, "scene": self.name, "line": self.line, "doc": self.doc}
+
+    def __repr__(self):
+        return f"SceneInfo({self.file!r}, {self.name!r})"
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def scene_classes(tree):
+    """Top-level Scene subclasses in a parsed module, in source order"""
+    scenes = set()
+    changed = True
+    while changed:
+        changed = False
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or node.name in scenes:
+                continue
+            bases = {_base_name(base) for base in node.bases}
+            if bases & (SCENE_BASES | scenes):
+                scenes.add(node.name)
+                changed = True
+    return [node for node in tree.body
+            if isinstance(node, ast.ClassDef) and node.name in scenes]
+
+
+def scene_files(scenes_dir=SCENES_DIR):
+    """Every Python file under scenes_dir, relative to the repository root"""
+    found = []
+    for root, _, files in os.walk(scenes_dir):
+        for filename in files:
+            if filename.endswith(".py"):
+                found.append(os.path.relpath(os.path.join(root, filename), REPO_ROOT))
+    return sorted(found)
+
+
+def discover(paths=None):
+    """SceneInfo for every Scene subclass in the given files (default: scenes/)"""
+    paths = paths if paths is not None else scene_files()
+    scenes = []
+    for path in paths:
+        with open(os.path.join(REPO_ROOT, path), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in scene_classes(tree):
+            scenes.append(SceneInfo(path, node.name, node.lineno, ast.get_docstring(node)))
+    return scenes
+
+
+def load_scene_class(scene_file, scene):
+    """Import a scene file by path (once per process) and return the named class"""
+    path = os.path.join(REPO_ROOT, scene_file)
+    module_name = "scenes_" + os.path.splitext(os.path.relpath(path, REPO_ROOT))[0].replace(os.sep, "_")
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[module_name]
+            raise
+
+    return getattr(module, scene)
+
+
+def validate(previews=PREVIEWS, scenes=None):
+    """Problems with the preview list, as human-readable strings"""
+    scenes = scenes if scenes is not None else discover()
+    known = {(info.file, info.name) for info in scenes}
+    by_file = {}
+    for info in scenes:
+        by_file.setdefault(info.file, []).append(info.name)
+
+    problems = []
+    outputs = set()
+    for scene_file, scene, output in previews:
+        if not os.path.exists(os.path.join(REPO_ROOT, scene_file)):
+            problems.append(f"{scene_file}: file not found")
+        elif (scene_file, scene) not in known:
+            problems.append(
+                f"{scene_file}: no scene named {scene} "
+                f"(available: {', '.join(by_file.get(scene_file, [])) or 'none'})"
+            )
+        if output in outputs:
+            problems.append(f"{output}: used by more than one preview")
+        outputs.add(output)
+    return problems
+
+
+def build_manifest(previews=PREVIEWS, scenes=None):
+    """The manifest shared by the orchestrator and the gallery site"""
+    scenes = scenes if scenes is not None else discover()
+    counts = {}
+    for info in scenes:
+        counts[info.file] = counts.get(info.file, 0) + 1
+
+    return {
+        "previews": [
+            {
+                "module": module_number(scene_file),
+                "file": scene_file,
+                "scene": scene,
+                "output": output,
+                "scene_count": counts.get(scene_file, 0),
+            }
+            for scene_file, scene, output in previews
+        ],
+        "scenes": [info.to_dict() for info in scenes],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Discover scenes and validate the preview manifest")
+    parser.add_argument("--check", action="store_true", help="Validate PREVIEWS and exit")
+    parser.add_argument("--write", metavar="PATH", nargs="?", const=MANIFEST_PATH,
+                        help=f"Write the manifest JSON (default: {MANIFEST_PATH})")
+    args = parser.parse_args(argv)
+
+    scenes = discover()
+    problems = validate(scenes=scenes)
+    for problem in problems:
+        print(f"✗ {problem}", file=sys.stderr)
+
+    if args.check:
+        if not problems:
+            print(f"✓ {len(PREVIEWS)} previews valid ({len(scenes)} scenes discovered)")
+        return 1 if problems else 0
+
+    if args.write:
+        path = os.path.join(REPO_ROOT, args.write)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(build_manifest(scenes=scenes), f, indent=2)
+        print(f"✓ Wrote {args.write}")
+        return 1 if problems else 0
+
+    for info in scenes:
+        print(f"{info.file}:{info.line} {info.name}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
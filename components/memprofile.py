@@ -0,0 +1,246 @@
+"""
+Peak memory and mobject-growth profiler
+
+Runs each scene in its own process (so RSS belongs to that scene alone)
+and samples at every animation boundary:
+  - RSS and tracemalloc's current/peak traced memory
+  - live mobjects in scene.mobjects (counting submobjects) and their total
+    bezier points
+  - top-level mobjects that are fully transparent but still in the scene
+
+Scenes whose mobject count never goes down are flagged, as are scenes that
+end with invisible mobjects: both usually mean objects are faded or set to
+opacity 0 with .animate instead of FadeOut/self.remove, and keep costing
+memory and draw time on every later frame.
+
+By default animations are skipped (like dryrun.py), which profiles scene
+state; --render also rasterizes and encodes frames.
+
+Usage:
+    python -m components.memprofile scenes/phase1/01_hash_intro.py
+    python -m components.memprofile scenes/phase1/05_merkle_proofs.py --scene ProofExample --samples
+    python -m components.memprofile --render --json
+"""
+import argparse
+import json
+import linecache
+import os
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+from components.hooks import caller_location, wrap_method
+from components.manifest import discover, load_scene_class
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Flag steady growth only once the scene has grown this many times
+GROWTH_MIN_STEPS = 3
+TOP_ALLOCATIONS = 8
+
+MB = 1024 * 1024
+
+
+def rss_bytes():
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _is_invisible(mobject):
+    """True if nothing in mobject's family would draw a pixel"""
+    drawable = [m for m in mobject.get_family() if len(m.points)]
+    if not drawable:
+        return False
+    for m in drawable:
+        if not hasattr(m, "get_fill_opacity"):
+            return False
+        if m.get_fill_opacity() > 0 or m.get_stroke_opacity() > 0:
+            return False
+    return True
+
+
+def sample(scene):
+    """Memory and mobject numbers for scene right now"""
+    family = [m for top in scene.mobjects for m in top.get_family()]
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "rss": rss_bytes(),
+        "traced": current,
+        "traced_peak": peak,
+        "mobjects": len(family),
+        "points": sum(len(m.points) for m in family),
+        "invisible": sum(1 for top in scene.mobjects if _is_invisible(top)),
+    }
+
+
+def monotonic_growth(counts, min_steps=GROWTH_MIN_STEPS):
+    """True if counts never decrease and increase at least min_steps times"""
+    steps = list(zip(counts, counts[1:]))
+    return (len(steps) > 0 and all(b >= a for a, b in steps)
+            and sum(1 for a, b in steps if b > a) >= min_steps)
+
+
+def _top_allocations(snapshot, limit=TOP_ALLOCATIONS):
+    stats = snapshot.statistics("lineno")[:limit]
+    rows = []
+    for stat in stats:
+        frame = stat.traceback[0]
+        rows.append({
+            "location": f"{os.path.relpath(frame.filename, REPO_ROOT)}:{frame.lineno}",
+            "size": stat.size,
+            "count": stat.count,
+            "code": linecache.getline(frame.filename, frame.lineno).strip(),
+        })
+    return rows
+
+
+def profile_scene(scene_file, scene, render=False):
+    """Run one scene with sampling hooks; returns the profile dict"""
+    from manim import Scene, tempconfig
+
+    samples = []
+    peak = {"traced": -1, "snapshot": None}
+
+    def sampling(play):
+        def wrapper(instance, *args, **kwargs):
+            outcome = play(instance, *args, **kwargs)
+            point = sample(instance)
+            point["index"] = len(samples)
+            point["line"] = caller_location()
+            samples.append(point)
+            # Keep a snapshot of the allocation sites at the highest point
+            if point["traced"] > peak["traced"]:
+                peak["traced"] = point["traced"]
+                peak["snapshot"] = tracemalloc.take_snapshot()
+            return outcome
+        return wrapper
+
+    settings = {} if render else {"dry_run": True, "from_animation_number": sys.maxsize}
+    error = None
+    tracemalloc.start()
+    try:
+        with tempconfig(settings), wrap_method(Scene, "play", sampling):
+            load_scene_class(scene_file, scene)().render()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        tracemalloc.stop()
+
+    counts = [s["mobjects"] for s in samples]
+    last = samples[-1] if samples else {}
+    return {
+        "file": scene_file,
+        "scene": scene,
+        "error": error,
+        "animations": len(samples),
+        "peak_rss": max((s["rss"] for s in samples), default=rss_bytes()),
+        "peak_traced": max((s["traced_peak"] for s in samples), default=0),
+        "peak_mobjects": max(counts, default=0),
+        "final_mobjects": last.get("mobjects", 0),
+        "peak_points": max((s["points"] for s in samples), default=0),
+        "final_invisible": last.get("invisible", 0),
+        "monotonic_growth": monotonic_growth(counts),
+        "top_allocations": _top_allocations(peak["snapshot"]) if peak["snapshot"] else [],
+        "samples": samples,
+    }
+
+
+def profile_in_subprocess(scene_file, scene, render=False):
+    """profile_scene in a fresh interpreter, so RSS is this scene's alone"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    cmd = [sys.executable, "-m", "components.memprofile", "--child", scene_file, scene]
+    if render:
+        cmd.append("--render")
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, text=True)
+    try:
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"file": scene_file, "scene": scene, "animations": 0,
+                "error": f"profiler exited with {proc.returncode}: {proc.stderr.strip()[-500:]}"}
+
+
+def flags(profile):
+    """Human-readable warnings for one profile"""
+    found = []
+    if profile.get("monotonic_growth"):
+        found.append(f"mobjects only grow ({profile['samples'][0]['mobjects']} -> {profile['final_mobjects']})")
+    if profile.get("final_invisible"):
+        found.append(f"{profile['final_invisible']} invisible mobjects left in scene")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile peak memory and mobject growth per scene")
+    parser.add_argument("files", nargs="*", help="Scene files (default: every file under scenes/)")
+    parser.add_argument("--scene", action="append", default=[], help="Only these scene classes")
+    parser.add_argument("--render", action="store_true", help="Rasterize and encode frames too")
+    parser.add_argument("--samples", action="store_true", help="Print every animation-boundary sample")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    parser.add_argument("--child", nargs=2, metavar=("FILE", "SCENE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    if args.child:
+        profile = profile_scene(*args.child, render=args.render)
+        print(json.dumps(profile))
+        return 0
+
+    files = [os.path.relpath(os.path.abspath(path), REPO_ROOT) for path in args.files] or None
+    scenes = [(info.file, info.name) for info in discover(files)
+              if not args.scene or info.name in args.scene]
+
+    profiles = []
+    if not args.json:
+        print(f"  {'scene':<34} {'peak RSS':>9} {'traced':>9} {'mobjects':>9} {'final':>6} {'points':>9}")
+    for scene_file, scene in scenes:
+        profile = profile_in_subprocess(scene_file, scene, args.render)
+        profiles.append(profile)
+        if args.json:
+            continue
+        if profile["error"] and not profile.get("samples"):
+            print(f"  ✗ {scene:<32} {profile['error']}")
+            continue
+
+        warnings = flags(profile)
+        mark = "!" if warnings else "✓"
+        print(f"  {mark} {scene:<32} {profile['peak_rss'] / MB:7.1f}MB {profile['peak_traced'] / MB:7.1f}MB "
+              f"{profile['peak_mobjects']:9d} {profile['final_mobjects']:6d} {profile['peak_points']:9d}")
+        for warning in warnings:
+            print(f"      ! {warning}")
+        if profile["error"]:
+            print(f"      ✗ {profile['error']}")
+        if args.samples:
+            for s in profile["samples"]:
+                print(f"      #{s['index']:<4} {s['rss'] / MB:7.1f}MB {s['traced'] / MB:7.1f}MB "
+                      f"{s['mobjects']:7d} mobjects {s['points']:8d} points "
+                      f"{s['invisible']:3d} invisible  {s['line'] or ''}")
+            for row in profile["top_allocations"]:
+                print(f"      {row['size'] / 1024:9.1f} KB  {row['location']}  {row['code'][:60]}")
+
+    if args.json:
+        print(json.dumps(profiles, indent=2))
+    else:
+        flagged = [p for p in profiles if flags(p)]
+        failed = [p for p in profiles if p["error"]]
+        print("")
+        print(f"Profiled {len(profiles)} scenes: {len(flagged)} flagged, {len(failed)} failed")
+        if profiles:
+            worst = max(profiles, key=lambda p: p.get("peak_rss", 0))
+            print(f"Highest peak RSS: {worst['scene']} ({worst.get('peak_rss', 0) / MB:.1f}MB)")
+    return 1 if any(p["error"] for p in profiles) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Microbenchmarks for component construction cost
+
+Times the construction of every public class in components/__init__.py at
+several sizes (e.g. MerkleTree with 4, 64 and 1024 leaves) and measures
+the memory each construction allocates with tracemalloc. Timing and
+allocation runs are separate, so tracemalloc overhead never shows up in
+the times.
+
+The first construction in a process also pays for Pango font setup and
+for writing Text SVGs to media/texts, so it is reported as "first" and
+left out of the median.
+
+Usage:
+    python -m components.microbench
+    python -m components.microbench --only MerkleTree HashNode
+    python -m components.microbench --json before.json
+    python -m components.microbench --compare before.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+REPEAT = 5
+# Stop repeating a case once it has used this much time
+TIME_BUDGET = 5.0
+
+
+def _hex(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def _leaves(n):
+    return [f"Tx{i}" for i in range(n)]
+
+
+def _binary_tree(depth):
+    """BinaryTreeGeneric data for a complete tree of the given depth"""
+    data = {}
+    count = 2 ** depth - 1
+    for i in range(count):
+        left, right = 2 * i + 1, 2 * i + 2
+        data[i] = (i, left if left < count else None, right if right < count else None)
+    return data
+
+
+def _stack(cls, n):
+    from components import StackElement
+
+    stack = cls()
+    for i in range(n):
+        stack.push_element(StackElement(f"0x{_hex(i)[:8]}"))
+    return stack
+
+
+def cases():
+    """name -> [(size label, setup, build)]; setup's result is passed to build"""
+    import components as c
+    from manim import Axes, Text
+
+    none = lambda: None  # noqa: E731
+    return {
+        "StackElement": [
+            ("OP_DUP", none, lambda _: c.StackElement("OP_DUP")),
+            ("64 hex", none, lambda _: c.StackElement(_hex(0))),
+        ],
+        "Stack": [(f"{n} elements", none, lambda _, n=n: _stack(c.Stack, n)) for n in (1, 8, 32)],
+        "AnimatedStack": [(f"{n} elements", none, lambda _, n=n: _stack(c.AnimatedStack, n)) for n in (1, 8, 32)],
+        "HashMachine": [("default", none, lambda _: c.HashMachine())],
+        "DataBox": [
+            ("short", none, lambda _: c.DataBox("Hello")),
+            ("64 hex", none, lambda _: c.DataBox(_hex(0))),
+        ],
+        "HashVisualization": [("default", none, lambda _: c.HashVisualization("Hello"))],
+        "AvalancheEffect": [("default", none, lambda _: c.AvalancheEffect())],
+        "HashNode": [
+            ("leaf", none, lambda _: c.HashNode("Tx0", is_leaf=True)),
+            ("internal", none, lambda _: c.HashNode(_hex(0))),
+        ],
+        "MerkleTree": [(f"{n} leaves", none, lambda _, n=n: c.MerkleTree(_leaves(n))) for n in (4, 64, 1024)],
+        "MerkleProofVisualization": [
+            (f"{n} leaves", lambda n=n: c.MerkleTree(_leaves(n)),
+             lambda tree, n=n: c.MerkleProofVisualization(tree, n // 2))
+            for n in (4, 64, 1024)
+        ],
+        "BinaryTreeGeneric": [
+            (f"{2 ** d - 1} nodes", none, lambda _, d=d: c.BinaryTreeGeneric(_binary_tree(d), 0))
+            for d in (2, 4, 6)
+        ],
+        "HexString": [
+            ("8 hex", none, lambda _: c.HexString(_hex(0)[:8])),
+            ("64 hex", none, lambda _: c.HexString(_hex(0))),
+        ],
+        "BulletList": [
+            (f"{n} lines", lambda n=n: [Text(_hex(i)[:16]) for i in range(n)],
+             lambda lines: c.BulletList(*[line.copy() for line in lines]))
+            for n in (5, 20)
+        ],
+        "KeyPair": [("default", none, lambda _: c.KeyPair())],
+        "SignatureProcess": [("default", none, lambda _: c.SignatureProcess())],
+        "VerificationProcess": [("default", none, lambda _: c.VerificationProcess())],
+        "EllipticCurve": [
+            (f"x ±{r}", none, lambda _, r=r: c.EllipticCurve(x_range=(-r, r), y_range=(-r, r)))
+            for r in (3, 6)
+        ],
+        "PointAddition": [
+            ("default", lambda: Axes(x_range=[-3, 3, 1], y_range=[-3, 3, 1]),
+             lambda axes: c.PointAddition((-1, 2), (1, 2.5), (2, 3), axes)),
+        ],
+    }
+
+
+def _family_stats(mobject):
+    family = mobject.get_family()
+    return len(family), sum(len(m.points) for m in family)
+
+
+def measure(setup, build, repeat=REPEAT, budget=TIME_BUDGET):
+    """Time and allocation numbers for one case"""
+    times = []
+    spent = 0.0
+    first = None
+    for i in range(repeat + 1):
+        arg = setup()
+        start = time.perf_counter()
+        result = build(arg)
+        elapsed = time.perf_counter() - start
+        if i == 0:
+            first = elapsed
+        else:
+            times.append(elapsed)
+        spent += elapsed
+        if spent > budget and times:
+            break
+
+    arg = setup()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = build(arg)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mobjects, points = _family_stats(result)
+    return {
+        "first": round(first, 6),
+        "median": round(statistics.median(times), 6),
+        "min": round(min(times), 6),
+        "runs": len(times),
+        "peak_alloc": peak - before,
+        "retained": after - before,
+        "mobjects": mobjects,
+        "points": points,
+    }
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:9.2f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark construction of every component class")
+    parser.add_argument("--only", nargs="+", default=[], help="Only these classes")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help=f"Timed runs per case (default: {REPEAT})")
+    parser.add_argument("--budget", type=float, default=TIME_BUDGET,
+                        help=f"Seconds after which a case stops repeating (default: {TIME_BUDGET})")
+    parser.add_argument("--json", metavar="PATH", help="Write results to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="Show changes against earlier --json results")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    import components
+
+    all_cases = cases()
+    missing = [name for name in components.__all__ if name not in all_cases]
+    if missing:
+        print(f"! No microbenchmark for {', '.join(missing)}")
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    print(f"  {'class':<26} {'size':<12} {'first ms':>9} {'median ms':>9} {'change':>7} "
+          f"{'peak KB':>9} {'kept KB':>9} {'mobjects':>8} {'points':>8}")
+    results = {}
+    failed = 0
+    for name in components.__all__:
+        if args.only and name not in args.only:
+            continue
+        for size, setup, build in all_cases.get(name, []):
+            key = f"{name}[{size}]"
+            try:
+                r = measure(setup, build, args.repeat, args.budget)
+            except Exception as e:
+                failed += 1
+                print(f"  ✗ {name:<24} {size:<12} {type(e).__name__}: {e}")
+                continue
+            results[key] = r
+            change = ""
+            if key in previous:
+                change = f"{(r['median'] / previous[key]['median'] - 1) * 100:+6.0f}%"
+            print(f"  {name:<26} {size:<12} {_ms(r['first'])} {_ms(r['median'])} {change:>7} "
+                  f"{r['peak_alloc'] / 1024:9.1f} {r['retained'] / 1024:9.1f} {r['mobjects']:8d} {r['points']:8d}")
+
+    from components.text import text_cache_info
+
+    info = text_cache_info()
+    print(f"  cached_text: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} entries")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Wrote {args.json}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
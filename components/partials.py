@@ -0,0 +1,207 @@
+"""
+Persistent store for manim partial movie files
+
+With caching enabled manim writes one partial movie per play() call, named
+by a hash of the animation and scene state, and skips any play() whose
+partial already exists. The per-job media directories are thrown away
+between CI runs, so this store keeps the partials in a persistent directory
+(mounted into the build container) and seeds each job with them before
+rendering. A scene with one edited slide then only re-encodes the
+animations that changed.
+
+Layout:
+    <root>/<module>/<Scene>/<quality>/<hash>.mp4
+    <root>/<module>/<Scene>/index.json     # size, sha256, last_used per file
+"""
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+from components.cache import CACHE_ROOT
+
+
+PARTIALS_DIR = os.path.join(CACHE_ROOT, 'partials')
+MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+INDEX_FILE = "index.json"
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _link_or_copy(source, destination):
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def partial_dirs(media_dir, module, scene):
+    """(quality, path) for each partial_movie_files dir of a scene in media_dir"""
+    videos = os.path.join(media_dir, "videos", module)
+    if not os.path.isdir(videos):
+        return []
+    found = []
+    for quality in sorted(os.listdir(videos)):
+        path = os.path.join(videos, quality, "partial_movie_files", scene)
+        if os.path.isdir(path):
+            found.append((quality, path))
+    return found
+
+
+def _used_partials(path):
+    """Partial files referenced by manim's partial_movie_file_list.txt"""
+    list_file = os.path.join(path, "partial_movie_file_list.txt")
+    if not os.path.exists(list_file):
+        return None
+    used = set()
+    with open(list_file) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("file "):
+                used.add(os.path.basename(line[5:].strip("'")))
+    return used
+
+
+class PartialMovieStore:
+    """Persistent, integrity-checked, size-bounded partial movie store"""
+
+    def __init__(self, root=PARTIALS_DIR, max_bytes=MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _scene_dir(self, module, scene):
+        return os.path.join(self.root, module, scene)
+
+    def _read_index(self, scene_dir):
+        try:
+            with open(os.path.join(scene_dir, INDEX_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, scene_dir, index):
+        os.makedirs(scene_dir, exist_ok=True)
+        # Unique per writer: pool workers and farm processes may share a scene
+        tmp = os.path.join(scene_dir, f"{INDEX_FILE}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp, os.path.join(scene_dir, INDEX_FILE))
+
+    def restore(self, media_dir, module, scene):
+        """
+        Seed media_dir with every stored partial for scene, dropping
+        entries that fail their checksum. Returns the number restored.
+        """
+        scene_dir = self._scene_dir(module, scene)
+        index = self._read_index(scene_dir)
+        restored = 0
+
+        for relpath, entry in list(index.items()):
+            stored = os.path.join(scene_dir, relpath)
+            if (not os.path.exists(stored)
+                    or os.path.getsize(stored) != entry["size"]
+                    or _sha256_file(stored) != entry["sha256"]):
+                print(f"  ! Dropping corrupt partial {module}/{scene}/{relpath}", file=sys.stderr)
+                if os.path.exists(stored):
+                    os.remove(stored)
+                del index[relpath]
+                continue
+
+            quality, filename = os.path.split(relpath)
+            target_dir = os.path.join(media_dir, "videos", module, quality,
+                                      "partial_movie_files", scene)
+            os.makedirs(target_dir, exist_ok=True)
+            target = os.path.join(target_dir, filename)
+            if not os.path.exists(target):
+                _link_or_copy(stored, target)
+            restored += 1
+
+        if index or os.path.isdir(scene_dir):
+            self._write_index(scene_dir, index)
+        return restored
+
+    def collect(self, media_dir, module, scene, only=None):
+        """
+        Save new partials from a finished render, or just the filenames in
+        only (e.g. those a failed render's checkpoint lists as complete).
+        Returns the number added.
+        """
+        scene_dir = self._scene_dir(module, scene)
+        index = self._read_index(scene_dir)
+        now = time.time()
+        added = 0
+
+        for quality, path in partial_dirs(media_dir, module, scene):
+            used = _used_partials(path)
+            for filename in os.listdir(path):
+                if not filename.endswith(".mp4") or filename.startswith("uncached_"):
+                    continue
+                if used is not None and filename not in used:
+                    continue
+                if only is not None and filename not in only:
+                    continue
+
+                relpath = os.path.join(quality, filename)
+                if relpath in index:
+                    index[relpath]["last_used"] = now
+                    continue
+
+                stored = os.path.join(scene_dir, relpath)
+                os.makedirs(os.path.dirname(stored), exist_ok=True)
+                shutil.copyfile(os.path.join(path, filename), stored)
+                index[relpath] = {
+                    "size": os.path.getsize(stored),
+                    "sha256": _sha256_file(stored),
+                    "last_used": now,
+                }
+                added += 1
+
+        if index:
+            self._write_index(scene_dir, index)
+        return added
+
+    def evict(self):
+        """Drop least-recently-used partials until the store fits its budget"""
+        if not os.path.isdir(self.root):
+            return 0
+
+        entries = []
+        indexes = {}
+        for module in os.listdir(self.root):
+            module_dir = os.path.join(self.root, module)
+            if not os.path.isdir(module_dir):
+                continue
+            for scene in os.listdir(module_dir):
+                scene_dir = os.path.join(module_dir, scene)
+                index = self._read_index(scene_dir)
+                indexes[scene_dir] = index
+                for relpath, entry in index.items():
+                    entries.append((entry["last_used"], entry["size"], scene_dir, relpath))
+
+        entries.sort()
+        total = sum(size for _, size, _, _ in entries)
+        evicted = 0
+        touched = set()
+
+        while entries and total > self.max_bytes:
+            _, size, scene_dir, relpath = entries.pop(0)
+            stored = os.path.join(scene_dir, relpath)
+            if os.path.exists(stored):
+                os.remove(stored)
+            del indexes[scene_dir][relpath]
+            touched.add(scene_dir)
+            total -= size
+            evicted += 1
+
+        for scene_dir in touched:
+            self._write_index(scene_dir, indexes[scene_dir])
+        return evicted
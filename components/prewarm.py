@@ -0,0 +1,229 @@
+"""
+Pre-warmed text and formula caches
+
+manim lays out every Text() with Pango into <text_dir>/<hash>.svg and
+reuses that file when it exists; MathTex/Tex do the same in tex_dir. A
+fresh container starts with both empty and a cold fontconfig, so the
+first render of every string pays for font discovery and layout.
+
+The Docker build bakes these caches in three steps:
+  1. strings: a small stage copies the sources and lists every literal
+     Text/MarkupText/MathTex/Tex/cached_text call, plus the HexString
+     glyph atlas, into strings.json (ast only, no manim)
+  2. bake: the main image copies strings.json and this file, runs
+     fc-cache, then constructs every entry with text_dir pointing at
+     TEXT_CACHE_DIR. Docker caches this layer on the contents of
+     strings.json, so it is rebuilt only when strings change
+  3. render.py seeds each job's media_dir/texts from TEXT_CACHE_DIR and
+     adds the SVGs new renders produced
+
+The bake step runs this file as a plain script before the repository is
+copied in, so it imports nothing from components at module level.
+
+Usage:
+    python -m components.prewarm strings > strings.json
+    python components/prewarm.py bake strings.json --text-dir /opt/text-cache --tex-dir tex_cache
+    python -m components.prewarm status
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import shutil
+import sys
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Same root as the render cache (components/cache.py); the image overrides it
+TEXT_CACHE_DIR = os.environ.get(
+    "TEXT_CACHE_DIR",
+    os.path.join(os.environ.get("RENDER_CACHE_DIR", os.path.join(REPO_ROOT, '.render-cache')), 'texts'),
+)
+
+TEXT_CLASSES = {"Text", "MarkupText", "cached_text"}
+TEX_CLASSES = {"MathTex", "Tex"}
+# Options that change a Tex expression's LaTeX source (color doesn't)
+TEX_OPTIONS = {"tex_environment", "arg_separator", "substrings_to_isolate"}
+
+
+def _call_name(node):
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _value(node):
+    """A literal, {"name": X} for a bare name such as BLUE, or raise ValueError"""
+    if isinstance(node, ast.Name):
+        return {"name": node.id}
+    return ast.literal_eval(node)
+
+
+def _entry(node):
+    """strings.json entry for a Text/Tex call, or None if it isn't fully literal"""
+    name = _call_name(node)
+    if not node.args or not all(isinstance(a, ast.Constant) and isinstance(a.value, str) for a in node.args):
+        return None
+    kwargs = {}
+    for keyword in node.keywords:
+        if keyword.arg is None:
+            return None  # **kwargs
+        if name in TEX_CLASSES and keyword.arg not in TEX_OPTIONS:
+            continue
+        # cached_text lays out uncolored text and colors the copy
+        if name == "cached_text" and keyword.arg == "color":
+            continue
+        try:
+            kwargs[keyword.arg] = _value(keyword.value)
+        except ValueError:
+            return None
+    return {"class": "Text" if name == "cached_text" else name,
+            "args": [a.value for a in node.args], "kwargs": kwargs}
+
+
+def _constants(path, names):
+    """Top-level literal assignments in a source file"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    found = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if node.targets[0].id in names:
+                found[node.targets[0].id] = ast.literal_eval(node.value)
+    return found
+
+
+def collect_strings(root=REPO_ROOT):
+    """Sorted, de-duplicated strings.json entries for scenes/ and components/"""
+    paths = sorted(glob.glob(os.path.join(root, 'scenes', '**', '*.py'), recursive=True)
+                   + glob.glob(os.path.join(root, 'components', '*.py')))
+    entries = {}
+    skipped = 0
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or _call_name(node) not in TEXT_CLASSES | TEX_CLASSES:
+                continue
+            entry = _entry(node)
+            if entry is None:
+                skipped += 1
+                continue
+            entries[json.dumps(entry, sort_keys=True)] = entry
+
+    # The HexString glyph atlas (see hexstring.py)
+    hexstring = os.path.join(root, 'components', 'hexstring.py')
+    if os.path.exists(hexstring):
+        constants = _constants(hexstring, {"HEX_GLYPHS", "HEX_FONT"})
+        atlas = {"class": "Text", "args": ["00" + constants["HEX_GLYPHS"]],
+                 "kwargs": {"font": constants["HEX_FONT"], "disable_ligatures": True}}
+        entries[json.dumps(atlas, sort_keys=True)] = atlas
+
+    return [entries[key] for key in sorted(entries)], skipped
+
+
+def bake(entries, text_dir=TEXT_CACHE_DIR, tex_dir=None, log=print):
+    """Construct every entry so manim writes its SVG. Returns the number of failures"""
+    import manim
+
+    settings = {"text_dir": os.path.abspath(text_dir)}
+    if tex_dir:
+        settings["tex_dir"] = os.path.abspath(tex_dir)
+    for path in settings.values():
+        os.makedirs(path, exist_ok=True)
+
+    failed = 0
+    with manim.tempconfig(settings):
+        for entry in entries:
+            try:
+                kwargs = {key: getattr(manim, value["name"]) if isinstance(value, dict) else value
+                          for key, value in entry["kwargs"].items()}
+                getattr(manim, entry["class"])(*entry["args"], **kwargs)
+            except Exception as e:
+                failed += 1
+                log(f"  ! {entry['class']}{tuple(entry['args'])}: {type(e).__name__}: {e}")
+
+    # LaTeX leaves .tex/.dvi/.log files next to the SVGs
+    if tex_dir:
+        for name in os.listdir(tex_dir):
+            if not name.endswith(".svg"):
+                os.remove(os.path.join(tex_dir, name))
+    return failed
+
+
+def _link(source, destination):
+    """Hard link (or copy) source to destination atomically"""
+    tmp = f"{destination}.{os.getpid()}.tmp"
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, destination)
+
+
+def _svgs(directory):
+    if not os.path.isdir(directory):
+        return set()
+    return {name for name in os.listdir(directory) if name.endswith(".svg")}
+
+
+def seed(media_dir, cache_dir=TEXT_CACHE_DIR, subdir="texts"):
+    """Give media_dir/subdir every cached SVG it doesn't have. Returns the count"""
+    texts = os.path.join(media_dir, subdir)
+    missing = _svgs(cache_dir) - _svgs(texts)
+    if missing:
+        os.makedirs(texts, exist_ok=True)
+    for name in missing:
+        _link(os.path.join(cache_dir, name), os.path.join(texts, name))
+    return len(missing)
+
+
+def collect(media_dir, cache_dir=TEXT_CACHE_DIR, subdir="texts"):
+    """Add SVGs a finished job wrote to media_dir/subdir to the cache. Returns the count"""
+    texts = os.path.join(media_dir, subdir)
+    new = _svgs(texts) - _svgs(cache_dir)
+    if new:
+        os.makedirs(cache_dir, exist_ok=True)
+    for name in new:
+        _link(os.path.join(texts, name), os.path.join(cache_dir, name))
+    return len(new)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Collect, bake and inspect the text and formula caches")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("strings", help="Print strings.json for every literal text and formula")
+    bake_parser = commands.add_parser("bake", help="Lay out every entry of a strings.json")
+    bake_parser.add_argument("strings", help="strings.json from the strings command")
+    bake_parser.add_argument("--text-dir", default=TEXT_CACHE_DIR, help="Where text SVGs are written")
+    bake_parser.add_argument("--tex-dir", help="Where formula SVGs are written (default: skip formulas)")
+    commands.add_parser("status", help="Show the size of the text cache")
+    args = parser.parse_args(argv)
+
+    if args.command == "strings":
+        entries, skipped = collect_strings()
+        print(json.dumps(entries, indent=1, ensure_ascii=False))
+        print(f"{len(entries)} strings, {skipped} computed calls left to render time", file=sys.stderr)
+        return 0
+
+    if args.command == "bake":
+        with open(args.strings, encoding="utf-8") as f:
+            entries = json.load(f)
+        if not args.tex_dir:
+            entries = [e for e in entries if e["class"] not in TEX_CLASSES]
+        failed = bake(entries, args.text_dir, args.tex_dir)
+        print(f"✓ Baked {len(entries) - failed} of {len(entries)} strings into {args.text_dir}")
+        return 0  # a string that fails to lay out here is laid out at render time instead
+
+    svgs = _svgs(TEXT_CACHE_DIR)
+    size = sum(os.path.getsize(os.path.join(TEXT_CACHE_DIR, name)) for name in svgs)
+    print(f"{len(svgs)} text SVGs, {size / 1024:.0f} KB in {TEXT_CACHE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
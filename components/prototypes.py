@@ -0,0 +1,64 @@
+"""
+Prototype geometry for repeated component shapes
+
+A 1024-leaf MerkleTree builds 2047 identical circles, and every pushed
+StackElement builds another rectangle. Constructing a manim shape runs
+its whole __init__ chain: bezier generation, color and style setup.
+Here each canonical shape is built once and later instances are stamped
+out with clone(), which copies the point and color arrays directly
+instead of going through __init__ or deepcopy.
+
+Instances don't share point arrays. manim updates points in place in
+many places (e.g. apply_points_function_about_point subtracts and adds
+the pivot with -= and +=), so a shared array would move every
+instance.
+"""
+from manim import *
+import functools
+
+
+def clone(mobject):
+    """Independent copy of a shape without submobjects, cheaper than .copy()"""
+    if mobject.submobjects:
+        raise ValueError("clone() copies single shapes; use .copy() for groups")
+    copy = object.__new__(type(mobject))
+    for key, value in mobject.__dict__.items():
+        if isinstance(value, (np.ndarray, list, dict)):
+            value = value.copy()
+        copy.__dict__[key] = value
+    copy.original_id = str(id(mobject))
+    return copy
+
+
+def _styled(shape, color, fill_color, fill_opacity):
+    shape.set_color(color)
+    if fill_color is not None or fill_opacity:
+        shape.set_fill(fill_color if fill_color is not None else color, opacity=fill_opacity)
+    return shape
+
+
+@functools.lru_cache(maxsize=None)
+def _circle(radius):
+    return Circle(radius=radius)
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_square():
+    return Rectangle(width=1, height=1)
+
+
+def circle(radius=1.0, color=RED, fill_color=None, fill_opacity=0.0):
+    """Circle(radius=..., color=..., fill_color=..., fill_opacity=...) from a prototype"""
+    return _styled(clone(_circle(radius)), color, fill_color, fill_opacity)
+
+
+def rectangle(width, height, color=WHITE, fill_color=None, fill_opacity=0.0):
+    """Rectangle centered on the origin, stretched from a unit square prototype"""
+    shape = clone(_unit_square()).stretch(width, 0).stretch(height, 1)
+    return _styled(shape, color, fill_color, fill_opacity)
+
+
+def surrounding_rectangle(mobject, buff=SMALL_BUFF, color=YELLOW, fill_color=None, fill_opacity=0.0):
+    """SurroundingRectangle(mobject, ...) from a prototype"""
+    shape = rectangle(mobject.width + 2 * buff, mobject.height + 2 * buff, color, fill_color, fill_opacity)
+    return shape.move_to(mobject)
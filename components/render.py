@@ -0,0 +1,507 @@
+"""
+Parallel render orchestrator for preview GIFs
+
+Fans manim renders out across a process pool. Each job renders into its
+own media directory so workers never race on partial movie files.
+Scenes whose render key is unchanged are copied from the render cache
+instead of being rendered again, and every job is seeded with the stored
+partial movie files so manim only re-encodes animations that changed, and
+with the laid-out text SVGs (see prewarm.py).
+
+LaTeX output goes to a tex dir inside each job's media dir, seeded from
+tex_cache/ (see texcache.py). Newly compiled SVGs are linked back into
+tex_cache/ atomically once the job succeeds, so parallel workers never
+compile into the same files.
+
+Usage:
+    python -m components.render                  # all Phase 1 previews
+    python -m components.render --workers 4
+    python -m components.render --module 01 04
+    python -m components.render 04_merkle_trees_intro.py BuildingMerkleTree
+    python -m components.render 14_encoding.py --segments 4
+    python -m components.render --daemon         # use a running components.daemon
+    python -m components.render --longest-first  # after python -m components.timeline --write
+    python -m components.render --reproducible   # byte-identical output for identical inputs
+"""
+import argparse
+import configparser
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from components import checkpoint as checkpoints
+from components import prewarm as prewarm_cache
+from components import reproducible
+from components.cache import CACHE_DIR, MAX_BYTES, RenderCache, render_key
+from components.daemon import SOCKET_PATH, is_running, submit
+from components.deps import DependencyGraph, changed_since
+from components.manifest import PREVIEWS, build_manifest, module_number, validate
+from components.partials import MAX_BYTES as PARTIALS_MAX_BYTES, PARTIALS_DIR, PartialMovieStore
+from components.texcache import TEX_CACHE_DIR
+from components.timeline import TIMELINE_PATH, load_durations
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PREVIEW_DIR = os.path.join('public', 'previews', 'phase1')
+MEDIA_ROOT = os.path.join('media', 'render')
+
+FILE_READY_RE = re.compile(r"File ready at\s+'([^']+)'")
+
+
+class RenderJob:
+    """A single scene render: source file, scene class and output name"""
+
+    def __init__(self, scene_file, scene, output, quality="l", fmt="gif", animations=None,
+                 reproducible=False):
+        self.scene_file = scene_file
+        self.scene = scene
+        self.output = output
+        self.quality = quality
+        self.fmt = fmt
+        # Optional (first, last) play() range, passed to manim as -n
+        if animations is not None and len(animations) > 1 and animations[1] == 0:
+            raise ValueError("manim reads an upper bound of 0 as no bound; end the range at 1 or later")
+        self.animations = animations
+        # Seeded RNGs and normalized output bytes (see reproducible.py)
+        self.reproducible = reproducible
+
+    @property
+    def name(self):
+        return os.path.splitext(self.output)[0]
+
+    @property
+    def module(self):
+        """Module name manim uses for the media/videos subdirectory"""
+        return os.path.splitext(os.path.basename(self.scene_file))[0]
+
+    def cache_key(self, graph=None):
+        """Render cache key for this job"""
+        return render_key(self.scene_file, self.scene, self.output, self.quality, self.fmt, graph,
+                          self.reproducible)
+
+    def media_dir(self, media_root=MEDIA_ROOT):
+        """Isolated media directory for this job"""
+        return os.path.join(REPO_ROOT, media_root, self.name)
+
+    def __repr__(self):
+        return f"RenderJob({self.scene_file!r}, {self.scene!r}, {self.output!r})"
+
+
+class RenderResult:
+    """Outcome of a render job"""
+
+    def __init__(self, job, ok, seconds, path=None, error=None, log="", cached=False):
+        self.job = job
+        self.ok = ok
+        self.seconds = seconds
+        self.path = path
+        self.error = error
+        self.log = log
+        self.cached = cached
+
+    @property
+    def size(self):
+        if self.path and os.path.exists(self.path):
+            return os.path.getsize(self.path)
+        return 0
+
+
+def manim_command():
+    """Prefer the manim executable, fall back to python -m manim"""
+    if shutil.which("manim"):
+        return ["manim"]
+    return [sys.executable, "-m", "manim"]
+
+
+def quality_name(flag):
+    """manim config quality name for a -q flag letter, for in-process renders"""
+    from manim.constants import QUALITIES
+
+    for name, quality in QUALITIES.items():
+        if quality["flag"] == flag:
+            return name
+    raise ValueError(f"unknown quality flag {flag!r}")
+
+
+def find_output(log, media_dir, output):
+    """Locate the rendered file from manim's log, or by searching media_dir"""
+    match = None
+    for match in FILE_READY_RE.finditer(log):
+        pass
+    if match and os.path.exists(match.group(1)):
+        return match.group(1)
+
+    for root, _, files in os.walk(media_dir):
+        if output in files:
+            return os.path.join(root, output)
+    return None
+
+
+def job_tex_dir(media_dir):
+    """Where a job's MathTex/Tex SVGs are compiled"""
+    return os.path.join(media_dir, "Tex")
+
+
+def write_job_config(media_dir):
+    """The repository's manim.cfg with tex_dir pointed at the job's own tex dir"""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(os.path.join(REPO_ROOT, "manim.cfg"))
+    if not parser.has_section("CLI"):
+        parser.add_section("CLI")
+    parser["CLI"]["tex_dir"] = job_tex_dir(media_dir)
+    path = os.path.join(media_dir, "job.cfg")
+    with open(path, "w") as f:
+        parser.write(f)
+    return path
+
+
+def _render_with_daemon(job, media_dir, daemon, checkpoint=True):
+    """Render through a warm daemon. Returns (output path or None, error, log)"""
+    event = submit(job.scene_file, job.scene, job.output, job.quality, job.fmt,
+                   media_dir=media_dir, animations=job.animations, socket_path=daemon,
+                   tex_dir=job_tex_dir(media_dir),
+                   checkpoint=checkpoints.checkpoint_path(media_dir) if checkpoint else None,
+                   seed=reproducible.SEED if job.reproducible else None)
+    log_path = os.path.join(media_dir, "render.log")
+    log = open(log_path).read() if os.path.exists(log_path) else ""
+    if event["event"] != "done":
+        return None, event.get("error", "render daemon failed"), log + event.get("traceback", "")
+    return event["path"], None, log
+
+
+def render_job(job, output_dir=PREVIEW_DIR, media_root=MEDIA_ROOT, partials=None, daemon=None,
+               checkpoint=True, prewarm=True):
+    """
+    Render one job in a manim subprocess (or through the warm daemon at
+    socket path daemon) and copy the result to output_dir. With checkpoint,
+    a job that failed before resumes from its last completed animation.
+    With prewarm, the job starts from and adds to the shared text cache.
+    """
+    start = time.time()
+    media_dir = job.media_dir(media_root)
+    os.makedirs(media_dir, exist_ok=True)
+
+    if partials is not None:
+        partials.restore(media_dir, job.module, job.scene)
+    if prewarm:
+        prewarm_cache.seed(media_dir)
+    prewarm_cache.seed(media_dir, TEX_CACHE_DIR, os.path.basename(job_tex_dir(media_dir)))
+    if checkpoint:
+        checkpoints.prepare(media_dir)
+
+    if daemon is not None:
+        rendered, error, log = _render_with_daemon(job, media_dir, daemon, checkpoint)
+        if rendered is None:
+            if checkpoint and partials is not None:
+                # Keep finished animations even though the scene failed
+                partials.collect(media_dir, job.module, job.scene, only=checkpoints.completed_files(media_dir))
+            return RenderResult(job, False, time.time() - start, error=error, log=log)
+        if checkpoint:
+            checkpoints.clear(media_dir)
+        return _finish(job, rendered, output_dir, media_dir, partials, start, log, prewarm)
+
+    if checkpoint or job.reproducible:
+        runner = [sys.executable, "-m", "components.checkpoint"]
+        if checkpoint:
+            runner += ["--checkpoint", checkpoints.checkpoint_path(media_dir)]
+        if job.reproducible:
+            runner += ["--seed", str(reproducible.SEED)]
+        runner.append("--")
+    else:
+        runner = manim_command()
+
+    cmd = runner + [
+        f"-q{job.quality}",
+        f"--format={job.fmt}",
+        "-v", "INFO",
+        f"--media_dir={media_dir}",
+        f"--config_file={write_job_config(media_dir)}",
+        f"--output_file={job.output}",
+    ]
+    if job.animations is not None:
+        cmd += ["-n", ",".join(str(n) for n in job.animations if n is not None)]
+    cmd += [job.scene_file, job.scene]
+
+    # Wide console so rich doesn't wrap the "File ready at" line
+    env = reproducible.environment() if job.reproducible else dict(os.environ)
+    env["COLUMNS"] = "4096"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+
+    proc = subprocess.run(
+        cmd,
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    log = proc.stdout
+    with open(os.path.join(media_dir, "render.log"), "w") as f:
+        f.write(log)
+
+    if proc.returncode != 0:
+        if checkpoint and partials is not None:
+            # Keep finished animations even though the scene failed
+            partials.collect(media_dir, job.module, job.scene, only=checkpoints.completed_files(media_dir))
+        return RenderResult(job, False, time.time() - start,
+                            error=f"manim exited with {proc.returncode}", log=log)
+
+    rendered = find_output(log, media_dir, job.output)
+    if rendered is None:
+        return RenderResult(job, False, time.time() - start,
+                            error="render succeeded but output not found", log=log)
+
+    if checkpoint:
+        checkpoints.clear(media_dir)
+    return _finish(job, rendered, output_dir, media_dir, partials, start, log, prewarm)
+
+
+def _finish(job, rendered, output_dir, media_dir, partials, start, log, prewarm=True):
+    """Copy a rendered file into output_dir and save its partials"""
+    destination = os.path.join(REPO_ROOT, output_dir, job.output)
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    shutil.copyfile(rendered, destination)
+    if job.reproducible:
+        reproducible.normalize(destination)
+
+    if partials is not None:
+        partials.collect(media_dir, job.module, job.scene)
+    if prewarm:
+        prewarm_cache.collect(media_dir)
+    prewarm_cache.collect(media_dir, TEX_CACHE_DIR, os.path.basename(job_tex_dir(media_dir)))
+
+    return RenderResult(job, True, time.time() - start, path=destination, log=log)
+
+
+def render_all(jobs, workers=None, output_dir=PREVIEW_DIR, media_root=MEDIA_ROOT, cache=None,
+               partials=None, segments=None, daemon=None, checkpoint=True):
+    """
+    Render jobs across a process pool, yielding results as they finish.
+    With segments, scenes are rendered one at a time, each split into that
+    many parallel play() ranges (see segments.py). With daemon, workers
+    hand their jobs to the warm render daemon listening on that socket.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    # Serve unchanged scenes from the cache
+    pending = []
+    keys = {}
+    graph = DependencyGraph() if cache is not None else None
+    for job in jobs:
+        if cache is None:
+            pending.append(job)
+            continue
+        start = time.time()
+        keys[job.output] = job.cache_key(graph)
+        destination = os.path.join(REPO_ROOT, output_dir, job.output)
+        if cache.fetch(keys[job.output], destination):
+            yield RenderResult(job, True, time.time() - start, path=destination, cached=True)
+        else:
+            pending.append(job)
+
+    if not pending:
+        return
+
+    for result in _render_pending(pending, workers, output_dir, media_root, partials, segments, daemon,
+                                  checkpoint):
+        job = result.job
+        if cache is not None and result.ok:
+            cache.store(keys[job.output], result.path,
+                        scene_file=job.scene_file, scene=job.scene, output=job.output)
+        yield result
+
+    if partials is not None:
+        partials.evict()
+
+
+def _render_pending(jobs, workers, output_dir, media_root, partials, segments, daemon, checkpoint):
+    if segments:
+        from components.segments import render_segmented
+
+        for job in jobs:
+            try:
+                result = render_segmented(job.scene_file, job.scene, job.output, segments, job.quality,
+                                          workers, output_dir, media_root, partials=partials,
+                                          daemon=daemon, checkpoint=checkpoint,
+                                          reproducible=job.reproducible)
+                if result.ok and job.reproducible:
+                    reproducible.normalize(result.path)
+                yield result
+            except Exception as e:
+                yield RenderResult(job, False, 0.0, error=str(e))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(render_job, job, output_dir, media_root, partials, daemon, checkpoint): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                yield RenderResult(job, False, 0.0, error=str(e))
+
+
+def preview_jobs(quality="l", fmt="gif", previews=PREVIEWS, reproducible=False):
+    """Jobs for every preview in the manifest"""
+    return [
+        RenderJob(scene_file, scene, output, quality, fmt, reproducible=reproducible)
+        for scene_file, scene, output in previews
+    ]
+
+
+def print_summary(results):
+    """Print a per-scene summary table"""
+    print("")
+    print("=========================================")
+    print("Rendering Summary")
+    print("=========================================")
+    for result in sorted(results, key=lambda r: r.job.output):
+        status = "✓" if result.ok else "✗"
+        size_kb = result.size / 1024
+        detail = f"{size_kb:8.1f} KB" if result.ok else result.error
+        if result.cached:
+            detail += "  (cached)"
+        print(f"  {status} {result.job.scene:<34} {result.seconds:7.1f}s  {detail}")
+
+    rendered = sum(1 for r in results if r.ok and not r.cached)
+    cached = sum(1 for r in results if r.cached)
+    print("")
+    print(f"Rendered: {rendered}")
+    print(f"Cached: {cached}")
+    print(f"Failed: {len(results) - rendered - cached}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render preview scenes in parallel")
+    parser.add_argument("scene_file", nargs="?", help="Render a single scene file (relative to scenes/phase1)")
+    parser.add_argument("scene", nargs="?", help="Scene class to render from scene_file")
+    parser.add_argument("-m", "--module", nargs="+", default=[],
+                        help="Only render the previews for these module numbers (e.g. 01 04)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk",
+                        help="Manim quality flag (default: l)")
+    parser.add_argument("--format", dest="fmt", default="gif", help="Output format (default: gif)")
+    parser.add_argument("-o", "--output-dir", default=PREVIEW_DIR,
+                        help=f"Where finished files are copied (default: {PREVIEW_DIR})")
+    parser.add_argument("--media-root", default=MEDIA_ROOT,
+                        help=f"Parent of per-job media dirs (default: {MEDIA_ROOT})")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help=f"Render cache directory (default: {os.path.relpath(CACHE_DIR, REPO_ROOT)})")
+    parser.add_argument("--cache-max-mb", type=int, default=MAX_BYTES // (1024 * 1024),
+                        help="Evict cached renders beyond this size")
+    parser.add_argument("--no-cache", action="store_true", help="Always render, ignore the cache")
+    parser.add_argument("--partials-dir", default=PARTIALS_DIR,
+                        help="Persistent partial movie store")
+    parser.add_argument("--partials-max-mb", type=int, default=PARTIALS_MAX_BYTES // (1024 * 1024),
+                        help="Evict stored partial movies beyond this size")
+    parser.add_argument("--no-partials", action="store_true",
+                        help="Don't reuse partial movie files between builds")
+    parser.add_argument("--segments", type=int, default=None,
+                        help="Render scenes one at a time, each split into this many parallel segments")
+    parser.add_argument("--daemon", metavar="SOCKET", nargs="?", const=SOCKET_PATH,
+                        help="Render through a running warm render daemon (see daemon.py)")
+    parser.add_argument("--no-checkpoint", action="store_true",
+                        help="Don't checkpoint animations; a failed scene restarts from the beginning")
+    parser.add_argument("--reproducible", action="store_true",
+                        help="Seed scene randomness and strip output metadata so identical inputs give identical bytes")
+    parser.add_argument("--longest-first", action="store_true",
+                        help=f"Start the longest scenes first, using durations from {TIMELINE_PATH}")
+    parser.add_argument("--changed-since", metavar="REV",
+                        help="Only render scenes affected by changes since this git revision")
+    args = parser.parse_args(argv)
+
+    # Fail fast on stale scene names before paying manim's startup cost
+    problems = validate()
+    if problems:
+        for problem in problems:
+            print(f"✗ {problem}")
+        return 1
+
+    jobs = preview_jobs(args.quality, args.fmt, reproducible=args.reproducible)
+    if args.module:
+        jobs = [job for job in jobs if module_number(job.scene_file) in args.module]
+        if not jobs:
+            print(f"✗ No preview for module {' '.join(args.module)}. Use 01-{len(PREVIEWS):02d}")
+            return 1
+    if args.scene_file:
+        jobs = [job for job in jobs if os.path.basename(job.scene_file) == args.scene_file]
+        if args.scene:
+            jobs = [job for job in jobs if job.scene == args.scene]
+        if not jobs:
+            print(f"✗ No preview matches {args.scene_file} {args.scene or ''}".rstrip())
+            return 1
+
+    if args.changed_since:
+        affected = set(DependencyGraph().affected_scenes(
+            changed_since(args.changed_since),
+            sorted({job.scene_file for job in jobs}),
+        ))
+        jobs = [job for job in jobs if (job.scene_file, job.scene) in affected]
+        if not jobs:
+            print(f"✓ No previews affected by changes since {args.changed_since}")
+            return 0
+
+    if args.longest_first:
+        durations = load_durations()
+        if not durations:
+            print(f"! No timeline at {TIMELINE_PATH}; run: python -m components.timeline --write")
+        jobs.sort(key=lambda job: durations.get((job.scene_file, job.scene), 0.0), reverse=True)
+
+    if args.daemon and not is_running(args.daemon):
+        print(f"✗ No render daemon on {args.daemon}. Start one with: python -m components.daemon serve")
+        return 1
+
+    print("=========================================")
+    print(f"Rendering {len(jobs)} scenes with {args.workers or os.cpu_count()} workers")
+    print("=========================================")
+
+    cache = None
+    if not args.no_cache:
+        cache = RenderCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+    partials = None
+    if not args.no_partials:
+        partials = PartialMovieStore(args.partials_dir, max_bytes=args.partials_max_mb * 1024 * 1024)
+
+    if not args.no_checkpoint:
+        for job in jobs:
+            done = checkpoints.resume_point(job.media_dir(args.media_root))
+            if done:
+                print(f"  ↻ Resuming {job.scene} after {done} completed animations")
+
+    results = []
+    for result in render_all(jobs, args.workers, args.output_dir, args.media_root, cache, partials,
+                             args.segments, args.daemon, not args.no_checkpoint):
+        if result.cached:
+            print(f"  ✓ Cached: {result.job.output}")
+        elif result.ok:
+            print(f"  ✓ Created: {result.job.output} ({result.seconds:.1f}s)")
+        else:
+            print(f"  ✗ Render failed: {result.job.scene} - {result.error}")
+            for line in result.log.splitlines()[-15:]:
+                print(f"      {line}")
+        results.append(result)
+
+    print_summary(results)
+
+    # Publish the manifest next to the previews for the gallery site
+    manifest_path = os.path.join(REPO_ROOT, os.path.dirname(os.path.normpath(args.output_dir)), "manifest.json")
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(build_manifest(), f, indent=2)
+
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
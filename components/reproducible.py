@@ -0,0 +1,180 @@
+"""
+Byte-reproducible render output
+
+Re-rendering an unchanged scene should produce the same bytes, so that
+content hashes, the render cache and Netlify's per-file deploy diffing
+all see "no change". Three things get in the way:
+  - muxer metadata: ffmpeg/PyAV write an encoder version tag and
+    container timestamps into MP4s
+  - GIF comment and application extensions (other than the loop count)
+  - randomness in construct() or in manim, and Python's per-process
+    string hash seed, which changes set iteration order
+
+Reproducible renders (render.py --reproducible) run manim with
+PYTHONHASHSEED and SOURCE_DATE_EPOCH fixed, seed random and numpy before
+every scene, and pass the finished file through normalize().
+
+Usage:
+    python -m components.render --reproducible
+    python -m components.reproducible public/previews/phase1/*.gif   # normalize in place
+"""
+import argparse
+import contextlib
+import hashlib
+import os
+import random
+import shutil
+import subprocess
+import sys
+
+from components.hooks import wrap_method
+
+
+SEED = 0
+
+# Environment for the manim process
+ENVIRONMENT = {
+    "PYTHONHASHSEED": "0",
+    "SOURCE_DATE_EPOCH": "0",
+}
+
+# Application extensions GIF players need (loop count)
+GIF_KEEP_APPLICATIONS = (b"NETSCAPE2.0", b"ANIMEXTS1.0")
+
+
+def environment(env=None):
+    """env (default os.environ) with the reproducible settings applied"""
+    return dict(os.environ if env is None else env, **ENVIRONMENT)
+
+
+def seed(value=SEED):
+    """Seed every random number generator a scene might use"""
+    random.seed(value)
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    np.random.seed(value)
+
+
+@contextlib.contextmanager
+def seeded_scenes(value=SEED):
+    """Reseed right before each scene's setup()/construct() while active"""
+    from manim import Scene
+
+    def seeding(setup):
+        def wrapper(instance, *args, **kwargs):
+            seed(value)
+            return setup(instance, *args, **kwargs)
+        return wrapper
+
+    with wrap_method(Scene, "setup", seeding):
+        yield
+
+
+def _sub_blocks(data, i):
+    """Index just past the sub-block chain starting at i"""
+    while data[i]:
+        i += data[i] + 1
+    return i + 1
+
+
+def strip_gif(data):
+    """GIF bytes without comment or non-essential application extensions"""
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("not a GIF")
+    packed = data[10]
+    i = 13
+    if packed & 0x80:
+        i += 3 * 2 ** ((packed & 0x07) + 1)
+    out = bytearray(data[:i])
+
+    while i < len(data):
+        block = data[i]
+        if block == 0x3B:  # trailer
+            out.append(block)
+            break
+        if block == 0x21:  # extension: introducer, label, sub-blocks
+            label = data[i + 1]
+            end = _sub_blocks(data, i + 2)
+            identifier = bytes(data[i + 3:i + 14]) if data[i + 2] == 11 else b""
+            if label == 0xFE or (label == 0xFF and identifier not in GIF_KEEP_APPLICATIONS):
+                i = end
+                continue
+        elif block == 0x2C:  # image: descriptor, optional local table, LZW data
+            local = data[i + 9]
+            start = i + 10
+            if local & 0x80:
+                start += 3 * 2 ** ((local & 0x07) + 1)
+            end = _sub_blocks(data, start + 1)
+        else:
+            raise ValueError(f"unexpected GIF block 0x{block:02x} at {i}")
+        out += data[i:end]
+        i = end
+    return bytes(out)
+
+
+def normalize_gif(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    stripped = strip_gif(data)
+    if stripped != data:
+        _replace(path, stripped)
+
+
+def normalize_video(path):
+    """Remux without global metadata, encoder tags or timestamps (no re-encode)"""
+    root, ext = os.path.splitext(path)
+    tmp = f"{root}.normalize{ext}"
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", path,
+         "-map", "0", "-c", "copy", "-map_metadata", "-1", "-map_chapters", "-1",
+         "-fflags", "+bitexact", "-flags:v", "+bitexact", "-flags:a", "+bitexact", tmp],
+        check=True,
+    )
+    os.replace(tmp, path)
+
+
+def _replace(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def normalize(path):
+    """Make a rendered file's bytes depend only on its frames"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".gif":
+        normalize_gif(path)
+    elif ext in (".mp4", ".mov", ".webm"):
+        if not shutil.which("ffmpeg"):
+            raise RuntimeError("ffmpeg is required to normalize videos")
+        normalize_video(path)
+    return path
+
+
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Strip non-deterministic metadata from rendered files")
+    parser.add_argument("files", nargs="+", help="GIF or video files, normalized in place")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for path in args.files:
+        try:
+            normalize(path)
+        except (OSError, ValueError, RuntimeError, subprocess.CalledProcessError) as e:
+            failed += 1
+            print(f"  ✗ {path}: {e}")
+            continue
+        print(f"  ✓ {_sha256(path)[:16]}  {path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
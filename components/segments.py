@@ -0,0 +1,236 @@
+"""
+Segment-parallel rendering of a single long scene
+
+Splits one scene into disjoint ranges of play() calls and renders each
+range in its own worker process with manim's ``-n first,last`` flag. manim
+fast-forwards construct() up to the first animation of the range without
+rasterizing anything, so every segment starts from exactly the state the
+full render would have reached. The mp4 segments share encoder settings,
+so they are joined losslessly with ffmpeg's concat demuxer (stream copy);
+a gif is made from the joined mp4 at the end.
+
+Usage:
+    python -m components.segments scenes/phase1/14_encoding.py Bech32Format
+    python -m components.segments scenes/phase1/06_public_key_intro.py AliceAndBobScenario -s 6
+    python -m components.segments count scenes/phase1/14_encoding.py Bech32Format
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from components import checkpoint as checkpoints
+from components.dryrun import dry_run_scene
+from components.render import MEDIA_ROOT, RenderJob, RenderResult, render_job
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SEGMENTS_DIR = os.path.join('media', 'segments')
+
+
+def count_animations_in_process(scene_file, scene):
+    """Number of play()/wait() calls in a scene, by dry-running construct()"""
+    result = dry_run_scene(scene_file, scene)
+    if not result.ok:
+        raise RuntimeError(f"{result.error} ({result.location or scene_file})")
+    return result.plays
+
+
+def count_animations(scene_file, scene):
+    """count_animations_in_process in a subprocess, keeping manim out of this one"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-m", "components.segments", "count", "--json", scene_file, scene],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"counting animations failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])["animations"]
+
+
+def split_ranges(count, segments):
+    """
+    Split animations 0..count-1 into contiguous (first, last) ranges.
+    The final range is open-ended so the scene's closing frames are kept.
+
+    manim reads an upper bound of 0 as "no bound", so a closed range can't
+    end at animation 0: the first range always gets at least two.
+    """
+    segments = max(1, min(segments, count - 1))
+    size, extra = divmod(count, segments)
+    ranges = []
+    first = 0
+    for i in range(segments):
+        last = first + size + (1 if i < extra else 0) - 1
+        ranges.append((first, last if i < segments - 1 else None))
+        first = last + 1
+    return ranges
+
+
+def segment_jobs(scene_file, scene, ranges, quality="l", reproducible=False):
+    """One mp4 RenderJob per animation range"""
+    return [
+        RenderJob(scene_file, scene, f"{scene}_seg{i:02d}.mp4", quality, "mp4", animations=animations,
+                  reproducible=reproducible)
+        for i, animations in enumerate(ranges)
+    ]
+
+
+def concat(paths, destination):
+    """Join mp4 segments without re-encoding"""
+    list_file = destination + ".txt"
+    with open(list_file, "w") as f:
+        for path in paths:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_file, "-c", "copy", destination],
+            check=True,
+        )
+    finally:
+        os.remove(list_file)
+
+
+def to_gif(source, destination):
+    """Convert an mp4 to a looping gif with a per-file palette"""
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", source,
+         "-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse",
+         "-loop", "0", destination],
+        check=True,
+    )
+
+
+def render_segmented(scene_file, scene, output, segments=None, quality="l",
+                     workers=None, output_dir=".", media_root=MEDIA_ROOT, count=None,
+                     partials=None, daemon=None, checkpoint=True, reproducible=False):
+    """
+    Render scene in parallel segments and join them into output_dir/output.
+    partials, daemon and checkpoint apply to every segment as in render_job;
+    the partial store is restored and collected here, one segment at a time,
+    so workers never write its index concurrently.
+    """
+    start = time.time()
+    workers = workers or os.cpu_count() or 1
+    segments = segments or workers
+    fmt = os.path.splitext(output)[1].lstrip(".") or "mp4"
+    job = RenderJob(scene_file, scene, output, quality, fmt, reproducible=reproducible)
+
+    count = count if count is not None else count_animations(scene_file, scene)
+    if count == 0:
+        return RenderResult(job, False, time.time() - start, error="scene has no animations")
+
+    jobs = segment_jobs(scene_file, scene, split_ranges(count, segments), quality, reproducible)
+    segment_dir = os.path.join(REPO_ROOT, SEGMENTS_DIR, job.name)
+    os.makedirs(segment_dir, exist_ok=True)
+
+    if partials is not None:
+        for segment in jobs:
+            partials.restore(segment.media_dir(media_root), job.module, scene)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {
+            pool.submit(render_job, segment, segment_dir, media_root, None, daemon, checkpoint): segment
+            for segment in jobs
+        }
+        for future in as_completed(futures):
+            segment = futures[future]
+            try:
+                results[segment.output] = future.result()
+            except Exception as e:
+                results[segment.output] = RenderResult(segment, False, 0.0, error=str(e))
+
+    if partials is not None:
+        for segment in jobs:
+            media_dir = segment.media_dir(media_root)
+            if results[segment.output].ok:
+                partials.collect(media_dir, job.module, scene)
+            elif checkpoint:
+                # Keep finished animations even though the segment failed
+                partials.collect(media_dir, job.module, scene, only=checkpoints.completed_files(media_dir))
+
+    failed = [results[segment.output] for segment in jobs if not results[segment.output].ok]
+    if failed:
+        first = failed[0]
+        return RenderResult(job, False, time.time() - start, log=first.log,
+                            error=f"segment {first.job.output} failed: {first.error}")
+
+    destination = os.path.join(REPO_ROOT, output_dir, output)
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    joined = os.path.join(segment_dir, job.name + ".mp4")
+    concat([results[segment.output].path for segment in jobs], joined)
+    if fmt == "gif":
+        to_gif(joined, destination)
+    else:
+        shutil.copyfile(joined, destination)
+
+    return RenderResult(job, True, time.time() - start, path=destination)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["count"]:
+        parser = argparse.ArgumentParser(prog="components.segments count",
+                                         description="Count the animations in a scene")
+        parser.add_argument("scene_file")
+        parser.add_argument("scene")
+        parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+        args = parser.parse_args(argv[1:])
+        count = count_animations_in_process(args.scene_file, args.scene)
+        if args.json:
+            print(json.dumps({"animations": count}))
+        else:
+            print(f"{args.scene}: {count} animations")
+        return 0
+
+    parser = argparse.ArgumentParser(description="Render one scene as parallel segments")
+    parser.add_argument("scene_file", help="Scene file, relative to the repository root")
+    parser.add_argument("scene", help="Scene class to render")
+    parser.add_argument("-s", "--segments", type=int, default=None,
+                        help="Number of segments (default: worker count)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk",
+                        help="Manim quality flag (default: l)")
+    parser.add_argument("--output", default=None,
+                        help="Output file name (default: <Scene>.mp4)")
+    parser.add_argument("-o", "--output-dir", default=SEGMENTS_DIR,
+                        help=f"Where the joined file is written (default: {SEGMENTS_DIR})")
+    args = parser.parse_args(argv)
+
+    output = args.output or f"{args.scene}.mp4"
+    count = count_animations(args.scene_file, args.scene)
+    workers = args.workers or os.cpu_count() or 1
+    ranges = split_ranges(count, args.segments or workers)
+
+    print("=========================================")
+    print(f"Rendering {args.scene} ({count} animations) as {len(ranges)} segments")
+    print("=========================================")
+
+    result = render_segmented(args.scene_file, args.scene, output, len(ranges), args.quality,
+                              workers, args.output_dir, count=count)
+    if not result.ok:
+        print(f"  ✗ Render failed: {args.scene} - {result.error}")
+        for line in result.log.splitlines()[-15:]:
+            print(f"      {line}")
+        return 1
+
+    print(f"  ✓ Created: {os.path.relpath(result.path, REPO_ROOT)} "
+          f"({result.seconds:.1f}s, {result.size / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,9 @@ Digital signature visualization components for ECDSA, Schnorr, etc.
 from manim import *
 import hashlib
 
+from components.hexstring import hex_or_text
+from components.text import cached_text
+
 
 class KeyPair(VGroup):
     """Visual representation of a public/private key pair"""
@@ -45,7 +48,7 @@ class KeyPair(VGroup):
                 buff=0.2,
                 color=YELLOW
             )
-            self.arrow_label = Text("derives", color=YELLOW).scale(0.4)
+            self.arrow_label = cached_text("derives", color=YELLOW).scale(0.4)
             self.arrow_label.next_to(self.arrow, UP, buff=0.1)
             self.add(self.private_box, self.public_box, self.arrow, self.arrow_label)
         else:
@@ -54,17 +57,17 @@ class KeyPair(VGroup):
     def _create_key_box(self, key_text, label, color, lock_icon=True):
         """Create a box for a key"""
         # Label
-        label_text = Text(label, color=color).scale(0.5)
+        label_text = cached_text(label, color=color).scale(0.5)
 
         # Key value
         display_key = key_text if len(key_text) <= 12 else key_text[:9] + "..."
-        key_value = Text(display_key, color=WHITE).scale(0.4)
+        key_value = hex_or_text(display_key, color=WHITE).scale(0.4)
 
         # Lock icon (simple representation)
         if lock_icon:
-            lock = Text("🔒", color=color).scale(0.6)
+            lock = cached_text("🔒", color=color).scale(0.6)
         else:
-            lock = Text("🔓", color=color).scale(0.6)
+            lock = cached_text("🔓", color=color).scale(0.6)
 
         # Arrange
         content = VGroup(lock, label_text, key_value).arrange(DOWN, buff=0.2)
@@ -112,10 +115,10 @@ class SignatureProcess(VGroup):
         )
         self.sign_machine.move_to(ORIGIN)
 
-        self.sign_label = Text(algorithm, color=WHITE).scale(0.6)
+        self.sign_label = cached_text(algorithm, color=WHITE).scale(0.6)
         self.sign_label.move_to(self.sign_machine.get_center() + UP * 0.3)
 
-        self.sign_sublabel = Text("Sign", color=YELLOW).scale(0.5)
+        self.sign_sublabel = cached_text("Sign", color=YELLOW).scale(0.5)
         self.sign_sublabel.move_to(self.sign_machine.get_center() + DOWN * 0.3)
 
         # Signature output
@@ -159,8 +162,8 @@ class SignatureProcess(VGroup):
 
     def _create_box(self, text, label, color):
         """Create a labeled box"""
-        label_text = Text(label, color=color).scale(0.4)
-        value_text = Text(text if len(text) <= 10 else text[:7] + "...", color=WHITE).scale(0.4)
+        label_text = cached_text(label, color=color).scale(0.4)
+        value_text = hex_or_text(text if len(text) <= 10 else text[:7] + "...", color=WHITE).scale(0.4)
 
         content = VGroup(label_text, value_text).arrange(DOWN, buff=0.1)
 
@@ -211,10 +214,10 @@ class VerificationProcess(VGroup):
         )
         self.verify_machine.move_to(ORIGIN)
 
-        self.verify_label = Text(algorithm, color=WHITE).scale(0.6)
+        self.verify_label = cached_text(algorithm, color=WHITE).scale(0.6)
         self.verify_label.move_to(self.verify_machine.get_center() + UP * 0.5)
 
-        self.verify_sublabel = Text("Verify", color=YELLOW).scale(0.5)
+        self.verify_sublabel = cached_text("Verify", color=YELLOW).scale(0.5)
         self.verify_sublabel.move_to(self.verify_machine.get_center() + DOWN * 0.3)
 
         # Result
@@ -270,8 +273,8 @@ class VerificationProcess(VGroup):
 
     def _create_box(self, text, label, color):
         """Create a labeled box"""
-        label_text = Text(label, color=color).scale(0.4)
-        value_text = Text(text if len(text) <= 10 else text[:7] + "...", color=WHITE).scale(0.4)
+        label_text = cached_text(label, color=color).scale(0.4)
+        value_text = hex_or_text(text if len(text) <= 10 else text[:7] + "...", color=WHITE).scale(0.4)
 
         content = VGroup(label_text, value_text).arrange(DOWN, buff=0.1)
 
@@ -342,9 +345,9 @@ class PointAddition(VGroup):
         self.r_dot = Dot(axes.c2p(point_r[0], -point_r[1]), color=YELLOW)  # Reflected
 
         # Labels
-        self.p_label = Text("P", color=RED).scale(0.5).next_to(self.p_dot, UP)
-        self.q_label = Text("Q", color=GREEN).scale(0.5).next_to(self.q_dot, UP)
-        self.r_label = Text("R=P+Q", color=YELLOW).scale(0.5).next_to(self.r_dot, DOWN)
+        self.p_label = cached_text("P", color=RED).scale(0.5).next_to(self.p_dot, UP)
+        self.q_label = cached_text("Q", color=GREEN).scale(0.5).next_to(self.q_dot, UP)
+        self.r_label = cached_text("R=P+Q", color=YELLOW).scale(0.5).next_to(self.r_dot, DOWN)
 
         # Line through P and Q
         self.line = Line(
@@ -378,7 +381,7 @@ class PointAddition(VGroup):
 class SignatureExample(Scene):
     def construct(self):
         # Title
-        title = Text("Digital Signature Process").to_edge(UP)
+        title = cached_text("Digital Signature Process").to_edge(UP)
         self.play(Write(title))
 
         # Show signing
@@ -415,7 +418,7 @@ class SignatureExample(Scene):
 class EllipticCurveExample(Scene):
     def construct(self):
         # Title
-        title = Text("Elliptic Curve: y² = x³ + 7").to_edge(UP)
+        title = cached_text("Elliptic Curve: y² = x³ + 7").to_edge(UP)
         self.play(Write(title))
 
         # Create curve
@@ -3,6 +3,9 @@ Stack visualization component for Bitcoin Script animations
 """
 from manim import *
 
+from components import prototypes
+from components.text import cached_text
+
 
 class StackElement(VGroup):
     """A single element in a stack with text and surrounding box"""
@@ -16,10 +19,10 @@ class StackElement(VGroup):
             box_color = BLUE_E
 
         # Create text
-        self.text = Text(text, color=text_color).scale(0.7)
+        self.text = cached_text(text, color=text_color).scale(0.7)
 
         # Create box
-        self.box = SurroundingRectangle(
+        self.box = prototypes.surrounding_rectangle(
             self.text,
             color=WHITE,
             fill_color=box_color,
@@ -127,7 +130,7 @@ class AnimatedStack(Stack):
         3. Push result
         """
         # Create operation display
-        op = Text(operation_text, color=RED).scale(0.8)
+        op = cached_text(operation_text, color=RED).scale(0.8)
         op.move_to(self.position + RIGHT * 3)
 
         scene.play(Write(op))
@@ -147,7 +150,7 @@ class StackExample(Scene):
         stack = AnimatedStack()
 
         # Title
-        title = Text("Bitcoin Script Stack").to_edge(UP)
+        title = cached_text("Bitcoin Script Stack").to_edge(UP)
         self.play(Write(title))
 
         # Push some elements
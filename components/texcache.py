@@ -0,0 +1,213 @@
+"""
+Precompiled MathTex/Tex SVG cache for LaTeX-free rendering
+
+manim turns every Tex expression into <tex_dir>/<hash>.svg, where the
+hash covers the full LaTeX source (expression, environment and
+template), and skips LaTeX whenever that SVG already exists. manim.cfg
+points tex_dir at the committed tex_cache/ directory. Once the SVGs are
+compiled there, renders need no TeX installation and no per-expression
+compile time.
+
+Expressions are gathered two ways:
+  - statically: every MathTex/Tex call in scenes/ and components/ whose
+    arguments are string literals
+  - by dry-running every scene, which also catches computed expressions
+    such as EllipticCurve's f-string equation
+
+Only the .svg files are committed (.gitignore drops manim's .tex, .dvi
+and .log files). Render workers don't compile into tex_cache/ directly:
+each job gets its own tex dir seeded from it, and SVGs a job compiled are
+linked back atomically when it finishes (see render.py).
+
+Usage:
+    python -m components.texcache list            # expressions found in the source
+    python -m components.texcache compile --prune  # needs LaTeX; then commit tex_cache/
+    python -m components.texcache check           # fails if any scene would need LaTeX
+"""
+import argparse
+import ast
+import glob
+import os
+import sys
+
+from components.dryrun import dry_run_scene
+from components.hooks import wrap_method
+from components.manifest import discover, scene_files
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TEX_CACHE_DIR = os.path.join(REPO_ROOT, 'tex_cache')
+
+TEX_CLASSES = {"MathTex", "Tex", "SingleStringMathTex"}
+
+
+class MissingTexError(RuntimeError):
+    """An expression has no cached SVG and would need LaTeX"""
+
+
+def source_files():
+    """Python files under scenes/ and components/"""
+    return scene_files() + sorted(
+        os.path.relpath(path, REPO_ROOT) for path in glob.glob(os.path.join(REPO_ROOT, 'components', '*.py'))
+    )
+
+
+def _call_name(node):
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def collect(paths=None):
+    """
+    Tex calls in paths: dicts with file, line, class, args (None when any
+    argument isn't a string literal) and literal keyword arguments
+    """
+    found = []
+    for path in paths if paths is not None else source_files():
+        with open(os.path.join(REPO_ROOT, path), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or _call_name(node) not in TEX_CLASSES:
+                continue
+            literal = all(isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in node.args)
+            kwargs = {}
+            for keyword in node.keywords:
+                # Only options that change the LaTeX source; color etc. don't
+                if keyword.arg in ("tex_environment", "arg_separator", "substrings_to_isolate"):
+                    try:
+                        kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+                    except ValueError:
+                        literal = False
+            found.append({
+                "file": path,
+                "line": node.lineno,
+                "class": _call_name(node),
+                "args": [arg.value for arg in node.args] if literal else None,
+                "kwargs": kwargs,
+            })
+    return found
+
+
+def _tex_scenes():
+    """Scenes whose construct() may build Tex: everything under scenes/ and the component examples"""
+    return [(info.file, info.name) for info in discover(source_files())]
+
+
+def _build_literals(calls):
+    """Instantiate every literal Tex call. Returns [(call, error)] for failures"""
+    import manim
+
+    failures = []
+    for call in calls:
+        if call["args"] is None:
+            continue
+        try:
+            getattr(manim, call["class"])(*call["args"], **call["kwargs"])
+        except Exception as e:
+            failures.append((call, f"{type(e).__name__}: {e}"))
+    return failures
+
+
+def _record_svgs(used):
+    """Hook recording the SVG file behind every Tex mobject built"""
+    def recording(tex_to_svg_file):
+        def wrapper(*args, **kwargs):
+            path = tex_to_svg_file(*args, **kwargs)
+            used.add(os.path.basename(str(path)))
+            return path
+        return wrapper
+    return recording
+
+
+def compile_cache(cache_dir=TEX_CACHE_DIR, prune=False, log=print):
+    """Compile every expression into cache_dir. Returns the number of failures"""
+    from manim import tempconfig
+    from manim.mobject.text import tex_mobject
+
+    os.makedirs(cache_dir, exist_ok=True)
+    before = set(os.listdir(cache_dir))
+    used = set()
+    failed = 0
+
+    with tempconfig({"tex_dir": cache_dir}), \
+            wrap_method(tex_mobject, "tex_to_svg_file", _record_svgs(used)):
+        for call, error in _build_literals(collect()):
+            failed += 1
+            log(f"  ✗ {call['file']}:{call['line']} {call['class']}{tuple(call['args'])}: {error}")
+
+        for scene_file, scene in _tex_scenes():
+            result = dry_run_scene(scene_file, scene, settings={"tex_dir": cache_dir})
+            if not result.ok:
+                failed += 1
+                log(f"  ✗ {scene}: {result.error} ({result.location or scene_file})")
+
+    # Keep only SVGs; LaTeX's intermediate files aren't needed to render
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".svg") or (prune and name not in used):
+            os.remove(os.path.join(cache_dir, name))
+
+    added = sorted(used - before)
+    log(f"✓ {len(used)} expressions cached in {os.path.relpath(cache_dir, REPO_ROOT)}/, {len(added)} new")
+    if prune:
+        removed = sorted(name for name in before if name.endswith(".svg") and name not in used)
+        log(f"✓ Pruned {len(removed)} unused SVGs")
+    return failed
+
+
+def check_cache(cache_dir=TEX_CACHE_DIR, log=print):
+    """Dry-run every scene with LaTeX disabled. Returns the scenes that would need it"""
+    from manim.utils import tex_file_writing
+
+    def refuse(compile_tex):
+        def wrapper(tex_file, *args, **kwargs):
+            raise MissingTexError(f"{os.path.basename(str(tex_file))} is not in the tex cache")
+        return wrapper
+
+    hooks = [(tex_file_writing, "compile_tex", refuse)]
+    missing = []
+    for scene_file, scene in _tex_scenes():
+        result = dry_run_scene(scene_file, scene, hooks=hooks, settings={"tex_dir": cache_dir})
+        if result.error and result.error.startswith(MissingTexError.__name__):
+            missing.append((scene_file, scene))
+            log(f"  ✗ {scene}: {result.error} ({result.location or scene_file})")
+    return missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompile MathTex/Tex expressions to a committed SVG cache")
+    parser.add_argument("--cache-dir", default=TEX_CACHE_DIR, help="SVG cache directory (default: tex_cache/)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List Tex expressions found in scenes/ and components/")
+    compile_parser = commands.add_parser("compile", help="Compile every expression into the cache (needs LaTeX)")
+    compile_parser.add_argument("--prune", action="store_true", help="Remove SVGs no scene uses anymore")
+    commands.add_parser("check", help="Fail if any scene would still need LaTeX")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    cache_dir = os.path.abspath(args.cache_dir)
+
+    if args.command == "list":
+        calls = collect()
+        for call in calls:
+            expression = " ".join(call["args"]) if call["args"] is not None else "(computed, found by dry run)"
+            print(f"  {call['file']}:{call['line']:<5} {call['class']:<8} {expression}")
+        dynamic = sum(1 for call in calls if call["args"] is None)
+        print(f"\n{len(calls)} Tex calls, {dynamic} computed")
+        return 0
+
+    if args.command == "compile":
+        return 1 if compile_cache(cache_dir, args.prune) else 0
+
+    missing = check_cache(cache_dir)
+    if missing:
+        print(f"\n✗ {len(missing)} scenes need LaTeX; run: python -m components.texcache compile")
+        return 1
+    print("✓ Every scene renders without LaTeX")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Memoized Text factory
+
+Every Text() goes through Pango layout, an SVG file and SVG path parsing,
+even for a label like "SHA-256" that every HashMachine draws. cached_text
+builds each (string, font, weight, size) once, keeps it in an LRU cache,
+and hands out copies, so repeated labels cost a copy of their points.
+
+Color is applied to the copy: it doesn't change the glyph geometry, so
+"Private" in RED and in GREEN share one cache entry. Copies are
+independent; animating or recoloring one never touches the cached text.
+"""
+from manim import *
+import functools
+
+
+TEXT_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _layout(text, font, weight, font_size):
+    return Text(text, font=font, weight=weight, font_size=font_size)
+
+
+def cached_text(text, color=WHITE, font="", weight=NORMAL, font_size=DEFAULT_FONT_SIZE, **kwargs):
+    """Text(text, ...) laid out once per (text, font, weight, size) and copied after that"""
+    if kwargs:
+        # t2c, line_spacing, ... aren't part of the key; build these directly
+        return Text(text, color=color, font=font, weight=weight, font_size=font_size, **kwargs)
+    return _layout(text, font, weight, font_size).copy().set_color(color)
+
+
+def text_cache_info():
+    """Hits, misses and size of the cached_text LRU (functools CacheInfo)"""
+    return _layout.cache_info()
+
+
+def clear_text_cache():
+    _layout.cache_clear()
@@ -0,0 +1,182 @@
+"""
+Scene timelines and duration estimates without rendering
+
+Builds on the dry run (dryrun.py): every play() run_time, every wait() and
+every voiceover block is placed on a timeline, so a scene's length is known
+in seconds instead of after a full render. Voiceover length is estimated
+from the word count. Scenes are rolled up per module and checked against
+the ROADMAP target of 5-10 minutes of video per module.
+
+Scenes that build other scenes inside construct() (the *Complete scenes)
+render those parts with separate renderers, so nested plays are listed but
+not counted towards any duration.
+
+Usage:
+    python -m components.timeline                          # every scene, module table
+    python -m components.timeline scenes/phase1/04_merkle_trees_intro.py --events
+    python -m components.timeline --write                  # media/timeline.json for render --longest-first
+"""
+import argparse
+import json
+import os
+import sys
+
+from components.dryrun import dry_run_all
+from components.manifest import discover, module_number
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TIMELINE_PATH = os.path.join('media', 'timeline.json')
+
+# ROADMAP: "5-10 minutes of video content" per module
+MODULE_TARGET = (5 * 60, 10 * 60)
+
+
+def scene_timeline(result):
+    """Timeline dict for one DryRunResult"""
+    own = [event for event in result.events if not event["nested"]]
+    return {
+        "file": result.scene_file,
+        "scene": result.scene,
+        "module": module_number(result.scene_file),
+        "duration": round(result.run_time, 3),
+        "plays": sum(1 for event in own if event["kind"] == "play"),
+        "waits": sum(1 for event in own if event["kind"] == "wait"),
+        "wait_time": round(sum(event["run_time"] for event in own if event["kind"] == "wait"), 3),
+        "nested_plays": len(result.events) - len(own),
+        "voiceover": result.voiceovers,
+        "events": result.events,
+        "error": result.error,
+    }
+
+
+def module_timelines(scenes, target=MODULE_TARGET):
+    """Roll scene timelines up per module, flagging modules outside target"""
+    modules = {}
+    for timeline in scenes:
+        key = timeline["module"] or timeline["file"]
+        module = modules.setdefault(key, {
+            "module": key,
+            "file": timeline["file"],
+            "scenes": 0,
+            "duration": 0.0,
+            "errors": 0,
+        })
+        module["scenes"] += 1
+        module["duration"] = round(module["duration"] + timeline["duration"], 3)
+        module["errors"] += timeline["error"] is not None
+
+    for module in modules.values():
+        low, high = target
+        if module["duration"] > high:
+            module["status"] = "over"
+        elif module["duration"] < low:
+            module["status"] = "under"
+        else:
+            module["status"] = "ok"
+    return sorted(modules.values(), key=lambda m: m["module"])
+
+
+def build_timeline(paths=None, target=MODULE_TARGET):
+    """Dry-run scenes and return {"scenes": [...], "modules": [...]}"""
+    infos = discover(paths)
+    scenes = [scene_timeline(result) for result in dry_run_all((i.file, i.name) for i in infos)]
+    return {
+        "target": {"min": target[0], "max": target[1]},
+        "scenes": scenes,
+        "modules": module_timelines(scenes, target),
+    }
+
+
+def load_durations(path=TIMELINE_PATH):
+    """(file, scene) -> estimated seconds from a written timeline, or {} if missing"""
+    try:
+        with open(os.path.join(REPO_ROOT, path)) as f:
+            timeline = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {(scene["file"], scene["scene"]): scene["duration"] for scene in timeline["scenes"]}
+
+
+def _minutes(seconds):
+    return f"{int(seconds // 60)}:{seconds % 60:04.1f}"
+
+
+def print_timeline(timeline, events=False):
+    """Print per-scene and per-module tables"""
+    print("=========================================")
+    print("Scene Timeline")
+    print("=========================================")
+    for scene in timeline["scenes"]:
+        status = "✓" if scene["error"] is None else "✗"
+        detail = f"{scene['plays']:3d} plays {scene['waits']:3d} waits ({scene['wait_time']:.1f}s waiting)"
+        if scene["voiceover"]:
+            detail += f"  {len(scene['voiceover'])} voiceover"
+        if scene["nested_plays"]:
+            detail += f"  +{scene['nested_plays']} nested plays"
+        if scene["error"]:
+            detail += f"  {scene['error']}"
+        print(f"  {status} {scene['scene']:<34} {_minutes(scene['duration']):>8}  {detail}")
+
+        if events:
+            for event in scene["events"]:
+                if event["nested"]:
+                    continue
+                names = ", ".join(event["animations"]) or "-"
+                print(f"        {_minutes(event['start']):>8} +{event['run_time']:5.2f}s  "
+                      f"{event['kind']:<4} {names:<40} {event['line'] or ''}")
+            for block in scene["voiceover"]:
+                print(f"        {_minutes(block['start']):>8} voiceover ({block['speech']:.1f}s speech) "
+                      f"{block['text'][:50]!r}")
+
+    low, high = timeline["target"]["min"], timeline["target"]["max"]
+    print("")
+    print(f"Modules (target {_minutes(low)}-{_minutes(high)})")
+    for module in timeline["modules"]:
+        mark = {"ok": "✓", "under": "·", "over": "✗"}[module["status"]]
+        note = "" if module["status"] == "ok" else f"  {module['status']} target"
+        if module["errors"]:
+            note += f"  ({module['errors']} scenes failed, estimate incomplete)"
+        print(f"  {mark} {module['module']:<4} {_minutes(module['duration']):>8}  "
+              f"{module['scenes']:3d} scenes  {module['file']}{note}")
+
+    total = sum(scene["duration"] for scene in timeline["scenes"])
+    print("")
+    print(f"Total: {_minutes(total)} across {len(timeline['scenes'])} scenes")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate scene and module durations without rendering")
+    parser.add_argument("files", nargs="*", help="Scene files (default: every file under scenes/)")
+    parser.add_argument("--events", action="store_true", help="Show every play/wait per scene")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of tables")
+    parser.add_argument("--write", metavar="PATH", nargs="?", const=TIMELINE_PATH,
+                        help=f"Also write the timeline JSON (default: {TIMELINE_PATH})")
+    parser.add_argument("--min-minutes", type=float, default=MODULE_TARGET[0] / 60)
+    parser.add_argument("--max-minutes", type=float, default=MODULE_TARGET[1] / 60)
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if a module is over target")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    files = [os.path.relpath(os.path.abspath(path), REPO_ROOT) for path in args.files] or None
+    timeline = build_timeline(files, (args.min_minutes * 60, args.max_minutes * 60))
+
+    if args.write:
+        path = os.path.join(REPO_ROOT, args.write)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(timeline, f, indent=2)
+
+    if args.json:
+        print(json.dumps(timeline, indent=2))
+    else:
+        print_timeline(timeline, args.events)
+        if args.write:
+            print(f"✓ Wrote {args.write}")
+
+    over = [m for m in timeline["modules"] if m["status"] == "over"]
+    return 1 if args.strict and over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
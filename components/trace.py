@@ -0,0 +1,207 @@
+"""
+Per-play() timing instrumentation with Chrome trace export
+
+Renders a scene in-process with timing spans around scene setup and
+construct(), every play()/wait(), every frame drawn by Cairo, every frame
+handed to the encoder and the final combine step. The constructors of
+Text/MathTex/Tex and of the components classes are timed as well, so slow
+slides built from dozens of Text objects stand out.
+
+Spans are written as Chrome trace-event JSON; open the file in
+chrome://tracing or https://ui.perfetto.dev (both load it locally). A flat
+top-N summary is printed per scene.
+
+Usage:
+    python -m components.trace scenes/phase1/01_hash_intro.py HashSummary
+    python -m components.trace scenes/phase1/04_merkle_trees_intro.py BuildingMerkleTree --top 20
+    python -m components.trace scenes/phase1/14_encoding.py Bech32Format --dry-run
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from components.hooks import caller_location, wrap_method
+from components.manifest import load_scene_class
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TRACE_DIR = os.path.join('media', 'trace')
+
+
+class Tracer:
+    """Collects complete ("X") trace events"""
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+        self._origin = time.perf_counter_ns()
+
+    def _now(self):
+        return (time.perf_counter_ns() - self._origin) / 1000.0
+
+    @contextlib.contextmanager
+    def span(self, name, cat, **args):
+        start = self._now()
+        try:
+            yield
+        finally:
+            self.events.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start,
+                "dur": self._now() - start,
+                "pid": self.pid,
+                "tid": 1,
+                "args": args,
+            })
+
+    def timed(self, name, cat, describe=None):
+        """Wrapper factory for wrap_method: time every call of the method"""
+        def wrap(method):
+            def wrapper(*args, **kwargs):
+                with self.span(name, cat, **(describe(*args, **kwargs) if describe else {})):
+                    return method(*args, **kwargs)
+            return wrapper
+        return wrap
+
+    def to_json(self, metadata=None):
+        return {"traceEvents": self.events, "displayTimeUnit": "ms", "otherData": metadata or {}}
+
+
+def _describe_play(scene, *args, **kwargs):
+    # .animate builders only become animations inside play()
+    names = ["animate" if type(arg).__name__ == "_AnimationBuilder" else type(arg).__name__
+             for arg in args]
+    return {"animations": names, "index": scene.renderer.num_plays, "line": caller_location()}
+
+
+def _describe_text(mobject, text=None, *args, **kwargs):
+    return {"text": str(text)[:40]} if text is not None else {}
+
+
+def instrument(tracer, scene_class):
+    """Context manager installing every timing hook"""
+    import manim
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    import components
+
+    stack = contextlib.ExitStack()
+
+    def hook(cls, name, label, cat, describe=None):
+        if hasattr(cls, name):
+            stack.enter_context(wrap_method(cls, name, tracer.timed(label, cat, describe)))
+
+    hook(scene_class, "setup", "setup", "scene")
+    hook(scene_class, "construct", "construct", "scene")
+    hook(scene_class, "tear_down", "tear_down", "scene")
+    hook(manim.Scene, "play", "play", "play", _describe_play)
+    hook(CairoRenderer, "update_frame", "draw", "frame")
+    hook(SceneFileWriter, "write_frame", "encode", "frame")
+    hook(SceneFileWriter, "close_partial_movie_stream", "flush", "encode")
+    hook(SceneFileWriter, "combine_to_movie", "combine", "encode")
+
+    for cls in (manim.Text, manim.MarkupText, manim.MathTex, manim.Tex):
+        hook(cls, "__init__", cls.__name__, "mobject", _describe_text)
+    for name in components.__all__:
+        hook(getattr(components, name), "__init__", name, "component")
+    return stack
+
+
+def summarize(events, top=15):
+    """Rows of (cat, name, count, total_ms, mean_ms, max_ms), by total time"""
+    groups = {}
+    for event in events:
+        key = (event["cat"], event["name"])
+        count, total, longest = groups.get(key, (0, 0.0, 0.0))
+        groups[key] = (count + 1, total + event["dur"], max(longest, event["dur"]))
+    rows = [
+        (cat, name, count, total / 1000, total / count / 1000, longest / 1000)
+        for (cat, name), (count, total, longest) in groups.items()
+    ]
+    rows.sort(key=lambda row: row[3], reverse=True)
+    return rows[:top]
+
+
+def slowest_plays(events, top=10):
+    """The top slowest individual play()/wait() spans"""
+    plays = [event for event in events if event["cat"] == "play"]
+    return sorted(plays, key=lambda event: event["dur"], reverse=True)[:top]
+
+
+def trace_scene(scene_file, scene, quality="l", fmt="mp4", dry_run=False):
+    """Render scene in-process under instrumentation. Returns the Tracer"""
+    from manim import tempconfig
+
+    from components.render import quality_name
+
+    tracer = Tracer()
+    settings = {
+        "quality": quality_name(quality),
+        "format": fmt,
+        "media_dir": os.path.join(REPO_ROOT, TRACE_DIR, scene),
+        "output_file": f"{scene}.{fmt}",
+    }
+    if dry_run:
+        settings.update({"dry_run": True, "from_animation_number": sys.maxsize})
+
+    with tempconfig(settings):
+        with tracer.span("import", "scene", file=scene_file):
+            scene_class = load_scene_class(scene_file, scene)
+        with instrument(tracer, scene_class), tracer.span("render", "scene", scene=scene):
+            scene_class().render()
+    return tracer
+
+
+def print_summary(scene, tracer, top=15):
+    """Print the top-N table and slowest plays for one scene"""
+    total = max((e["ts"] + e["dur"] for e in tracer.events), default=0.0) / 1000
+    print("=========================================")
+    print(f"Trace Summary: {scene} ({total / 1000:.1f}s)")
+    print("=========================================")
+    print(f"  {'category':<10} {'span':<26} {'count':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9}")
+    for cat, name, count, total_ms, mean_ms, max_ms in summarize(tracer.events, top):
+        print(f"  {cat:<10} {name:<26} {count:6d} {total_ms:10.1f} {mean_ms:9.2f} {max_ms:9.1f}")
+
+    print("")
+    print("Slowest plays:")
+    for event in slowest_plays(tracer.events, min(top, 10)):
+        args = event["args"]
+        names = ", ".join(args.get("animations", [])) or "-"
+        print(f"  #{args.get('index', '?'):<4} {event['dur'] / 1000:9.1f} ms  {names:<40} {args.get('line', '')}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene with timing spans and export a Chrome trace")
+    parser.add_argument("scene_file", help="Scene file, relative to the repository root")
+    parser.add_argument("scenes", nargs="+", help="Scene classes to trace")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk",
+                        help="Manim quality flag (default: l)")
+    parser.add_argument("--format", dest="fmt", default="mp4", help="Output format (default: mp4)")
+    parser.add_argument("--dry-run", action="store_true", help="Skip rasterizing and encoding (construction only)")
+    parser.add_argument("--top", type=int, default=15, help="Rows in the summary table")
+    parser.add_argument("-o", "--output-dir", default=TRACE_DIR,
+                        help=f"Where <Scene>.trace.json is written (default: {TRACE_DIR})")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # manim reads manim.cfg from the working directory
+    for scene in args.scenes:
+        tracer = trace_scene(args.scene_file, scene, args.quality, args.fmt, args.dry_run)
+        path = os.path.join(REPO_ROOT, args.output_dir, f"{scene}.trace.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(tracer.to_json({"file": args.scene_file, "scene": scene,
+                                      "quality": args.quality, "dry_run": args.dry_run}), f)
+        print_summary(scene, tracer, args.top)
+        print(f"✓ Wrote {os.path.relpath(path, REPO_ROOT)}")
+        print("")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,10 @@ Tree visualization components (Merkle trees, syntax trees, etc.)
 from manim import *
 import hashlib
 
+from components import prototypes
+from components.hexstring import hex_or_text
+from components.text import cached_text
+
 
 class HashNode(VGroup):
     """A node in a hash tree (e.g., Merkle tree)"""
@@ -33,11 +37,11 @@ class HashNode(VGroup):
             else:
                 display_text = data[:6] + "..."
 
-        # Create text
-        self.text = Text(display_text, color=BLACK).scale(0.4)
+        # Create text (hashes come from the shared hex glyph atlas)
+        self.text = hex_or_text(display_text, color=BLACK).scale(0.4)
 
         # Create circle node
-        self.circle = Circle(
+        self.circle = prototypes.circle(
             radius=0.5,
             color=WHITE,
             fill_color=color,
@@ -198,7 +202,7 @@ class MerkleProofVisualization(VGroup):
         # Create highlights
         self.highlights = []
         for node in self.highlighted_nodes:
-            highlight = node.circle.copy()
+            highlight = prototypes.clone(node.circle)
             highlight.set_stroke(YELLOW, width=4)
             highlight.set_fill(opacity=0)
             self.highlights.append(highlight)
@@ -210,7 +214,7 @@ class MerkleProofVisualization(VGroup):
 class MerkleTreeExample(Scene):
     def construct(self):
         # Title
-        title = Text("Merkle Tree Example").scale(0.8).to_edge(UP)
+        title = cached_text("Merkle Tree Example").scale(0.8).to_edge(UP)
         self.play(Write(title))
 
         # Create tree with 4 transactions
@@ -238,7 +242,7 @@ class MerkleTreeExample(Scene):
 
         # Highlight root
         root = tree.get_root()
-        root_label = Text("Merkle Root", color=YELLOW).scale(0.5)
+        root_label = cached_text("Merkle Root", color=YELLOW).scale(0.5)
         root_label.next_to(root, RIGHT, buff=0.5)
         self.play(
             root.circle.animate.set_stroke(YELLOW, width=4),
@@ -252,7 +256,7 @@ class MerkleTreeExample(Scene):
 class MerkleProofExample(Scene):
     def construct(self):
         # Title
-        title = Text("Merkle Proof Example").scale(0.8).to_edge(UP)
+        title = cached_text("Merkle Proof Example").scale(0.8).to_edge(UP)
         self.play(Write(title))
 
         # Create tree
@@ -268,7 +272,7 @@ class MerkleProofExample(Scene):
         proof_viz = MerkleProofVisualization(tree, leaf_index=1)
 
         # Explain
-        explanation = Text(
+        explanation = cached_text(
             "Proving Tx2 is in the tree",
             color=YELLOW
         ).scale(0.5).to_edge(DOWN)
@@ -284,10 +288,11 @@ class MerkleProofExample(Scene):
         proof_path = tree.get_proof_path(1)
         proof_text = VGroup()
 
-        proof_label = Text("Proof Path:", color=GREEN).scale(0.4)
+        proof_label = cached_text("Proof Path:", color=GREEN).scale(0.4)
         proof_text.add(proof_label)
 
         for i, node in enumerate(proof_path):
+            # One-off strings: plain Text keeps them out of the layout cache
             step = Text(
                 f"{i+1}. {node.data[:8]}...",
                 color=WHITE
@@ -367,7 +372,7 @@ class BinaryTreeGeneric(VGroup):
 
     def _create_node(self, value, position):
         """Create a tree node"""
-        text = Text(str(value), color=BLACK).scale(0.5)
+        text = cached_text(str(value), color=BLACK).scale(0.5)
         circle = Circle(radius=0.4, color=WHITE, fill_color=BLUE, fill_opacity=0.8)
         circle.move_to(position)
         text.move_to(circle.get_center())
@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import HashMachine, DataBox, HashVisualization, AvalancheEffect
+from components import HashMachine, DataBox, HashVisualization, AvalancheEffect, HexString, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -368,15 +368,15 @@ class AvalancheEffectDemo(Scene):
         # Create visualizations
         viz1 = VGroup(
             Text(f'"{input1}"', color=BLUE).scale(0.5),
-            Text(hash1[:32], color=GREEN).scale(0.35),
-            Text(hash1[32:], color=GREEN).scale(0.35)
+            HexString(hash1[:32], color=GREEN).scale(0.35),
+            HexString(hash1[32:], color=GREEN).scale(0.35)
         ).arrange(DOWN, buff=0.2)
         viz1.shift(UP * 0.5)
 
         viz2 = VGroup(
             Text(f'"{input2}"', color=BLUE).scale(0.5),
-            Text(hash2[:32], color=YELLOW).scale(0.35),
-            Text(hash2[32:], color=YELLOW).scale(0.35)
+            HexString(hash2[:32], color=YELLOW).scale(0.35),
+            HexString(hash2[32:], color=YELLOW).scale(0.35)
         ).arrange(DOWN, buff=0.2)
         viz2.shift(DOWN * 1.5)
 
@@ -444,7 +444,10 @@ class HashSizeComparison(Scene):
             display = VGroup(
                 Text(label, color=BLUE).scale(0.4),
                 Text(f'Input: "{input_data[:30]}..."', color=GRAY).scale(0.3),
-                Text(f"Hash: {hash_value[:32]}...", color=GREEN).scale(0.35)
+                VGroup(
+                    Text("Hash:", color=GREEN).scale(0.35),
+                    HexString(f"{hash_value[:32]}...", color=GREEN).scale(0.35)
+                ).arrange(RIGHT, buff=0.15)
             ).arrange(DOWN, aligned_edge=LEFT, buff=0.1)
 
             hash_displays.add(display)
@@ -487,21 +490,18 @@ class HashSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Deterministic: Same input → Same output", color=BLUE).scale(0.6),
             Text("✓ One-Way: Easy to compute, hard to reverse", color=GREEN).scale(0.6),
             Text("✓ Collision-Resistant: Hard to find duplicates", color=YELLOW).scale(0.6),
             Text("✓ Avalanche Effect: Small change → Big difference", color=ORANGE).scale(0.6),
-            Text("✓ Fixed Size: Any input → Fixed output length", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Fixed Size: Any input → Fixed output length", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
         # Show summary points
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Use cases caption
         use_cases = Text(
@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import HashMachine, DataBox
+from components import HashMachine, DataBox, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -492,20 +492,17 @@ class SHA256Summary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Industry-standard cryptographic hash", color=BLUE).scale(0.6),
             Text("✓ Always produces 256-bit output", color=GREEN).scale(0.6),
             Text("✓ Uses 64 rounds of compression per block", color=YELLOW).scale(0.6),
             Text("✓ Relies on bitwise operations (fast & secure)", color=ORANGE).scale(0.6),
-            Text("✓ Foundation of Bitcoin's security", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Foundation of Bitcoin's security", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Use case
         use_case = Text(
@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import HashMachine, DataBox, HashVisualization
+from components import HashMachine, DataBox, HashVisualization, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -284,20 +284,17 @@ class RIPEMD160Summary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ 160-bit hash function (20 bytes)", color=BLUE).scale(0.6),
             Text("✓ Combined with SHA-256 in Hash160", color=GREEN).scale(0.6),
             Text("✓ Core component of Bitcoin addresses", color=YELLOW).scale(0.6),
             Text("✓ Provides shorter addresses than SHA-256 alone", color=ORANGE).scale(0.6),
-            Text("✓ Part of defense-in-depth security", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Part of defense-in-depth security", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Note
         note = Text(
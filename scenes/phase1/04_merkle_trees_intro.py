@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import HashNode, MerkleTree
+from components import HashNode, MerkleTree, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -351,20 +351,17 @@ class MerkleTreeSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Binary hash tree structure", color=BLUE).scale(0.6),
             Text("✓ Root hash represents all data", color=GREEN).scale(0.6),
             Text("✓ Efficient verification (logarithmic)", color=YELLOW).scale(0.6),
             Text("✓ Tamper-evident (changes propagate up)", color=ORANGE).scale(0.6),
-            Text("✓ Enables SPV wallets in Bitcoin", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Enables SPV wallets in Bitcoin", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next
         next_topic = Text(
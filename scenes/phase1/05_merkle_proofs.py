@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import HashNode, MerkleTree, MerkleProofVisualization
+from components import HashNode, MerkleTree, MerkleProofVisualization, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -405,20 +405,17 @@ class MerkleProofSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Prove transaction inclusion efficiently", color=BLUE).scale(0.6),
             Text("✓ Proof size: O(log n) hashes", color=GREEN).scale(0.6),
             Text("✓ No need to download entire block", color=YELLOW).scale(0.6),
             Text("✓ Cryptographically secure verification", color=ORANGE).scale(0.6),
-            Text("✓ Enables lightweight SPV wallets", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Enables lightweight SPV wallets", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import KeyPair, SignatureProcess, VerificationProcess
+from components import KeyPair, SignatureProcess, VerificationProcess, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -463,20 +463,17 @@ class PublicKeySummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Two keys: Public (share) and Private (secret)", color=BLUE).scale(0.6),
             Text("✓ Asymmetric: Different keys for different operations", color=GREEN).scale(0.6),
             Text("✓ One-way: Public key from private, not reverse", color=YELLOW).scale(0.6),
             Text("✓ Uses: Encryption, signatures, key exchange", color=ORANGE).scale(0.6),
-            Text("✓ Bitcoin: Uses for digital signatures", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Bitcoin: Uses for digital signatures", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
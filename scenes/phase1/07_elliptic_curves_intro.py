@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import EllipticCurve, PointAddition
+from components import EllipticCurve, PointAddition, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -518,20 +518,17 @@ class EllipticCurveSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Equation: y² = x³ + ax + b", color=BLUE).scale(0.6),
             Text("✓ Bitcoin uses: y² = x³ + 7 (secp256k1)", color=GREEN).scale(0.6),
             Text("✓ Symmetric around x-axis", color=YELLOW).scale(0.6),
             Text("✓ Point addition: Draw line, find intersection, reflect", color=ORANGE).scale(0.6),
-            Text("✓ Forms a mathematical group", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Forms a mathematical group", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
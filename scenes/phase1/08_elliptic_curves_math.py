@@ -9,7 +9,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import EllipticCurve
+from components import EllipticCurve, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -435,21 +435,18 @@ class EllipticCurveMathSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Scalar multiplication: k * P = P + P + ... (k times)", color=BLUE).scale(0.55),
             Text("✓ Generator point G: Known, agreed-upon starting point", color=GREEN).scale(0.55),
             Text("✓ Public key = Private key * G: P = d * G", color=YELLOW).scale(0.55),
             Text("✓ Easy: d → P (forward direction)", color=ORANGE).scale(0.55),
             Text("✓ Hard: P → d (discrete log problem)", color=RED).scale(0.55),
-            Text("✓ Double-and-add: Efficient computation", color=PURPLE).scale(0.55)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.35)
+            Text("✓ Double-and-add: Efficient computation", color=PURPLE).scale(0.55),
+            buff=0.35
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import SignatureProcess
+from components import SignatureProcess, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -443,21 +443,18 @@ class ECDSASigningSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Inputs: Message + Private key + Nonce", color=BLUE).scale(0.6),
             Text("✓ Output: Signature (r, s)", color=GREEN).scale(0.6),
             Text("✓ r: x-coordinate of k*G", color=YELLOW).scale(0.6),
             Text("✓ s: Combines message hash and private key", color=ORANGE).scale(0.6),
             Text("✓ Nonce MUST be unique and unpredictable", color=RED).scale(0.6),
-            Text("✓ RFC 6979: Deterministic nonce generation", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ RFC 6979: Deterministic nonce generation", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
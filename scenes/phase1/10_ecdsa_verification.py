@@ -9,7 +9,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import VerificationProcess
+from components import VerificationProcess, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -453,21 +453,18 @@ class ECDSAVerificationSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Inputs: Message + Signature (r, s) + Public key", color=BLUE).scale(0.6),
             Text("✓ Algorithm: Compute R' = u₁*G + u₂*P", color=GREEN).scale(0.6),
             Text("✓ Verify: r matches x-coordinate of R'", color=YELLOW).scale(0.6),
             Text("✓ Anyone can verify (public operation)", color=ORANGE).scale(0.6),
             Text("✓ Tampering → Invalid signature", color=RED).scale(0.6),
-            Text("✓ Security: Based on discrete log problem", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Security: Based on discrete log problem", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
@@ -9,7 +9,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import SignatureProcess, VerificationProcess
+from components import SignatureProcess, VerificationProcess, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -423,21 +423,18 @@ class SchnorrSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Simpler than ECDSA: s = k + e·d", color=BLUE).scale(0.6),
             Text("✓ Smaller: 64 bytes vs 71-73 bytes", color=GREEN).scale(0.6),
             Text("✓ Linear: Enables aggregation", color=YELLOW).scale(0.6),
             Text("✓ Verification: sG = R + eP", color=ORANGE).scale(0.6),
             Text("✓ Bitcoin: Added in Taproot (2021)", color=PURPLE).scale(0.6),
-            Text("✓ Provably secure", color=RED).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Provably secure", color=RED).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
@@ -9,7 +9,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import KeyPair
+from components import KeyPair, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -447,21 +447,18 @@ class SchnorrAggregationSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Linearity enables aggregation", color=BLUE).scale(0.6),
             Text("✓ MuSig: Secure multi-signature protocol", color=GREEN).scale(0.6),
             Text("✓ Key aggregation: Σ aᵢPᵢ", color=YELLOW).scale(0.6),
             Text("✓ Signature aggregation: Σ sᵢ", color=ORANGE).scale(0.6),
             Text("✓ Benefits: Efficiency, privacy, scalability", color=PURPLE).scale(0.6),
-            Text("✓ Batch verification: 2x faster", color=RED).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Batch verification: 2x faster", color=RED).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
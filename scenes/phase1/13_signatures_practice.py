@@ -9,7 +9,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import SignatureProcess, VerificationProcess
+from components import SignatureProcess, VerificationProcess, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -466,21 +466,18 @@ class SignaturesPracticeSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Nonce reuse is FATAL", color=RED).scale(0.6),
             Text("✓ Use RFC 6979 or secure RNG", color=GREEN).scale(0.6),
             Text("✓ Beware of side-channel attacks", color=ORANGE).scale(0.6),
             Text("✓ Use trusted, audited libraries", color=BLUE).scale(0.6),
             Text("✓ Constant-time implementations", color=YELLOW).scale(0.6),
-            Text("✓ Protect private keys at all costs", color=PURPLE).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Protect private keys at all costs", color=PURPLE).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Next topic
         next_topic = Text(
@@ -10,7 +10,7 @@ import sys
 # Add repository root to path for components module
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from components import DataBox
+from components import DataBox, BulletList
 
 # Configure background
 config.background_color = "#1e1e1e"
@@ -601,21 +601,18 @@ class EncodingSummary(Scene):
         self.wait(1)
 
         # Key points
-        summary = VGroup(
+        summary = BulletList(
             Text("✓ Base58: Removes ambiguous characters (0, O, I, l)", color=BLUE).scale(0.6),
             Text("✓ Base58Check: Adds version + checksum", color=GREEN).scale(0.6),
             Text("✓ Legacy addresses: Start with 1 (P2PKH) or 3 (P2SH)", color=YELLOW).scale(0.6),
             Text("✓ Bech32: Better error detection, lowercase", color=ORANGE).scale(0.6),
             Text("✓ SegWit addresses: Start with bc1", color=PURPLE).scale(0.6),
-            Text("✓ Bech32 is superior: Use for new addresses", color=GREEN).scale(0.6)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+            Text("✓ Bech32 is superior: Use for new addresses", color=GREEN).scale(0.6),
+            buff=0.4
+        )
         summary.move_to(ORIGIN)
 
-        for point in summary:
-            self.play(FadeIn(point), run_time=0.8)
-            self.wait(0.8)
-
-        self.wait(2)
+        summary.show(self, hold=2)
 
         # Congratulations
         congrats = Text(
@@ -81,8 +81,7 @@ echo -e "${BLUE}Checking for LaTeX...${NC}"
 if command -v latex &> /dev/null; then
     echo -e "${GREEN}  ✓ LaTeX found${NC}"
 else
-    echo -e "${YELLOW}  ! LaTeX not found - scenes with MathTex will be skipped${NC}"
-    echo -e "${YELLOW}    (Scenes 7-14 require LaTeX for math rendering)${NC}"
+    echo -e "${YELLOW}  ! LaTeX not found - formula scenes need a complete tex_cache/ (checked before rendering)${NC}"
 fi
 
 echo -e "${GREEN}✓ System dependencies ready${NC}"
@@ -181,66 +180,19 @@ echo ""
 PHASE1_DIR="scenes/phase1"
 PREVIEW_DIR="public/previews/phase1"
 
-# Function to render a single module's preview
-render_module() {
-    local module_file=$1
-    local scene_name=$2
-    local output_name=$3
-    local module_num=$4
-
-    echo -e "${BLUE}  [${module_num}] Rendering: ${scene_name}${NC}"
-
-    # Render as GIF with low quality for fast preview
-    # Capture both stdout and stderr to a temp file for debugging
-    RENDER_LOG="/tmp/render_${module_num}.log"
-
-    if $MANIM_CMD -ql --format=gif \
-        --output_file="${output_name}" \
-        "${PHASE1_DIR}/${module_file}" \
-        "${scene_name}" > "$RENDER_LOG" 2>&1; then
-
-        # Rendering succeeded
-        if find media -name "${output_name}" -type f -exec cp {} "${PREVIEW_DIR}/" \; 2>/dev/null; then
-            echo -e "${GREEN}    ✓ Created: ${output_name}${NC}"
-            rm -f "$RENDER_LOG"
-            return 0
-        else
-            echo -e "${RED}    ✗ Render succeeded but GIF not found: ${output_name}${NC}"
-            echo -e "${YELLOW}    Last 10 lines of output:${NC}"
-            tail -10 "$RENDER_LOG" | sed 's/^/      /'
-            rm -f "$RENDER_LOG"
-            return 1
-        fi
-    else
-        # Rendering failed
-        echo -e "${RED}    ✗ Failed to render: ${scene_name}${NC}"
-        echo -e "${YELLOW}    Error output (last 15 lines):${NC}"
-        tail -15 "$RENDER_LOG" | sed 's/^/      /'
-        rm -f "$RENDER_LOG"
-        return 1
-    fi
-}
-
-# Define all modules and their key scenes for preview
-# Format: "file.py|SceneName|output.gif"
-# NOTE: Scenes 7-14 use MathTex which requires LaTeX. For now, only rendering scenes 1-6.
-# TODO: Install LaTeX or convert MathTex to Text for full rendering
-MODULES=(
-    "01_hash_intro.py|HashIntroduction|01_hash_intro.gif|01"
-    "02_sha256.py|SHA256Overview|02_sha256.gif|02"
-    "03_ripemd160.py|Hash160Visualization|03_ripemd160.gif|03"
-    "04_merkle_trees_intro.py|BuildingMerkleTree|04_merkle_tree.gif|04"
-    "05_merkle_proofs.py|ProofExample|05_merkle_proof.gif|05"
-    "06_public_key_intro.py|PublicKeyIntroduction|06_public_key.gif|06"
-    # "07_elliptic_curves_intro.py|EllipticCurveIntroduction|07_elliptic_curve.gif|07"  # Requires LaTeX
-    # "08_elliptic_curves_math.py|VisualizingScalarMultiplication|08_ec_math.gif|08"  # Requires LaTeX
-    # "09_ecdsa_signing.py|SigningVisualization|09_ecdsa_sign.gif|09"  # Requires LaTeX
-    # "10_ecdsa_verification.py|VerificationVisualization|10_ecdsa_verify.gif|10"  # Requires LaTeX
-    # "11_schnorr_intro.py|ECDSAvsSchnorr|11_schnorr.gif|11"  # Requires LaTeX
-    # "12_schnorr_aggregation.py|MuSigProtocol|12_schnorr_agg.gif|12"  # Requires LaTeX
-    # "13_signatures_practice.py|NonceReuseDeepDive|13_sig_practice.gif|13"  # Requires LaTeX
-    # "14_encoding.py|Base58CheckEncoding|14_encoding.gif|14"  # Requires LaTeX
-)
+# Preview scenes are listed once, in PREVIEWS in components/manifest.py
+# NOTE: Scenes 7-14 use MathTex. Without LaTeX they render only if every
+# expression is precompiled in tex_cache/; otherwise only scenes 1-6 are rendered.
+if command -v latex &> /dev/null; then
+    RENDER_MODULES=""
+elif python3 -m components.texcache check > /dev/null 2>&1; then
+    echo -e "${GREEN}  ✓ Every MathTex expression is in tex_cache/${NC}"
+    RENDER_MODULES=""
+else
+    echo -e "${YELLOW}  ! tex_cache/ is incomplete - rendering scenes 1-6 only${NC}"
+    echo -e "${YELLOW}    (fill it with LaTeX installed: python -m components.texcache compile --prune)${NC}"
+    RENDER_MODULES="--module 01 02 03 04 05 06"
+fi
 
 # Check if phase1 scenes exist, if not skip rendering
 if [ ! -d "$PHASE1_DIR" ]; then
@@ -254,33 +206,9 @@ else
     echo -e "${BLUE}  Found ${FILE_COUNT} Python files in ${PHASE1_DIR}${NC}"
     echo ""
 
-    # Render all modules
-    RENDERED=0
-    FAILED=0
-    SKIPPED=0
-
-    for module_info in "${MODULES[@]}"; do
-        IFS='|' read -r file scene output num <<< "$module_info"
-
-        # Check if the file exists before trying to render
-        if [ -f "${PHASE1_DIR}/${file}" ]; then
-            render_module "$file" "$scene" "$output" "$num"
-            if [ $? -eq 0 ]; then
-                RENDERED=$((RENDERED + 1))
-            else
-                FAILED=$((FAILED + 1))
-            fi
-        else
-            echo -e "${YELLOW}  [$num/14] Skipping: ${file} (not found)${NC}"
-            SKIPPED=$((SKIPPED + 1))
-        fi
-    done
-
-    echo ""
-    echo -e "${BLUE}Rendering Summary:${NC}"
-    echo -e "  ${GREEN}Rendered: ${RENDERED}${NC}"
-    echo -e "  ${RED}Failed: ${FAILED}${NC}"
-    echo -e "  ${YELLOW}Skipped: ${SKIPPED}${NC}"
+    # Render all modules in parallel; a failed scene doesn't stop the deploy
+    python3 -m components.render --output-dir "$PREVIEW_DIR" $RENDER_MODULES || \
+        echo -e "${YELLOW}  ! Some scenes failed to render${NC}"
 fi
 
 echo ""